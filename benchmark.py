@@ -0,0 +1,209 @@
+"""Benchmarks of the tide report stages on synthetic station files."""
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime
+
+import yaml
+
+import sea_level_report4 as report
+from slim_csv_generator import generate_station_files
+
+# One measurement: stage, number of station-years, wall and CPU seconds, peak memory (MB)
+# and a note (e.g. why a backend was skipped), None when the stage ran cleanly
+BenchmarkResult = namedtuple('BenchmarkResult', ['stage', 'station_years', 'wall', 'cpu', 'peak_rss', 'note'])
+
+# Station-years per run, and the stages timed at each size
+BENCHMARK_SIZES = (1, 10, 100, 1000)
+BENCHMARK_STAGES = ('parse', 'group', 'daylight', 'docx', 'pdf-native', 'pdf-word', 'pdf-libreoffice')
+
+
+def time_stage(stage, count, function):
+    """
+    Run one stage over every station and time it.
+
+    Args:
+        stage (str): Stage name (see BENCHMARK_STAGES).
+        count (int): Number of station-years.
+        function (callable): Runs the stage, may return a note.
+
+    Returns:
+        BenchmarkResult: The measurement; failures are noted, not raised.
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        note = function()
+    except Exception as e:
+        note = f"failed: {e}"
+    return BenchmarkResult(stage, count, time.perf_counter() - wall, time.process_time() - cpu, report.peak_rss(), note)
+
+
+def convert_all(converter, documents):
+    """Convert (docx, pdf) pairs on a converter, returns a note of the failures or None."""
+    with converter:
+        futures = [converter.submit(docx_path, pdf_path) for docx_path, pdf_path in documents]
+        errors = []
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(str(e))
+    return f"{len(errors)} failed, first: {errors[0]}" if errors else None
+
+
+def run_size(paths, output_folder, logo_path, backends, engine='template'):
+    """
+    Time every stage on a set of station files.
+
+    Args:
+        paths (list): Station files, one station-year each.
+        output_folder (str): Folder for the Word and PDF files.
+        logo_path (str): The logo.
+        backends (list): PDF backends to time ('native', 'word', 'libreoffice').
+        engine (str): Document engine ('template' or 'classic').
+
+    Returns:
+        list: BenchmarkResult entries, in stage order.
+    """
+    count = len(paths)
+    sources = [report.StationSource(os.path.splitext(os.path.basename(path))[0], path, None) for path in paths]
+    tables, layouts, documents = [], [], []
+    os.makedirs(output_folder, exist_ok=True)
+
+    def parse():
+        tables.extend(report.read_station(source) for source in sources)
+
+    def group():
+        for table in tables:
+            for _ in report.iter_month_pages(table):
+                pass
+
+    def daylight():
+        for table in tables:
+            profile = report.station_profile(report.DEFAULT_PROFILES, table.file_info)
+            layouts.append((profile, report.station_daylight_flags(table, profile)))
+
+    def docx():
+        save = report.save_to_word if engine == 'classic' else report.save_to_word_template
+        for source, table, (profile, flags) in zip(sources, tables, layouts):
+            docx_path = os.path.join(output_folder, source.name + '.docx')
+            save(table, report.iter_month_pages(table), docx_path, logo_path, flags, profile=profile)
+            documents.append((docx_path, os.path.join(output_folder, source.name + '.pdf')))
+
+    def pdf_native():
+        for source, table, (profile, flags) in zip(sources, tables, layouts):
+            report.save_to_pdf(table, report.iter_month_pages(table), os.path.join(output_folder, source.name + '.pdf'),
+                               logo_path, flags, profile=profile)
+
+    results = [time_stage('parse', count, parse), time_stage('group', count, group),
+               time_stage('daylight', count, daylight), time_stage('docx', count, docx)]
+    if 'native' in backends:
+        results.append(time_stage('pdf-native', count, pdf_native))
+    if 'word' in backends:
+        results.append(time_stage('pdf-word', count, lambda: convert_all(report.WordConverter(), documents)))
+    if 'libreoffice' in backends:
+        results.append(time_stage('pdf-libreoffice', count,
+                                  lambda: convert_all(report.LibreOfficePool(os.cpu_count() or 1), documents)))
+    return results
+
+
+def result_record(result, when, engine):
+    """Return a benchmark result as a JSON-ready dict (the JSON lines format)."""
+    return {'time': when, 'engine': engine, 'stage': result.stage, 'station_years': result.station_years,
+            'wall_s': round(result.wall, 4), 'cpu_s': round(result.cpu, 4),
+            'ms_per_station_year': round(1000 * result.wall / result.station_years, 2),
+            'peak_rss_mb': None if result.peak_rss is None else round(result.peak_rss, 1), 'note': result.note,
+            'generator_version': report.GENERATOR_VERSION, 'python': platform.python_version(),
+            'platform': platform.platform()}
+
+
+def load_baseline(path):
+    """Load earlier benchmark records (JSON lines), keyed by engine, stage and station-years; the last record wins."""
+    baseline = {}
+    with open(path, 'r') as baseline_file:
+        for line in baseline_file:
+            if line.strip():
+                record = json.loads(line)
+                baseline[(record.get('engine'), record['stage'], record['station_years'])] = record
+    return baseline
+
+
+def print_results(results, engine, baseline=None):
+    """Print the results as a table, with the change against a baseline when one is given."""
+    print(f"{'Stage':<16} {'Station-years':>13} {'Wall':>9} {'CPU':>9} {'ms/st-yr':>9} {'Peak RSS':>9}"
+          f"{' vs baseline':>13}  Note")
+    for result in results:
+        peak = f"{result.peak_rss:.0f} MB" if result.peak_rss is not None else '-'
+        change = ''
+        base = (baseline or {}).get((engine, result.stage, result.station_years))
+        if base and base['wall_s']:
+            change = f"{100 * (result.wall / base['wall_s'] - 1):+.0f}%"
+        print(f"{result.stage:<16} {result.station_years:>13} {result.wall:>8.3f}s {result.cpu:>8.3f}s "
+              f"{1000 * result.wall / result.station_years:>9.1f} {peak:>9} {change:>13}  {result.note or ''}")
+
+
+def configured_logo():
+    """Return linz_logo_path from config.yaml in the current folder, None when there is none."""
+    try:
+        with open('config.yaml', 'r') as config_file:
+            return (yaml.safe_load(config_file) or {}).get('linz_logo_path')
+    except OSError:
+        return None
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="Time the tide report stages on synthetic station-years.")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in BENCHMARK_SIZES),
+                        help="station-years per run, comma separated (default 1,10,100,1000)")
+    parser.add_argument('--backends', default='native',
+                        help="PDF backends to time, comma separated: native, word, libreoffice (default native)")
+    parser.add_argument('--engine', choices=report.RENDER_ENGINES, default='template', help="document engine")
+    parser.add_argument('--logo', default=None, help="logo file (default linz_logo_path in config.yaml)")
+    parser.add_argument('--data', default=None, metavar='FOLDER',
+                        help="keep the synthetic station files and outputs in FOLDER (default: a temporary folder)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed of the synthetic data (default 0)")
+    parser.add_argument('--output', default=None, metavar='FILE', help="append the results to FILE (JSON lines)")
+    parser.add_argument('--compare', default=None, metavar='FILE', help="show the change against earlier results in FILE")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    backends = [backend.strip() for backend in args.backends.split(',') if backend.strip()]
+    for backend in backends:
+        if backend not in report.PDF_BACKENDS:
+            parser.error(f"unknown PDF backend '{backend}', use: {', '.join(report.PDF_BACKENDS)}")
+    logo_path = args.logo or configured_logo()
+    if not logo_path or not os.path.exists(logo_path):
+        parser.error("a logo file is needed: use --logo or set linz_logo_path in config.yaml")
+    baseline = load_baseline(args.compare) if args.compare else None
+
+    folder = args.data or tempfile.mkdtemp(prefix='tide_benchmark_')
+    try:
+        paths = generate_station_files(os.path.join(folder, 'csv'), max(sizes), seed=args.seed)
+        report.build_dst_table()
+        # Import the document and PDF stacks up front, so the first size is not charged for them
+        report.import_deferred('docx')
+        report.import_deferred('pdf')
+        results = []
+        for size in sizes:
+            results += run_size(paths[:size], os.path.join(folder, f'out_{size}'), logo_path, backends, args.engine)
+    finally:
+        if args.data is None:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    print(f"Python {platform.python_version()} on {platform.platform()}, engine {args.engine}")
+    print_results(results, args.engine, baseline)
+    if args.output:
+        when = datetime.now().isoformat(timespec='seconds')
+        with open(args.output, 'a') as output_file:
+            for result in results:
+                output_file.write(json.dumps(result_record(result, when, args.engine)) + '\n')
+
+
+if __name__ == "__main__":
+    main()
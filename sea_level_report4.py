@@ -1,189 +1,1200 @@
 """Main module."""
+import time
+
+# Start of the module's own imports, for the startup time in IMPORT_TIMES
+IMPORT_STARTED = time.perf_counter(), time.process_time()
+
+import abc
+import argparse
 import csv
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+import ctypes
+import hashlib
+import importlib
+import io
+import json
+import math
+import multiprocessing
+import pathlib
+import queue
+import select
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 import calendar
+import codecs
+import copy
+from array import array
 from datetime import datetime, timedelta
-from docx2pdf import convert
 import os
-import yaml
-from docx.shared import Mm
-from tkinter import Tk, simpledialog
-from tkinter import messagebox
-import unicodedata
 
-def read_csv(file_path):
+# Maximum number of tide events (time/value pairs) on one row of a station file
+MAX_EVENTS = 5
+
+# Weekday abbreviations used in the second column of the SLIM output
+WEEKDAY_CODES = ('Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su')
+
+# Sentinel stored in the time column for an empty event slot
+MISSING_TIME = -1
+
+
+class TideTable:
+    """
+    Columnar view of one station file, parsed once into compact typed arrays.
+
+    Rows are stored column by column. Events are stored with a fixed stride of
+    MAX_EVENTS slots per row, so event ``k`` of row ``i`` lives at index
+    ``i * MAX_EVENTS + k`` of the event columns.
+
+    Attributes:
+        file_info (list): The first line of the file (station id, name, latitude, longitude).
+        day (array): Day of month per row (int8).
+        weekday (array): Index into WEEKDAY_CODES per row (int8).
+        month (array): Month per row (int8).
+        year (array): Year per row (int16).
+        width (array): Number of event slots present on the row, i.e. 3, 4 or 5 (int8).
+        times (array): Event times as minute of day, MISSING_TIME for empty slots (int16).
+        values (array): Event heights as float32, NaN for direction codes and empty slots.
+        codes (array): Index into ``labels`` for non-numeric values, -1 otherwise (int16).
+        missing (bytearray): 1 where the event slot is empty, 0 otherwise.
+        labels (list): Distinct non-numeric values (e.g. stream directions).
+        decimals (int): Number of decimals used to print heights.
+    """
+
+    def __init__(self, file_info, day, weekday, month, year, width, times, values, codes, missing, labels, decimals):
+        self.file_info = file_info
+        self.day = day
+        self.weekday = weekday
+        self.month = month
+        self.year = year
+        self.width = width
+        self.times = times
+        self.values = values
+        self.codes = codes
+        self.missing = missing
+        self.labels = labels
+        self.decimals = decimals
+
+    def __len__(self):
+        return len(self.day)
+
+    def event_minutes(self, row):
+        """Return the minute-of-day of each event slot on a row (MISSING_TIME for empty slots)."""
+        start = row * MAX_EVENTS
+        return self.times[start:start + self.width[row]].tolist()
+
+    def time_text(self, row):
+        """Return the event times of a row as 'HH:MM' strings ('' for empty slots)."""
+        return [format_minutes(minutes) for minutes in self.event_minutes(row)]
+
+    def value_text(self, row):
+        """Return the event heights or directions of a row as strings ('' for empty slots)."""
+        start = row * MAX_EVENTS
+        texts = []
+        for index in range(start, start + self.width[row]):
+            if self.missing[index]:
+                texts.append('')
+            elif self.codes[index] >= 0:
+                texts.append(self.labels[self.codes[index]])
+            else:
+                texts.append(f"{self.values[index]:.{self.decimals}f}")
+        return texts
+
+
+def parse_minutes(time_text):
+    """
+    Convert an 'HH:MM' time string into minutes after midnight.
+
+    Args:
+        time_text (str): The time string.
+
+    Returns:
+        int: Minutes after midnight.
+
+    Raises:
+        ValueError: If the string is not a valid time of day.
+    """
+    hour, separator, minute = time_text.partition(':')
+    if not separator or not hour.isdigit() or not minute.isdigit():
+        raise ValueError(f"Invalid time value: {time_text}")
+    hour, minute = int(hour), int(minute)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Invalid time value: {time_text}")
+    return hour * 60 + minute
+
+
+def format_minutes(minutes):
+    """Convert minutes after midnight back to an 'HH:MM' string ('' for MISSING_TIME)."""
+    if minutes == MISSING_TIME:
+        return ''
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_tide_table(file_info, rows):
+    """
+    Parse the data rows of a station file into a TideTable.
+
+    Each row is validated and converted once; downstream code reads the typed
+    columns instead of re-parsing strings.
+
+    Args:
+        file_info (list): The first line of the file.
+        rows (iterable): Data rows as lists of strings (date, day, month, year, t1, d1, ...).
+
+    Returns:
+        TideTable: The parsed station data.
+
+    Raises:
+        ValueError: If a row is malformed or the file contains no data rows.
+    """
+    day = array('b')
+    weekday = array('b')
+    month = array('b')
+    year = array('h')
+    width = array('b')
+    times = array('h')
+    values = array('f')
+    codes = array('h')
+    missing = bytearray()
+    labels = []
+    label_codes = {}
+    decimals = None
+    nan = float('nan')
+
+    for line_number, row in enumerate(rows, start=4):
+        if not row:
+            continue
+        if len(row) < 4:
+            raise ValueError(f"Line {line_number}: each row must have at least 4 columns (date, day, month, year).")
+        events = (len(row) - 3) // 2
+        if events > MAX_EVENTS:
+            raise ValueError(f"Line {line_number}: more than {MAX_EVENTS} tide events on one row.")
+        try:
+            row_day, row_month, row_year = int(row[0]), int(row[2]), int(row[3])
+            row_weekday = WEEKDAY_CODES.index(row[1].strip())
+        except ValueError:
+            raise ValueError(f"Line {line_number}: invalid date columns {row[:4]}")
+        if not (1 <= row_month <= 12):
+            raise ValueError(f"Invalid month value: {row[2]}")
+        if not (1 <= row_day <= calendar.monthrange(row_year, row_month)[1]):
+            raise ValueError(f"Line {line_number}: invalid day value: {row[0]}")
+
+        day.append(row_day)
+        weekday.append(row_weekday)
+        month.append(row_month)
+        year.append(row_year)
+        width.append(events)
+
+        for slot in range(MAX_EVENTS):
+            time_text = row[4 + 2 * slot].strip() if slot < events else ''
+            value_text = row[5 + 2 * slot].strip() if slot < events and 5 + 2 * slot < len(row) else ''
+            if not time_text:
+                times.append(MISSING_TIME)
+                values.append(nan)
+                codes.append(-1)
+                missing.append(1)
+                continue
+            times.append(parse_minutes(time_text))
+            missing.append(0)
+
+            # Heights are stored as numbers as long as they print back exactly as read,
+            # anything else (stream directions) is stored as a label code
+            try:
+                number = float(value_text)
+            except ValueError:
+                number = None
+            if number is not None and decimals is None:
+                decimals = len(value_text.partition('.')[2])
+            if number is not None and f"{number:.{decimals}f}" == value_text:
+                values.append(number)
+                codes.append(-1)
+            else:
+                if value_text not in label_codes:
+                    label_codes[value_text] = len(labels)
+                    labels.append(value_text)
+                values.append(nan)
+                codes.append(label_codes[value_text])
+
+    if not day:
+        raise ValueError("CSV file contains no data rows.")
+
+    return TideTable(file_info, day, weekday, month, year, width, times, values, codes, missing,
+                     labels, decimals if decimals is not None else 1)
+
+
+# Text encoding of the SLIM station files (the coordinates have a degree sign), 'encoding' in config.yaml
+STATION_ENCODING = 'cp1252'
+
+# A station file to process: output base name, file path and, for zip archives, the member name
+StationSource = namedtuple('StationSource', ['name', 'path', 'member'])
+
+
+def station_file_type(name):
+    """Return 'csv' or 'zip' for a station file or archive name (in any letter case), None for other files."""
+    extension = os.path.splitext(name)[1].lower()
+    return extension[1:] if extension in ('.csv', '.zip') else None
+
+
+def find_station_sources(folder_path):
+    """
+    List the station CSV files to process.
+
+    folder_path may be a folder, a single .csv file or a .zip archive. Folders are
+    searched for loose .csv files and for .zip archives, whose .csv members are
+    read in place without extracting them. Extensions match in any letter case.
+
+    Args:
+        folder_path (str): Folder, CSV file or zip archive path.
+
+    Returns:
+        list: StationSource entries in a stable order.
+    """
+    if os.path.isfile(folder_path):
+        entries = [folder_path]
+    else:
+        entries = [os.path.join(folder_path, file) for file in sorted(os.listdir(folder_path))]
+
+    sources = []
+    for entry in entries:
+        if station_file_type(entry) == 'csv':
+            sources.append(StationSource(os.path.splitext(os.path.basename(entry))[0], entry, None))
+        elif station_file_type(entry) == 'zip':
+            try:
+                with zipfile.ZipFile(entry) as archive:
+                    for member in sorted(archive.namelist()):
+                        if station_file_type(member) == 'csv' and not member.startswith('__MACOSX/'):
+                            name = os.path.splitext(os.path.basename(member))[0]
+                            sources.append(StationSource(name, entry, member))
+            except zipfile.BadZipFile as e:
+                print(f"Error: Unable to read zip archive '{entry}': {e}")
+
+    # Keep output names unique and deterministic when the same file name appears
+    # more than once (e.g. in two archives): later copies get a numeric suffix
+    used_names = {}
+    for index, source in enumerate(sources):
+        count = used_names.get(source.name.lower(), 0) + 1
+        used_names[source.name.lower()] = count
+        if count > 1:
+            sources[index] = source._replace(name=f"{source.name}_{count}")
+    return sources
+
+
+def describe_source(source):
+    """Return a short display name for a StationSource (file name, or archive:member)."""
+    if isinstance(source, str):
+        return os.path.basename(source)
+    if source.member is None:
+        return os.path.basename(source.path)
+    return f"{os.path.basename(source.path)}:{source.member}"
+
+
+@contextmanager
+def open_station_source(source, encoding=STATION_ENCODING):
+    """
+    Open a station file, or a member of a zip archive, as a text stream.
+
+    Zip members are streamed straight out of the archive and decoded with the
+    same encoding as loose files.
+
+    Args:
+        source (str or StationSource): Path to a CSV file, or a StationSource.
+        encoding (str): Text encoding of the station file.
+
+    Yields:
+        file: A text stream suitable for csv.reader.
     """
-    Reads a CSV file and extracts file information, header, and data.
+    if isinstance(source, str):
+        source = StationSource(None, source, None)
+    if source.member is None:
+        with open(source.path, mode='r', newline='', encoding=encoding) as file:
+            yield file
+    else:
+        with zipfile.ZipFile(source.path) as archive:
+            with archive.open(source.member) as member:
+                yield io.TextIOWrapper(member, encoding=encoding, newline='')
+
+
+def load_tide_table(source, encoding=STATION_ENCODING):
+    """
+    Read a station CSV file straight into a TideTable.
 
     Args:
-        file_path (str): Path to the CSV file.
+        source (str or StationSource): Path to the CSV file, or a StationSource (which may be a zip member).
+        encoding (str): Text encoding of the station file.
 
     Returns:
-        tuple: A tuple containing file_info (list), header (list), and data (list of lists).
+        TideTable: The parsed station data.
 
     Raises:
         FileNotFoundError: If the file does not exist.
         ValueError: If the file format is invalid or missing required data.
     """
     try:
-        with open(file_path, mode='r') as file:
+        with open_station_source(source, encoding) as file:
             csv_reader = csv.reader(file)
             try:
                 file_info = next(csv_reader)  # Read the first line as file info
             except StopIteration:
                 raise ValueError("CSV file is empty or missing file information.")
 
-            # Skip the next 2 lines
+            # Skip the constituent and units lines
             for _ in range(2):
-                try:
-                    next(csv_reader, None)
-                except StopIteration:
-                    raise ValueError("CSV file is missing required header or data rows.")
+                next(csv_reader, None)
 
-            # Define the header manually
-            header = ["date", "day", "month", "year", "t1", "d1", "t2", "d2", "t3", "d3", "t4", "d4", "t5", "d5"]
+            return parse_tide_table(file_info, csv_reader)
 
-            # Read the remaining rows as data
-            data = list(csv_reader)
-            if not data:
-                raise ValueError("CSV file contains no data rows.")
+    except (FileNotFoundError, KeyError):
+        raise FileNotFoundError(f"The file at path '{describe_source(source)}' does not exist.")
+    except Exception as e:
+        raise ValueError(f"An error occurred while reading the CSV file: {e}")
 
-        return file_info, header, data
+# Bump whenever parse_tide_table or the TideTable layout changes, so stale cache entries are ignored
+PARSER_VERSION = 1
 
-    except FileNotFoundError:
-        raise FileNotFoundError(f"The file at path '{file_path}' does not exist.")
+# Magic bytes at the start of a cached station table
+CACHE_MAGIC = b'SLRTIDE\0'
+
+# Column name, array type code and number of values per row, in the order they are cached
+CACHE_COLUMNS = (
+    ('day', 'b', 1),
+    ('weekday', 'b', 1),
+    ('month', 'b', 1),
+    ('year', 'h', 1),
+    ('width', 'b', 1),
+    ('times', 'h', MAX_EVENTS),
+    ('values', 'f', MAX_EVENTS),
+    ('codes', 'h', MAX_EVENTS),
+    ('missing', 'B', MAX_EVENTS),
+)
+
+
+def default_cache_folder():
+    """Return the local folder used for the parsed-station cache when config.yaml does not set one."""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'SeaLevelReport', 'station_cache')
+
+
+def source_cache_key(source, cache_folder, encoding=STATION_ENCODING):
+    """
+    Return the content key of a station file for the parsed-station cache.
+
+    The key is a SHA-256 of the file bytes and the text encoding used to decode them.
+    For loose files the key is remembered against the file size and modification
+    time, so unchanged files are not even re-read on a warm run.
+
+    Args:
+        source (StationSource): The station file.
+        cache_folder (str): The cache folder.
+        encoding (str): Text encoding of the station file.
+
+    Returns:
+        str: The hexadecimal content key.
+    """
+    stamp_path = None
+    if source.member is None:
+        stat = os.stat(source.path)
+        path_hash = hashlib.sha1(os.path.abspath(source.path).encode('utf-8')).hexdigest()
+        stamp_path = os.path.join(cache_folder, 'paths', path_hash + '.json')
+        try:
+            with open(stamp_path, 'r') as stamp_file:
+                stamp = json.load(stamp_file)
+            if stamp['size'] == stat.st_size and stamp['mtime_ns'] == stat.st_mtime_ns and stamp['encoding'] == encoding:
+                return stamp['key']
+        except (OSError, ValueError, KeyError):
+            pass
+        with open(source.path, 'rb') as file:
+            content = file.read()
+    else:
+        with zipfile.ZipFile(source.path) as archive:
+            content = archive.read(source.member)
+
+    key = hashlib.sha256(encoding.encode('ascii') + b'\0' + content).hexdigest()
+
+    if stamp_path is not None:
+        stamp = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'encoding': encoding, 'key': key}
+        write_file_atomic(stamp_path, json.dumps(stamp).encode('utf-8'))
+    return key
+
+
+def write_file_atomic(path, data):
+    """Write bytes to a file through a temporary file, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+def write_cached_table(cache_path, table):
+    """
+    Save a TideTable to the parsed-station cache.
+
+    The file holds a small JSON header followed by the raw column arrays, each
+    aligned to 8 bytes.
+
+    Args:
+        cache_path (str): Path of the cache entry.
+        table (TideTable): The parsed station data.
+    """
+    meta = json.dumps({
+        'parser_version': PARSER_VERSION,
+        'byteorder': sys.byteorder,
+        'rows': len(table),
+        'file_info': table.file_info,
+        'labels': table.labels,
+        'decimals': table.decimals,
+    }).encode('utf-8')
+
+    chunks = [CACHE_MAGIC, struct.pack('<I', len(meta)), meta]
+    offset = len(CACHE_MAGIC) + 4 + len(meta)
+    for name, _, _ in CACHE_COLUMNS:
+        padding = -offset % 8
+        column = bytes(getattr(table, name))
+        chunks += [b'\0' * padding, column]
+        offset += padding + len(column)
+    write_file_atomic(cache_path, b''.join(chunks))
+
+
+def read_cached_table(cache_path):
+    """
+    Load a TideTable from the parsed-station cache.
+
+    The columns are copied out of the file into arrays, so the table holds no
+    open file or mapping: on Windows a mapped entry could not be replaced when the
+    same station is cached again by this process (watch mode).
+
+    Args:
+        cache_path (str): Path of the cache entry.
+
+    Returns:
+        TideTable: The cached station data, or None if the entry is missing,
+        damaged or was written by a different parser version.
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    try:
+        if data[:len(CACHE_MAGIC)] != CACHE_MAGIC:
+            return None
+        offset = len(CACHE_MAGIC)
+        meta_length = struct.unpack_from('<I', data, offset)[0]
+        offset += 4
+        meta = json.loads(data[offset:offset + meta_length].decode('utf-8'))
+        offset += meta_length
+        if meta['parser_version'] != PARSER_VERSION or meta['byteorder'] != sys.byteorder:
+            return None
+
+        columns = {}
+        for name, code, stride in CACHE_COLUMNS:
+            offset += -offset % 8
+            size = array(code).itemsize * meta['rows'] * stride
+            if offset + size > len(data):
+                return None
+            column = data[offset:offset + size]
+            columns[name] = bytearray(column) if name == 'missing' else array(code, column)
+            offset += size
+    except (ValueError, KeyError, struct.error):
+        return None
+
+    return TideTable(meta['file_info'], labels=meta['labels'], decimals=meta['decimals'], **columns)
+
+
+def load_tide_table_cached(source, cache_folder, encoding=STATION_ENCODING):
+    """
+    Read a station file through the on-disk parsed-station cache.
+
+    On a cache hit the file is not parsed at all; on a miss it is parsed with
+    load_tide_table and the result is stored for the next run. Cache problems
+    never fail a run, the file is simply parsed again.
+
+    Args:
+        source (StationSource): The station file.
+        cache_folder (str): The cache folder.
+        encoding (str): Text encoding of the station file.
+
+    Returns:
+        TideTable: The parsed station data.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file format is invalid or missing required data.
+    """
+    try:
+        key = source_cache_key(source, cache_folder, encoding)
+    except (FileNotFoundError, KeyError):
+        raise FileNotFoundError(f"The file at path '{describe_source(source)}' does not exist.")
     except Exception as e:
-        raise ValueError(f"An error occurred while reading the CSV file: {e}")
+        print(f"Warning: station cache unavailable for '{describe_source(source)}': {e}")
+        return load_tide_table(source, encoding)
+
+    cache_path = os.path.join(cache_folder, 'tables', key + '.tide')
+    table = read_cached_table(cache_path)
+    if table is None:
+        table = load_tide_table(source, encoding)
+        try:
+            write_cached_table(cache_path, table)
+        except OSError as e:
+            print(f"Warning: unable to write station cache entry '{cache_path}': {e}")
+    return table
+
+# Daylight saving zones: clocks change at this many minutes after midnight, local standard time
+# (2:00 AM for New Zealand, 2:45 AM for the Chatham Islands), and go forward/back by one hour
+DST_ZONES = {
+    'NZ': 120,
+    'Chatham': 165,
+}
+
+# Default range of years covered by the daylight saving transition table
+DST_YEAR_RANGE = (1974, 2100)
+
+# Local clock times at which daylight time starts and ends in one calendar year (None if no change that year)
+DstTransitions = namedtuple('DstTransitions', ['start', 'end'])
+
+# Precomputed transitions, keyed by (zone, year); filled by build_dst_table
+DST_TABLE = {}
+
+
+def read_station(source, cache_folder=None, encoding=STATION_ENCODING):
+    """Read a station file into a TideTable, through the parsed-station cache when a cache folder is set."""
+    if cache_folder:
+        return load_tide_table_cached(source, cache_folder, encoding)
+    return load_tide_table(source, encoding)
 
-def is_daylight_saving(date):
+
+def sunday_on_or_after(year, month, day):
+    """Return the first Sunday on or after the given day (as a datetime at midnight)."""
+    first = datetime(year, month, day)
+    return first + timedelta(days=(6 - first.weekday()) % 7)
+
+
+def last_sunday(year, month):
+    """Return the last Sunday of the given month (as a datetime at midnight)."""
+    last = datetime(year, month, calendar.monthrange(year, month)[1])
+    return last - timedelta(days=(last.weekday() + 1) % 7)
+
+
+def nz_dst_dates(year):
     """
-    Check if a given date falls within New Zealand's daylight saving time.
-    Daylight saving in New Zealand starts at 2:00 AM on the last Sunday in September
-    and ends at 3:00 AM on the first Sunday in April.
+    Return the dates daylight time starts and ends in New Zealand in a calendar year.
+
+    Covers the 1974 trial, the 1975-1989 rules, the 1990-2006 rules (first Sunday
+    in October to the third Sunday in March) and the rules in force since 2007
+    (last Sunday in September to the first Sunday in April).
 
     Args:
-        date (datetime): The date to check.
+        year (int): The year.
 
     Returns:
-        bool: True if the date is within daylight saving time, False otherwise.
+        tuple: (start date, end date); either is None when there was no change that year.
+    """
+    if year < 1974:
+        return None, None
+    if year == 1974:
+        return sunday_on_or_after(1974, 11, 1), None
+    if year == 1975:
+        end = last_sunday(1975, 2)
+    elif year <= 1989:
+        end = sunday_on_or_after(year, 3, 1)
+    elif year <= 2007:
+        end = sunday_on_or_after(year, 3, 15)
+    else:
+        end = sunday_on_or_after(year, 4, 1)
+
+    if year <= 1988:
+        start = last_sunday(year, 10)
+    elif year == 1989:
+        start = sunday_on_or_after(1989, 10, 8)
+    elif year <= 2006:
+        start = sunday_on_or_after(year, 10, 1)
+    else:
+        start = last_sunday(year, 9)
+    return start, end
+
+
+def build_dst_table(first_year=DST_YEAR_RANGE[0], last_year=DST_YEAR_RANGE[1]):
+    """
+    Precompute the daylight saving transitions for New Zealand and the Chatham Islands.
+
+    The table is built once per process and shared by every station in a run.
+    Start times are local standard time (the clock then jumps forward one hour);
+    end times are local daylight time (the clock then goes back one hour).
+
+    Args:
+        first_year (int): First year in the table.
+        last_year (int): Last year in the table.
 
     Raises:
-        ValueError: If the input is not a datetime object.
+        ValueError: If the year range is invalid.
+    """
+    if not (1 <= first_year <= last_year <= 9998):
+        raise ValueError(f"Invalid daylight saving year range: {first_year}-{last_year}")
+
+    DST_TABLE.clear()
+    for year in range(first_year, last_year + 1):
+        start_day, end_day = nz_dst_dates(year)
+        for zone, change_minute in DST_ZONES.items():
+            start = end = None
+            if start_day is not None:
+                start = start_day + timedelta(minutes=change_minute)
+            if end_day is not None:
+                end = end_day + timedelta(minutes=change_minute + 60)
+            DST_TABLE[(zone, year)] = DstTransitions(start, end)
+
+
+def dst_transitions(year, zone='NZ'):
     """
-    if not isinstance(date, datetime):
-        raise ValueError("The input must be a datetime object.")
+    Look up the daylight saving transitions of a year in the precomputed table.
+
+    Args:
+        year (int): The year.
+        zone (str): 'NZ' or 'Chatham'.
+
+    Returns:
+        DstTransitions: Local clock times daylight time starts and ends that year.
 
+    Raises:
+        ValueError: If the zone is unknown or the year is outside the table.
+    """
+    if not DST_TABLE:
+        build_dst_table()
     try:
-        year = date.year
+        return DST_TABLE[(zone, year)]
+    except KeyError:
+        if zone not in DST_ZONES:
+            raise ValueError(f"Unknown daylight saving zone: {zone}")
+        years = sorted(year for _, year in DST_TABLE)
+        raise ValueError(f"The year {year} is outside the daylight saving table ({years[0]}-{years[-1]}). "
+                         f"Adjust dst_years in config.yaml.")
+
+
+# Daylight classification of a tide event
+STANDARD_TIME = 0
+DAYLIGHT_TIME = 1
+AMBIGUOUS_TIME = 2  # in the repeated hour when daylight time ends, needs a decision
+
+# Daylight classification of a whole row (day)
+ROW_STANDARD = 0
+ROW_DAYLIGHT = 1
+ROW_DST_ENDS = 2  # daylight time ends during the day
+ROW_DST_STARTS = 3  # daylight time starts during the day
+
+# Per-event and per-row daylight classification of a TideTable
+DaylightFlags = namedtuple('DaylightFlags', ['events', 'rows'])
+
+# Page layout of a group of stations: the report title, condition line (words between
+# underscores are underlined), unit of the value columns ('m' heights or 'Dir' stream
+# directions), place named in the daylight line, spacing after the daylight line (points),
+# caution line (None for none) and daylight saving zone (see DST_ZONES)
+LayoutProfile = namedtuple('LayoutProfile', ['name', 'title', 'condition', 'unit', 'daylight_place',
+                                             'daylight_space_after', 'caution', 'zone'])
+
+# Built-in layouts, 'tide' is used for any station without a profile
+LAYOUT_PROFILES = {
+    'tide': LayoutProfile('tide', "New Zealand Hydrographic Authority Tide Predictions",
+                          "N.Z. Local Times and Heights of High and Low Waters", 'm', "N.Z.", 3, None, 'NZ'),
+    'stream': LayoutProfile('stream', "New Zealand Hydrographic Authority Tide Stream Predictions",
+                            "Tidal Stream _begins_ at the N.Z. Local Time shown, in the direction indicated", 'Dir', "N.Z.", 3,
+                            "Caution: Tidal Streams may be subject to irregularities and these times should be regarded as approximate only.",
+                            'NZ'),
+    'chatham': LayoutProfile('chatham', "New Zealand Hydrographic Authority Tide Predictions",
+                             "Chatham Islands Local Times and Heights of High and Low Waters", 'm', "Chatham Islands", 2, None,
+                             'Chatham'),
+}
+
+# Built-in station profiles, by station id or station name
+STATION_PROFILES = {
+    "Te Aumiti / French Pass": 'stream',
+    "Tory Channel / Kura Te Au Entrance": 'stream',
+    "Owenga - Chatham Island": 'chatham',
+    "Kaingaroa - Chatham Island": 'chatham',
+    "Waitangi - Chatham Island": 'chatham',
+}
+
+# Compiled station to LayoutProfile lookup, see compile_layout_profiles
+StationProfiles = namedtuple('StationProfiles', ['stations', 'default'])
+
+
+def compile_layout_profiles(config):
+    """
+    Compile the station layout profiles, once per run.
 
-        # Calculate the last Sunday in September
-        september_last_sunday = max(
-            datetime(year, 9, day) for day in range(22, 30 + 1) if datetime(year, 9, day).weekday() == 6
-        )
+    The built-in profiles and station assignments are extended by the optional
+    layout_profiles (settings of new or changed profiles, new profiles start from
+    'tide') and station_profiles (station id such as '072', or station name, to
+    profile name) sections of config.yaml. Station ids must be quoted.
 
-        # Calculate the first Sunday in April
-        april_first_sunday = min(
-            datetime(year, 4, day) for day in range(1, 7 + 1) if datetime(year, 4, day).weekday() == 6
-        )
+    Args:
+        config (dict): The configuration.
 
-        # Check if the date is within the daylight saving period
-        return september_last_sunday <= date < april_first_sunday
+    Returns:
+        StationProfiles: The profile of each configured station and the default profile.
 
-    except Exception as e:
-        raise ValueError(f"An error occurred while determining daylight saving time: {e}")
+    Raises:
+        ValueError: If a profile setting, profile name or daylight saving zone is unknown,
+            or a station id is not quoted.
+    """
+    profiles = dict(LAYOUT_PROFILES)
+    for name, settings in (config.get('layout_profiles') or {}).items():
+        unknown = set(settings) - set(LayoutProfile._fields[1:])
+        if unknown:
+            raise ValueError(f"Unknown setting(s) {', '.join(sorted(unknown))} in layout profile '{name}'")
+        profiles[name] = profiles.get(name, profiles['tide'])._replace(name=name, **settings)
+        if profiles[name].zone not in DST_ZONES:
+            raise ValueError(f"Invalid zone '{profiles[name].zone}' in layout profile '{name}', use one of: {', '.join(DST_ZONES)}")
+
+    stations = {}
+    for station, name in {**STATION_PROFILES, **(config.get('station_profiles') or {})}.items():
+        # YAML reads an unquoted station id as a number, and 072 as octal 58
+        if not isinstance(station, str):
+            raise ValueError(f"Station id {station!r} in station_profiles must be quoted, e.g. '072': '{name}'")
+        if name not in profiles:
+            raise ValueError(f"Unknown layout profile '{name}' for station '{station}'")
+        stations[station] = profiles[name]
+    return StationProfiles(stations, profiles['tide'])
+
+
+# The built-in profiles, for rendering without a configuration
+DEFAULT_PROFILES = compile_layout_profiles({})
+
+
+def station_profile(profiles, file_info):
+    """Return the LayoutProfile of a station, by its id or else its name."""
+    profile = profiles.stations.get(file_info[0].strip())
+    if profile is None:
+        profile = profiles.stations.get(station_region_name(file_info), profiles.default)
+    return profile
+
+
+def condition_runs(condition):
+    """Split a profile condition line into (text, underlined) pieces, words between underscores are underlined."""
+    return [(text, index % 2 == 1) for index, text in enumerate(condition.split('_')) if text]
+
+
+def daylight_text(daylight, place):
+    """Return the daylight line of a page: daylight is 'adjusted', 'daylight' or 'standard', see page_daylight_mode."""
+    if daylight == 'adjusted':
+        return f"Times shown in bold have been adjusted for {place} Daylight Time"
+    elif daylight == 'daylight':
+        return f"Times listed are {place} Daylight Time"
+    return f"Times listed are {place} Standard Time"
+
+
+def station_coordinates(file_info):
+    """Return the coordinates line of a station, from the first line of its file."""
+    Lat = (file_info[2]).replace('Â', '')
+    Long = (file_info[3]).replace('Â', '')
+    return f"Lat. {Lat} Long. {Long}"
 
-def find_new_zealand_daylight_saving_time(year):
+
+def station_daylight_flags(tide_table, profile, dst_policy=None):
+    """Tag every tide event of a station as standard or daylight time, with ambiguous times resolved."""
+    daylight_flags = classify_daylight_time(tide_table, profile.zone)
+    resolve_daylight_ambiguities(tide_table, daylight_flags, dst_policy or DEFAULT_DST_POLICY,
+                                 station_region_name(tide_table.file_info))
+    return daylight_flags
+
+
+def classify_daylight_time(table, zone='NZ'):
     """
-    Find the start and end dates of New Zealand's daylight saving time for a given year.
-    Daylight saving in New Zealand starts at 2:00 AM on the last Sunday in September
-    and ends at 3:00 AM on the first Sunday in April.
+    Tag every tide event of a station file as standard, daylight or ambiguous time.
+
+    The times in the file are local clock times. Each row is compared with the
+    changeover days of its year: a day wholly in daylight time gets all its event
+    flags in one slice assignment, a day wholly in standard time keeps the zeroed
+    flags, and only the two changeover days of each year are looked at event by event:
+
+    - the day daylight time ends: events before 3:00 AM (3:45 AM Chatham) are
+      daylight time, except that when the first event falls in the repeated hour
+      (01:59 to 02:59, Chatham 02:44 to 03:44) those events are ambiguous;
+    - the day daylight time starts: events from 2:00 AM (2:45 AM Chatham) are
+      daylight time.
 
     Args:
-        year (int): The year for which to calculate daylight saving time.
+        table (TideTable): The parsed station data.
+        zone (str): 'NZ' or 'Chatham'.
 
     Returns:
-        tuple: A tuple containing the start and end dates of daylight saving time.
+        DaylightFlags: ``events`` holds one flag per event slot (STANDARD_TIME,
+        DAYLIGHT_TIME or AMBIGUOUS_TIME, empty slots are STANDARD_TIME) and
+        ``rows`` one ROW_* kind per row.
 
     Raises:
-        ValueError: If the input year is not a valid integer or is out of range.
+        ValueError: If a year is outside the daylight saving table.
+    """
+    change_minute = DST_ZONES[zone]
+    end_minute = change_minute + 60
+    events = bytearray(len(table) * MAX_EVENTS)
+    rows = bytearray(len(table))
+    daylight_row = bytes([DAYLIGHT_TIME]) * MAX_EVENTS
+    changeovers = {}
+
+    for row, (year, month, day) in enumerate(zip(table.year, table.month, table.day)):
+        if year not in changeovers:
+            start, end = dst_transitions(year, zone)
+            changeovers[year] = ((start.month, start.day) if start else (13, 0),
+                                 (end.month, end.day) if end else (0, 0))
+        start_day, end_day = changeovers[year]
+        first = row * MAX_EVENTS
+
+        if (month, day) < end_day or (month, day) > start_day:
+            rows[row] = ROW_DAYLIGHT
+            events[first:first + MAX_EVENTS] = daylight_row
+        elif (month, day) == end_day:
+            rows[row] = ROW_DST_ENDS
+            minutes = table.times[first:first + table.width[row]]
+            ambiguous = len(minutes) > 0 and change_minute - 1 <= minutes[0] < end_minute
+            for slot, minute in enumerate(minutes):
+                if minute != MISSING_TIME and minute < end_minute:
+                    events[first + slot] = AMBIGUOUS_TIME if ambiguous else DAYLIGHT_TIME
+        elif (month, day) == start_day:
+            rows[row] = ROW_DST_STARTS
+            for slot, minute in enumerate(table.times[first:first + table.width[row]]):
+                if minute != MISSING_TIME and minute >= change_minute:
+                    events[first + slot] = DAYLIGHT_TIME
+
+    return DaylightFlags(events, rows)
+
+
+def page_daylight_mode(daylight_flags, page):
+    """
+    Return how the times on a month page relate to daylight time.
+
+    Returns:
+        str: 'daylight' if every day is daylight time, 'standard' if every day is
+        standard time, or 'adjusted' if the month contains a changeover.
+    """
+    kinds = {daylight_flags.rows[row] for row in page.slots if row is not None}
+    if kinds == {ROW_DAYLIGHT}:
+        return 'daylight'
+    if kinds == {ROW_STANDARD}:
+        return 'standard'
+    return 'adjusted'
+
+
+def station_region_name(file_info):
     """
-    if not isinstance(year, int) or year < 1:
-        raise ValueError("The year must be a positive integer.")
+    Return the station name from the first line of a station file.
 
+    Fixes region name macrons (Māori) when UTF-8 encoded text has been decoded
+    using a single-byte encoding such as Latin-1 or Windows-1252.
+    """
+    return file_info[1].encode('Windows-1252').decode('utf-8')
+
+
+def dst_decision_key(table, row):
+    """Return the decisions-file key (station, 'YYYY-MM-DD', 'HH:MM') of the first event of a row."""
+    station = table.file_info[0].strip()
+    year, month, date = table.year[row], table.month[row], table.day[row]
+    return station, f"{year:04d}-{month:02d}-{date:02d}", table.time_text(row)[0]
+
+
+def ask_daylight_time(region_name, date, month, year, time_text):
+    """
+    Ask the user whether an event in the repeated hour is daylight time.
+
+    Returns:
+        bool: True for daylight time, False for standard time, None if the question cannot be shown.
+    """
     try:
-        # Calculate the last Sunday in September
-        september_last_sunday = max(
-            datetime(year, 9, day) for day in range(22, 30 + 1) if datetime(year, 9, day).weekday() == 6
+        import_deferred('dialog')
+        from tkinter import Tk, messagebox
+        root = Tk()
+        root.withdraw()  # Hide the main window
+        result = messagebox.askyesno(
+            f"Confirmation Required {region_name}",
+            f"{date}/{month}/{year} {time_text}.\nIs this Daylight time?\n\nClick 'Yes' to NZDT, or 'No' to NZST.",
         )
+        root.destroy()
+        return bool(result)
+    except Exception as e:
+        print(f"Unable to ask about time '{time_text}' ({date}/{month}/{year} {region_name}): {e}")
+        return None
 
-        # Calculate the first Sunday in April
-        april_first_sunday = min(
-            datetime(year, 4, day) for day in range(1, 7 + 1) if datetime(year, 4, day).weekday() == 6
-        )
 
-        return september_last_sunday, april_first_sunday
+# How events in the repeated hour at the end of daylight time are resolved when
+# the decisions file has no answer for them:
+#   auto     - infer from the spacing of the neighbouring high and low waters
+#   daylight - treat them as daylight time
+#   standard - treat them as standard time
+#   prompt   - ask with a Tk dialog (interactive runs only)
+#   strict   - fail the station, so every case must be answered in the decisions file
+DST_POLICIES = ('auto', 'daylight', 'standard', 'prompt', 'strict')
 
-    except Exception as e:
-        raise ValueError(f"An error occurred while calculating daylight saving time: {e}")
+# Ambiguity policy: mode from DST_POLICIES and pre-answered decisions keyed by (station, 'YYYY-MM-DD', 'HH:MM')
+DstPolicy = namedtuple('DstPolicy', ['mode', 'decisions'])
+
+DEFAULT_DST_POLICY = DstPolicy('auto', {})
+
+# Accepted answers in the decisions file
+DST_ANSWERS = {
+    'daylight': True, 'yes': True, 'y': True, 'nzdt': True, 'dt': True,
+    'standard': False, 'no': False, 'n': False, 'nzst': False, 'st': False,
+}
+
+
+def load_dst_decisions(file_path):
+    """
+    Load pre-answered daylight saving decisions from a CSV file.
+
+    The file has a header row with the columns station, date (YYYY-MM-DD),
+    time (HH:MM) and answer ('daylight' or 'standard'). Rows with an empty
+    answer are ignored.
+
+    Args:
+        file_path (str): Path to the decisions file.
+
+    Returns:
+        dict: Decisions keyed by (station, date, time), True for daylight time.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If a row is invalid.
+    """
+    decisions = {}
+    with open(file_path, mode='r', newline='') as file:
+        for line_number, row in enumerate(csv.DictReader(file), start=2):
+            try:
+                answer = row['answer'].strip().lower()
+                if not answer:
+                    continue
+                if answer not in DST_ANSWERS:
+                    raise ValueError(f"invalid answer '{row['answer']}', use 'daylight' or 'standard'")
+                key = (row['station'].strip(), row['date'].strip(), format_minutes(parse_minutes(row['time'].strip())))
+            except (KeyError, AttributeError, ValueError) as e:
+                raise ValueError(f"Invalid daylight saving decision on line {line_number} of '{file_path}': {e}")
+            decisions[key] = DST_ANSWERS[answer]
+    return decisions
+
+
+def infer_daylight_time(table, row):
+    """
+    Infer whether the first event of a row falls in the daylight or standard repeated hour.
+
+    High waters (and low waters) follow each other roughly every 12h25m. The
+    event two before the ambiguous one (on the previous day, daylight time) and
+    the event two after it (standard time) are the same kind of tide, so the
+    answer that makes those two intervals most alike is chosen.
+
+    Args:
+        table (TideTable): The parsed station data.
+        row (int): Index of the row on which daylight time ends.
+
+    Returns:
+        bool: True for daylight time, False for standard time, None if there are too few neighbouring events.
+    """
+    current = [minute for minute in table.event_minutes(row) if minute != MISSING_TIME]
+    previous = [minute for minute in table.event_minutes(row - 1) if minute != MISSING_TIME] if row > 0 else []
+    if len(current) < 3 or len(previous) < 2:
+        return None
+
+    ambiguous = current[0]
+    before = ambiguous + 24 * 60 - previous[-2]  # clock minutes from the same kind of tide the day before
+    after = current[2] - ambiguous  # clock minutes to the same kind of tide later that day
+    # Daylight: an extra hour passes after the event; standard: an extra hour passes before it
+    return abs(before - (after + 60)) <= abs((before + 60) - after)
+
+
+def resolve_daylight_ambiguities(table, daylight_flags, policy, region_name):
+    """
+    Replace every AMBIGUOUS_TIME flag with DAYLIGHT_TIME or STANDARD_TIME.
+
+    Pre-answered decisions are used first, then the policy mode. No mode other
+    than 'prompt' ever opens a window, so batch and scheduled runs never wait.
+
+    Args:
+        table (TideTable): The parsed station data.
+        daylight_flags (DaylightFlags): Flags from classify_daylight_time, updated in place.
+        policy (DstPolicy): The ambiguity policy.
+        region_name (str): Station name, for messages.
+
+    Raises:
+        ValueError: In strict mode, if an ambiguous event has no decision.
+    """
+    station = table.file_info[0].strip()
+    for row, kind in enumerate(daylight_flags.rows):
+        if kind != ROW_DST_ENDS:
+            continue
+        first = row * MAX_EVENTS
+        flags = daylight_flags.events[first:first + MAX_EVENTS]
+        if AMBIGUOUS_TIME not in flags:
+            continue
+
+        year, month, date = table.year[row], table.month[row], table.day[row]
+        key = dst_decision_key(table, row)
+        time_text = key[2]
+        if key in policy.decisions:
+            daylight = policy.decisions[key]
+        elif policy.mode == 'strict':
+            raise ValueError(f"Daylight saving time is ambiguous for {region_name} ({station}) at {time_text} on "
+                             f"{date}/{month}/{year}; add it to the decisions file.")
+        elif policy.mode == 'daylight':
+            daylight = True
+        elif policy.mode == 'standard':
+            daylight = False
+        else:
+            daylight = None
+            if policy.mode == 'prompt':
+                daylight = ask_daylight_time(region_name, date, month, year, time_text)
+            if daylight is None:
+                daylight = infer_daylight_time(table, row)
+            if daylight is None:
+                daylight = True
+
+        resolved = DAYLIGHT_TIME if daylight else STANDARD_TIME
+        for slot, flag in enumerate(flags):
+            if flag == AMBIGUOUS_TIME:
+                daylight_flags.events[first + slot] = resolved
+
+# One month of a station file: the rows of day N are at slots[N - 1] (None for missing days)
+MonthPage = namedtuple('MonthPage', ['year', 'month', 'slots'])
+
+
+def iter_month_pages(table):
+    """
+    Group the rows of a TideTable by year and month, lazily.
+
+    Each month is yielded as soon as its last row has been seen, with a fixed
+    31-slot, day-indexed list of row indices, so files spanning several years
+    (e.g. July 2022 to June 2023) keep each month separate.
+
+    Args:
+        table (TideTable): The parsed station data.
+
+    Yields:
+        MonthPage: One page per (year, month), in file order.
+
+    Raises:
+        ValueError: If a month's rows are not contiguous or a day appears twice.
+    """
+    seen = set()
+    current = None
+    slots = None
+    for index, (year, month, day) in enumerate(zip(table.year, table.month, table.day)):
+        if (year, month) != current:
+            if current is not None:
+                yield MonthPage(current[0], current[1], slots)
+            current = (year, month)
+            if current in seen:
+                raise ValueError(f"Rows for {calendar.month_name[month]} {year} are not contiguous.")
+            seen.add(current)
+            slots = [None] * 31
+        if slots[day - 1] is not None:
+            raise ValueError(f"Duplicate row for {day} {calendar.month_name[month]} {year}.")
+        slots[day - 1] = index
+    if current is not None:
+        yield MonthPage(current[0], current[1], slots)
+
+# The LINZ logo: image file name, contents and SHA-256 of the contents
+LogoImage = namedtuple('LogoImage', ['name', 'data', 'sha256'])
+
+# Size and modification time of the logo file when read, and its LogoImage, by resolved path
+LOGO_CACHE = {}
+
+
+def resolve_logo_path(linz_logo_path):
+    """
+    Return the logo file a configured LINZ logo path stands for.
+
+    The system cannot process Māori characters correctly in the logo path, so
+    paths containing macrons (or an empty path) fall back to the logo on the
+    N: drive.
+    """
+    if not linz_logo_path or any(char in linz_logo_path for char in ['ā', 'ē', 'ī', 'ō', 'Ū', 'Ā', 'Ē', 'Ō']):
+        return 'N:\\Publications\\Toitū Te Whenua LINZ logo\\toitu_te_whenua_colour_cmyk_66mm_png.png'
+    return linz_logo_path
 
-def group_data_by_month(data):
+
+def load_logo(linz_logo_path):
     """
-    Group data by month.
+    Resolve and read the LINZ logo.
+
+    The path is resolved by resolve_logo_path. The (network) file is read on
+    first use and then again only when its size or modification time changes,
+    so a logo replaced while watch mode runs is picked up by the next station.
 
     Args:
-        data (list): List of data rows.
+        linz_logo_path (str): Configured logo path.
 
     Returns:
-        dict: A dictionary where keys are months and values are lists of rows for that month.
+        LogoImage: The image file name, contents and content hash.
 
     Raises:
-        ValueError: If the data format is invalid or missing required columns.
+        ValueError: If the logo file cannot be found or read.
     """
-    if not isinstance(data, list):
-        raise ValueError("Input data must be a list of rows.")
+    resolved_path = resolve_logo_path(linz_logo_path)
+    try:
+        stat = os.stat(resolved_path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if resolved_path in LOGO_CACHE and LOGO_CACHE[resolved_path][0] == stamp:
+            return LOGO_CACHE[resolved_path][1]
+        with open(resolved_path, 'rb') as logo_file:
+            logo = logo_file.read()
+    except FileNotFoundError:
+        raise ValueError(f"An error occurred while validating the LINZ logo path: LINZ logo file not found at path: {resolved_path}")
+    except OSError as e:
+        raise ValueError(f"An error occurred while reading the LINZ logo: {e}")
 
-    grouped_data = {}
+    image = LogoImage(os.path.basename(resolved_path.replace('\\', '/')), logo, hashlib.sha256(logo).hexdigest())
+    LOGO_CACHE[resolved_path] = (stamp, image)
+    return image
+
+
+def logo_sha256(linz_logo_path):
+    """Return the SHA-256 of the logo load_logo reads, None when it cannot be read."""
     try:
-        for row in data:
-            if len(row) < 3:
-                raise ValueError("Each row must have at least 3 columns (date, day, month).")
-            month = row[2]  # Assuming the third column is the month
-            if not month.isdigit() or not (1 <= int(month) <= 12):
-                raise ValueError(f"Invalid month value: {month}")
-            if month not in grouped_data:
-                grouped_data[month] = []
-            grouped_data[month].append(row)
-    except Exception as e:
-        raise ValueError(f"An error occurred while grouping data by month: {e}")
+        return load_logo(linz_logo_path).sha256
+    except ValueError:
+        return None
 
-    return grouped_data
 
 # add the top table
-def add_top_table(doc, linz_logo_path):
-    # Add LINZ logo and text to the top of the document - the system cannot process Māori characters correctly
-    # Therefore, the image path is hardcoded
-    try:
-        if not linz_logo_path or any(char in linz_logo_path for char in ['ā', 'ē', 'ī', 'ō', 'Ū', 'Ā', 'Ē', 'Ō']):
-            linz_logo_path = 'N:\\Publications\\Toitū Te Whenua LINZ logo\\toitu_te_whenua_colour_cmyk_66mm_png.png'
-        else:
-            linz_logo_path = linz_logo_path
+def add_top_table(doc, linz_logo_path, logo_drawing=None):
+    """
+    Add the LINZ logo and contact details table to the top of a page.
 
-        if not os.path.exists(linz_logo_path):
-            raise FileNotFoundError(f"LINZ logo file not found at path: {linz_logo_path}")
-    except Exception as e:
-        raise ValueError(f"An error occurred while validating the LINZ logo path: {e}")
+    The logo is embedded once per document: the first page adds the picture and
+    returns its drawing element, later pages pass it back in and get a copy that
+    refers to the same image part.
+
+    Args:
+        doc (Document): The Word document object.
+        linz_logo_path (str): Configured logo path.
+        logo_drawing (element): Drawing returned by the first call for this document, or None.
+
+    Returns:
+        element: The logo drawing to pass in for the next page.
+    """
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml.ns import qn
+    from docx.shared import Pt
+
+    logo_name, logo, _ = load_logo(linz_logo_path)
     try:
         top_table = doc.add_table(rows=1, cols=2)
         # Add logo to the first cell
         try:
-            if os.path.exists(linz_logo_path):
-                top_table.cell(0, 0).paragraphs[0].add_run().add_picture(linz_logo_path, width=Pt(180))
+            logo_run = top_table.cell(0, 0).paragraphs[0].add_run()
+            if logo_drawing is None:
+                logo_run.add_picture(io.BytesIO(logo), width=Pt(180))
+                drawing = logo_run._r.find(qn('w:drawing'))
+                drawing.find('.//' + qn('pic:cNvPr')).set('name', logo_name)
+                logo_drawing = copy.deepcopy(drawing)
             else:
-                raise FileNotFoundError(f"Logo file not found at path: {linz_logo_path}")
-        except FileNotFoundError:
-            raise FileNotFoundError("Logo file not found. Please check the file path.")
+                # Give each copy its own drawing id, the next one after the previous page
+                doc_pr = logo_drawing.find('.//' + qn('wp:docPr'))
+                shape_id = int(doc_pr.get('id')) + 1
+                doc_pr.set('id', str(shape_id))
+                doc_pr.set('name', f"Picture {shape_id}")
+                logo_run._r.append(copy.deepcopy(logo_drawing))
         except Exception as e:
             raise ValueError(f"An error occurred while adding the logo: {e}")
 
@@ -196,14 +1207,10 @@ def add_top_table(doc, linz_logo_path):
             text_paragraph1 = top_table.cell(0, 1).paragraphs[0]
             text_content1 = [
                 ("Sourced from ", None),
-                ("http://www.linz.govt.nz", RGBColor(0, 0, 255))
+                ("http://www.linz.govt.nz", 'Web Link')
             ]
-            for text, color in text_content1:
-                run = text_paragraph1.add_run(text)
-                run.font.size = Pt(10)
-                if color:
-                    run.font.color.rgb = color
-                    run.font.underline = True
+            for text, style in text_content1:
+                add_styled_run(text_paragraph1, text, style)
             text_paragraph1.paragraph_format.space_after = Pt(5)  # Reduce spacing after the paragraph
             text_paragraph1.alignment = WD_ALIGN_PARAGRAPH.LEFT  # Align text to the left
 
@@ -211,14 +1218,10 @@ def add_top_table(doc, linz_logo_path):
             text_paragraph2 = top_table.cell(0, 1).add_paragraph()
             text_content2 = [
                 ("E-mail address ", None),
-                ("hydro@linz.govt.nz", RGBColor(0, 0, 255))
+                ("hydro@linz.govt.nz", 'Web Link')
             ]
-            for text, color in text_content2:
-                run = text_paragraph2.add_run(text)
-                run.font.size = Pt(10)
-                if color:
-                    run.font.color.rgb = color
-                    run.font.underline = True
+            for text, style in text_content2:
+                add_styled_run(text_paragraph2, text, style)
             text_paragraph2.paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
             text_paragraph2.alignment = WD_ALIGN_PARAGRAPH.LEFT  # Align text to the left
 
@@ -229,204 +1232,181 @@ def add_top_table(doc, linz_logo_path):
     except Exception as e:
         raise ValueError(f"An error occurred while creating the top table: {e}")
 
-# Function to add a title line to the document
-def add_title(doc):
-    try:
-        title_paragraph = doc.add_paragraph("New Zealand Hydrographic Authority Tide Predictions")
-        title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_paragraph.runs[0]
-        title_run.font.size = Pt(10)
-        title_run.font.bold = True
-        title_run.font.name = 'Arial'
-        title_paragraph.paragraph_format.space_after = Pt(2)  # Reduce spacing after the title
-    except Exception as e:
-        raise ValueError(f"An error occurred while adding the title: {e}")
+    return logo_drawing
 
-def add_title1(doc):
+# Function to add a title line to the document
+def add_title(doc, title):
     try:
-        title_paragraph = doc.add_paragraph("New Zealand Hydrographic Authority Tide Stream Predictions")
-        title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_paragraph.runs[0]
-        title_run.font.size = Pt(10)
-        title_run.font.bold = True
-        title_run.font.name = 'Arial'
-        title_paragraph.paragraph_format.space_after = Pt(2)  # Reduce spacing after the title
+        add_styled_paragraph(doc, title, 'Report Title')
     except Exception as e:
         raise ValueError(f"An error occurred while adding the title: {e}")
 
 def add_header(doc, regionname):
     try:
-        header_paragraph = doc.add_paragraph(regionname)
-        header_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        header_run = header_paragraph.runs[0]
-        header_run.font.size = Pt(20)
-        header_run.font.bold = True
-        header_run.font.name = 'Arial'
-        header_run.font.color.rgb = RGBColor(20, 171, 155)  # Set color to #14ab9b
-        header_paragraph.paragraph_format.space_after = Pt(0)  # Reduce spacing after the header
+        doc.add_paragraph(regionname, 'Station Name')
     except Exception as e:
         raise ValueError(f"An error occurred while adding the header: {e}")
 
 def add_coordinates(doc, coord):
     try:
-        ldt_paragraph = doc.add_paragraph(coord)
-        ldt_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        ldt_run = ldt_paragraph.runs[0]
-        ldt_run.font.size = Pt(10)
-        ldt_run.font.name = 'Arial'
-        ldt_paragraph.paragraph_format.space_after = Pt(0)  # Reduce spacing after the header
+        doc.add_paragraph(coord, 'Coordinates')
     except Exception as e:
         raise ValueError(f"An error occurred while adding coordinates: {e}")
 
-def add_month_heading(document, month, rows):
+def add_month_heading(document, month, year):
     """
     Add a month and year heading to the document.
 
     Args:
         document (Document): The Word document object.
-        month (str): The month number as a string.
-        rows (list): List of rows containing data for the month.
+        month (int): The month number.
+        year (int): The year of the month.
 
     Raises:
-        ValueError: If the month is invalid or rows are missing required data.
+        ValueError: If the month is invalid.
     """
     try:
-        if not month.isdigit() or not (1 <= int(month) <= 12):
+        if not (1 <= int(month) <= 12):
             raise ValueError(f"Invalid month value: {month}")
 
-        if not rows or len(rows[0]) < 4:
-            raise ValueError("Rows are missing required data for year extraction.")
-
         month_name = calendar.month_name[int(month)]
-        year = rows[0][3]  # Extract year from the first data row
-
-        heading = document.add_heading(f"{month_name} {year}", level=1)
-        for run in heading.runs:
-            run.font.size = Pt(20)  # Set font size to 24
-            run.font.color.rgb = RGBColor(20, 171, 155)  # Set font color to RGB(20, 171, 155)
-            run.font.bold = True
-            run.font.name = 'Arial'
 
-        heading.paragraph_format.space_before = Pt(0)  # Reduce spacing under the heading
-        heading.paragraph_format.space_after = Pt(0)  # Reduce spacing under the heading
-        heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        add_styled_paragraph(document, f"{month_name} {year}", 'Month Heading')
 
     except Exception as e:
         raise ValueError(f"An error occurred while adding the month heading: {e}")
 
 
 # Function to add a condition line to the document
-def add_condition(doc):
-    try:
-        condition_paragraph = doc.add_paragraph()
-        condition_run = condition_paragraph.add_run("Tidal Stream ")
-        condition_run.font.size = Pt(10)
-        condition_run.font.name = 'Arial'
-
-        begins_run = condition_paragraph.add_run("begins")
-        begins_run.font.underline = True
-        begins_run.font.size = Pt(10)
-        begins_run.font.name = 'Arial'
-
-        condition_run = condition_paragraph.add_run(" at the N.Z. Local Time shown, in the direction indicated")
-        condition_run.font.size = Pt(10)
-        condition_run.font.name = 'Arial'
-
-        condition_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        condition_paragraph.paragraph_format.space_after = Pt(5)  # Reduce spacing after the title
-    except Exception as e:
-        raise ValueError(f"An error occurred while adding the condition: {e}")
-
-def add_condition1(doc):
+def add_condition(doc, condition):
+    # Words between underscores are underlined, e.g. "Tidal Stream _begins_ at ..."
     try:
-        condition_paragraph = doc.add_paragraph("Chatham Islands Local Times and Heights of High and Low Waters")
-        condition_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        condition_run = condition_paragraph.runs[0]
-        condition_run.font.size = Pt(10)
-        condition_run.font.name = 'Arial'
-        condition_paragraph.paragraph_format.space_after = Pt(5)  # Reduce spacing after the title
+        condition_paragraph = add_styled_paragraph(doc, None, 'Condition')
+        for text, underline in condition_runs(condition):
+            condition_run = condition_paragraph.add_run(text)
+            if underline:
+                condition_run.font.underline = True
     except Exception as e:
         raise ValueError(f"An error occurred while adding the condition: {e}")
 
-def add_condition2(doc):
+def add_caution(doc, caution):
     try:
-        condition_paragraph = doc.add_paragraph("N.Z. Local Times and Heights of High and Low Waters")
-        condition_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        condition_run = condition_paragraph.runs[0]
-        condition_run.font.size = Pt(10)
-        condition_run.font.name = 'Arial'
-        condition_paragraph.paragraph_format.space_after = Pt(5)  # Reduce spacing after the title
-    except Exception as e:
-        raise ValueError(f"An error occurred while adding the condition: {e}")
-
-def add_caution(doc):
-    try:
-        caution_paragraph = doc.add_paragraph("Caution: Tidal Streams may be subject to irregularities and these times should be regarded as approximate only.")
-        caution_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        caution_run = caution_paragraph.runs[0]
-        caution_run.font.size = Pt(8.5)
-        caution_run.font.name = 'Arial'
-        caution_paragraph.paragraph_format.space_after = Pt(2)  # Reduce spacing after the title
-        caution_paragraph.paragraph_format.space_before = Pt(5)  # Reduce spacing before the title
+        add_styled_paragraph(doc, caution, 'Caution')
     except Exception as e:
         raise ValueError(f"An error occurred while adding the caution: {e}")
 
-def add_daylight(doc, month):
+def add_daylight(doc, daylight, profile):
+    # daylight is 'adjusted' (month with a changeover), 'daylight' or 'standard', see page_daylight_mode
     try:
-        if int(month) == 4 or int(month) == 9:
-            daylight_paragraph = doc.add_paragraph("Times shown in bold have been adjusted for N.Z. Daylight Time")
-        elif int(month) in [1, 2, 3, 10, 11, 12]:
-            daylight_paragraph = doc.add_paragraph("Times listed are N.Z. Daylight Time")
-        else:
-            daylight_paragraph = doc.add_paragraph("Times listed are N.Z. Standard Time")
-        daylight_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        daylight_run = daylight_paragraph.runs[0]
-        daylight_run.font.size = Pt(10)
-        daylight_run.font.name = 'Arial'
-        daylight_paragraph.paragraph_format.space_after = Pt(3)  # Reduce spacing after the title
+        daylight_paragraph = add_styled_paragraph(doc, daylight_text(daylight, profile.daylight_place), 'Daylight Note')
+        if profile.daylight_space_after != REPORT_STYLES['Daylight Note'][2]['space_after']:
+            from docx.shared import Pt
+            daylight_paragraph.paragraph_format.space_after = Pt(profile.daylight_space_after)
     except Exception as e:
         raise ValueError(f"An error occurred while adding the daylight paragraph: {e}")
 
-def add_daylight1(doc, month):
-    try:
-        if int(month) == 4 or int(month) == 9:
-            daylight_paragraph = doc.add_paragraph("Times shown in bold have been adjusted for Chatham Islands Daylight Time")
-        elif int(month) in [1, 2, 3, 10, 11, 12]:
-            daylight_paragraph = doc.add_paragraph("Times listed are Chatham Islands Daylight Time")
-        else:
-            daylight_paragraph = doc.add_paragraph("Times listed are Chatham Islands Standard Time")
-        daylight_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        daylight_run = daylight_paragraph.runs[0]
-        daylight_run.font.size = Pt(10)
-        daylight_run.font.name = 'Arial'
-        daylight_paragraph.paragraph_format.space_after = Pt(2)  # Reduce spacing after the title
-    except Exception as e:
-        raise ValueError(f"An error occurred while adding the Chatham Islands daylight paragraph: {e}")
-
 def add_copyright(doc):
     try:
-        copyright_paragraph = doc.add_paragraph("Crown Copyright Reserved")
-        copyright_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        copyright_run = copyright_paragraph.runs[0]
-        copyright_run.font.size = Pt(10)
-        copyright_run.font.name = 'Arial'
-        copyright_paragraph.paragraph_format.space_after = Pt(0)  # Reduce spacing after the title
+        add_styled_paragraph(doc, "Crown Copyright Reserved", 'Copyright')
     except Exception as e:
         raise ValueError(f"An error occurred while adding the copyright paragraph: {e}")
 
+# Named styles of the report, defined once per document so paragraphs and runs only
+# refer to a style: name -> (style type, font settings, paragraph format settings).
+# Sizes and spacing are in points, colours are RGB and alignment and line spacing are
+# python-docx enum member names, so the native PDF renderer can use them without python-docx
+REPORT_STYLES = {
+    'Report Title': ('paragraph', {'bold': True}, {'alignment': 'CENTER', 'space_after': 2}),
+    'Station Name': ('paragraph', {'size': 20, 'bold': True, 'color': (20, 171, 155)},
+                     {'alignment': 'CENTER', 'space_after': 0}),
+    'Coordinates': ('paragraph', {}, {'alignment': 'CENTER', 'space_after': 0}),
+    'Month Heading': ('paragraph', {'size': 20, 'bold': True, 'color': (20, 171, 155)},
+                      {'alignment': 'CENTER', 'space_before': 0, 'space_after': 0}),
+    'Condition': ('paragraph', {}, {'alignment': 'CENTER', 'space_after': 5}),
+    'Caution': ('paragraph', {'size': 8.5},
+                {'alignment': 'CENTER', 'space_before': 5, 'space_after': 2}),
+    'Daylight Note': ('paragraph', {}, {'alignment': 'CENTER', 'space_after': 3}),
+    'Copyright': ('paragraph', {}, {'alignment': 'CENTER', 'space_after': 0}),
+    'Tide Header': ('paragraph', {}, {'space_before': 0, 'space_after': 5}),
+    'Tide Date': ('paragraph', {},
+                  {'alignment': 'CENTER', 'line_spacing_rule': 'SINGLE', 'space_after': 0}),
+    'Tide Cell': ('paragraph', {}, {'line_spacing_rule': 'SINGLE', 'space_after': 0}),
+    'Date Number': ('character', {'size': 22, 'bold': True}, {}),
+    'Weekday': ('character', {'size': 11}, {}),
+    'Tide Time': ('character', {'size': 10}, {}),
+    'Tide Height': ('character', {'size': 10}, {}),
+    'Daylight Time': ('character', {'size': 10, 'bold': True}, {}),  # times and heights in daylight time
+    'Web Link': ('character', {'color': (0, 0, 255), 'underline': True}, {}),
+}
+
+# Style ids, as written in the document XML
+STYLE_IDS = {name: name.replace(' ', '') for name in REPORT_STYLES}
+
+
+def add_report_styles(document):
+    """
+    Define the named report styles (REPORT_STYLES) in a document.
+
+    Args:
+        document (Document): The Word document object.
+    """
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.shared import Pt, RGBColor
+
+    styles = document.styles
+    for name, (style_type, font, paragraph_format) in REPORT_STYLES.items():
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH if style_type == 'paragraph' else WD_STYLE_TYPE.CHARACTER)
+        if style_type == 'paragraph':
+            style.base_style = styles['Normal']
+        for setting, value in font.items():
+            if setting == 'color':
+                style.font.color.rgb = RGBColor(*value)
+            else:
+                setattr(style.font, setting, Pt(value) if setting == 'size' else value)
+        for setting, value in paragraph_format.items():
+            if setting == 'alignment':
+                value = getattr(WD_ALIGN_PARAGRAPH, value)
+            elif setting == 'line_spacing_rule':
+                value = getattr(WD_LINE_SPACING, value)
+            else:
+                value = Pt(value)
+            setattr(style.paragraph_format, setting, value)
+
+    # Keep the month heading in the document outline, as the Heading 1 it replaces
+    outline_level = OxmlElement('w:outlineLvl')
+    outline_level.set(qn('w:val'), '0')
+    styles['Month Heading'].element.get_or_add_pPr().append(outline_level)
+
+
+def set_paragraph_style(paragraph, style):
+    """Give a paragraph a named report style (set by id, python-docx would look the name up every call)."""
+    paragraph._p.style = STYLE_IDS[style]
+
+
+def add_styled_paragraph(doc, text, style):
+    """Add a paragraph with a named report style."""
+    paragraph = doc.add_paragraph(text)
+    set_paragraph_style(paragraph, style)
+    return paragraph
+
+
+def add_styled_run(paragraph, text, style):
+    """Add a run with a named report character style (None for the paragraph style)."""
+    run = paragraph.add_run(text)
+    if style:
+        run._r.style = STYLE_IDS[style]
+    return run
+
+
+def new_report_document():
+    """Create an empty Word document with the report margins, Normal font and named styles."""
+    import_deferred('docx')
+    from docx import Document
+    from docx.shared import Mm, Pt
 
-def save_to_word(file_info, grouped_data, output_path, linz_logo_path):
-    # Add region name and coordinates
-    # Fix region name macrons as Māori
-    # when UTF-8 encoded text is incorrectly decoded using single-byte encoding such as Latin-1 or Windows-1252."
-    region_name = file_info[1]
-    fixed = region_name.encode('Windows-1252').decode('utf-8')
-    region_name = fixed
-    Lat = (file_info[2]).replace('Â', '')
-    Long = (file_info[3]).replace('Â', '')
-
-    coordinates = f"Lat. {Lat} Long. {Long}"
-    """Save grouped data to a Word document."""
     document = Document()
     style = document.styles['Normal']
 
@@ -441,375 +1421,142 @@ def save_to_word(file_info, grouped_data, output_path, linz_logo_path):
     font = style.font
     font.name = 'Arial'  # Set font to Arial
     font.size = Pt(10)  # Set font size to 12
-    
+    add_report_styles(document)
+    return document
+
+
+def add_tide_table(document, headers):
+    """
+    Add the empty 9x12 tide table: a header row and 8 day rows of 4 blocks.
+
+    Args:
+        document (Document): The Word document object.
+        headers (list): The 12 header cell texts.
+
+    Returns:
+        Table: The new table.
+    """
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
+
+    table = document.add_table(rows=9, cols=12)
+    # Center the table on the page
+    table.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    # table.style = 'Table Grid'
+    hdr_cells = table.rows[0].cells
+
+    # Set column widths
+    # for col in table.columns:
+    #     for cell in col.cells:
+    #         cell.width = Pt(50)
+
+    for i, header in enumerate(headers):
+        hdr_cells[i].text = header
+        set_paragraph_style(hdr_cells[i].paragraphs[0], 'Tide Header')
+
+    # Set row height for table rows starting from row number 2 (index 1)
+    for tbl_row in table.rows[1:]:
+        tbl_row.height = Pt(55)
+        tbl_row.height_rule = 1  # 1 = At least, 2 = Exactly (optional, can use 1 for "at least")
+    return table
+
+
+def save_to_word(tide_table, month_pages, output_path, linz_logo_path, daylight_flags=None, dst_policy=None,
+                 profile=None, stages=None):
+    # Add region name and coordinates
+    # Fix region name macrons as Māori
+    # when UTF-8 encoded text is incorrectly decoded using single-byte encoding such as Latin-1 or Windows-1252."
+    region_name = station_region_name(tide_table.file_info)
+    Lat = (tide_table.file_info[2]).replace('Â', '')
+    Long = (tide_table.file_info[3]).replace('Â', '')
+
+    coordinates = f"Lat. {Lat} Long. {Long}"
+    """Save grouped data to a Word document."""
+    # Page layout of the station (title, condition line, columns, daylight wording, caution)
+    if profile is None:
+        profile = station_profile(DEFAULT_PROFILES, tide_table.file_info)
+    # Tag every tide event as standard or daylight time in one pass
+    if daylight_flags is None:
+        daylight_flags = classify_daylight_time(tide_table, profile.zone)
+        resolve_daylight_ambiguities(tide_table, daylight_flags, dst_policy or DEFAULT_DST_POLICY, region_name)
+
+    document = new_report_document()
+    from docx.shared import Pt
+
     # Add grouped data, each month on a separate page
     first_page = True  # Flag to track the first page
-    for month, rows in grouped_data.items():
+    logo_drawing = None  # Logo added on the first page, copied onto the others
+    for page in month_pages:
+        month, year = page.month, page.year
         if not first_page:
             document.add_page_break()  # Add a page break for each month
         first_page = False  # Set the flag to False after the first page
 
-        add_top_table(document, linz_logo_path)
-        if region_name == "Te Aumiti / French Pass" or region_name == "Tory Channel / Kura Te Au Entrance":
-            add_title1(document)
-        else:
-            add_title(document)
+        logo_drawing = add_top_table(document, linz_logo_path, logo_drawing)
+        add_title(document, profile.title)
         add_header(document, region_name)
         add_coordinates(document, coordinates)
-        add_month_heading(document, month, rows)
-        if region_name == "Owenga - Chatham Island" or region_name == "Kaingaroa - Chatham Island" or region_name == "Waitangi - Chatham Island":
-            add_condition1(document)
-        elif region_name == "Te Aumiti / French Pass" or region_name == "Tory Channel / Kura Te Au Entrance":
-            add_condition(document)
-        else:
-            add_condition2(document)
-        
+        add_month_heading(document, month, year)
+        add_condition(document, profile.condition)
+
         # Add spacing before the table
         document.add_paragraph().paragraph_format.space_after = Pt(1)
 
         # Add data table
-        table = document.add_table(rows=9, cols=12)
-        # Center the table on the page
-        table.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        # table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        if region_name == "Te Aumiti / French Pass" or region_name == "Tory Channel / Kura Te Au Entrance":
-            headers = ['', 'Time', 'Dir', '', 'Time', 'Dir', '', 'Time', 'Dir', '', 'Time', 'Dir']
-        else:
-            headers = ['', 'Time', 'm', '', 'Time', 'm', '', 'Time', 'm', '', 'Time', 'm']
-
-        # Set column widths
-        # for col in table.columns:
-        #     for cell in col.cells:
-        #         cell.width = Pt(50)
-
-        for i, header in enumerate(headers):
-            hdr_cells[i].text = header
-            for paragraph in hdr_cells[i].paragraphs:
-                paragraph.paragraph_format.space_after = Pt(5)  # Reduce spacing under the header
-                paragraph.paragraph_format.space_before = Pt(0)  # Reduce spacing above the header
-                paragraph.paragraph_format._line_spacing_rule = 0  # Set line spacing to single
-                for run in paragraph.runs:
-                    run.font.size = Pt(10)  # Set header font size to 10
-        
-        
-        # Add data rows
-        for row in rows:
-            # print(row)  # Print the row for debuggin
-
-            # Extract date, day, and rest of the data from the row
-            date = row[0]  # Assuming the first column is the date
-            day = row[1]   # Assuming the second column is the day
-            rest = row[4:] # The rest of the columns
-            year = int(rows[0][3])
-
-            if int(month) == 4 and int(date) == 1:
-                start_dst, end_dst = find_new_zealand_daylight_saving_time(year)  # Call the function to find daylight saving time
-                # print(f"Daylight Saving Time starts ends on: {end_dst}")  # Print the start and end dates
-                # print(f"Year: {year}, Month: {month}, Day: {day}")  # Print the year, month, and day for debugging
-                end_dst_day = end_dst.day  # Extract the day number from the datetime object
-                # print(f"End DST Day: {end_dst_day}")  # Print the extracted day number
-
-            elif int(month) == 9 and int(date) == 1:
-                start_dst, end_dst = find_new_zealand_daylight_saving_time(year)  # Call the function to find daylight saving time
-                # print(f"Daylight Saving Time starts on: {start_dst}")  # Print the start and end dates
-                # print(f"Year: {year}, Month: {month}, Day: {day}")  # Print the year, month, and day for debugging
-                start_dst_day = start_dst.day  # Extract the day number from the datetime object
-                # print(f"Start DST Day: {start_dst_day}")  # Print the extracted day number
-
-            for idx, row_date in enumerate(range(1, 9)):  # Changed range to 1 to 9 for 8 days
-                if date == str(row_date):
-                    # Ensure the table has enough rows
-                    while len(table.rows) <= idx + 1:
-                        table.add_row()
-                    # Fill the first column with the first 8 days
-                    target_row = table.rows[idx + 1].cells
-                    target_row[0].text = f"{date}"
-                    run_date = target_row[0].paragraphs[0].runs[0]
-                    run_date.font.size = Pt(22)
-                    run_date.font.bold = True  # Make the date font bold
-                    run_day = target_row[0].paragraphs[0].add_run(f"\n{day}")
-                    run_day.font.size = Pt(11)
-                    target_row[0].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER  # Align center
-                    target_row[0].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[0].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-
-                    target_row[1].text = "\n".join([rest[i] for i in range(0, len(rest), 2)])
-                    target_row[1].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[1].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[1].paragraphs[0].paragraph_format.space_after = Pt(0)
-
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[1].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-                        target_row[1].paragraphs[0].paragraph_format.space_after = Pt(0)
-
-                    elif int(month) == 4 and int(date) < end_dst_day:
-                        # print(f"Date: {date}, Month: {month}, Day: {day}", {end_dst_day})  # Print the year, month, and day for debugging
-                        target_row[1].paragraphs[0].runs[0].font.bold = True  # Make font bold for April
-                        target_row[1].paragraphs[0].paragraph_format.space_after = Pt(0)
-
-                    elif int(month) == 4 and int(date) == end_dst_day:
-                        target_row[1].paragraphs[0].runs[0].font.bold = False
-                        bold_paragraph = target_row[1].paragraphs[0]
-                        # Calculate rows where time is before 3 AM
-                        times = [rest[i] for i in range(0, len(rest), 2)]
-                        before_3am_count = sum(1 for time in times if time and int(time.split(':')[0]) < 3)
-                        # Update the text for the cell based on the row count
-                        ontimes = [rest[i] for i in range(0, len(rest), 2)][:before_3am_count] #range(0 to 1 for update the tide and direction)
-                        remaining_times = [rest[i] for i in range(0, len(rest), 2)][before_3am_count:]
-
-
-                        # Check if the first time is between 1:59 and 3:00 and prompt the user
-                        no_condition = False  # Initialize no_condition variable
-
-                        if times and times[0]:
-                            try:
-                                hour, minute = map(int, times[0].split(':'))
-                                if (hour == 1 and minute >= 59) or (hour == 2) or (hour == 3 and minute == 0):
-                                    root = Tk()
-                                    root.withdraw()  # Hide the main window
-                                    result = messagebox.askyesno(
-                                        f"Confirmation Required {region_name}",
-                                        f"{date}/{month}/{year} {times[0]}.\nIs this Daylight time?\n\nClick 'Yes' to NZDT, or 'No' to NZST.",
-                                    )
-                                    root.destroy()
-                                    if result:
-                                        # Yes condition: proceed as normal
-                                        pass
-                                    else:
-                                        # No condition: skip or handle as needed
-                                        no_condition = True
-                                        # continue
-                            except Exception as e:
-                                print(f"Error parsing time '{times[0]}': {e}")
-
-                        if ontimes:
-
-                            bold_paragraph.clear()  # Clear existing text
-                            bold_paragraph.runs.clear()  # Clear existing runs
-                            run = bold_paragraph.add_run("\n".join(ontimes))
-                            run.font.size = Pt(10)
-
-                            if no_condition == True:
-                                run.font.bold = False
-                            else:
-                                run.font.bold = True
-
-                            for remaining_time in remaining_times:
-                                if remaining_time:
-                                    bold_paragraph.add_run(f"\n{remaining_time}").font.bold = False  # Make font bold
-                                    bold_paragraph.runs[-1].font.size = Pt(10)  # Set font size for the remaining times
-                                    bold_paragraph.paragraph_format.line_spacing_rule = 0  # Set line spacing to
-                                    bold_paragraph.paragraph_format.space_after = Pt(1)  # Reduce spacing after the paragraph
-        
-
-                    target_row[2].text = "\n".join([rest[i] for i in range(1, len(rest), 2)])
-                    target_row[2].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[2].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[2].paragraphs[0].paragraph_format.space_after = Pt(1)  ### Reduce spacing after the paragraph
-
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[2].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-
-                    elif int(month) == 4 and int(date) < end_dst_day:
-                        # print(f"Date: {date}, Month: {month}, Day: {day}", {end_dst_day})  # Print the year, month, and day for debugging
-                        target_row[2].paragraphs[0].runs[0].font.bold = True  # Make font bold for April
-                        target_row[2].paragraphs[0].paragraph_format.space_after = Pt(1) ###
-
-                    elif int(month) == 4 and int(date) == end_dst_day:
-                        target_row[2].paragraphs[0].runs[0].font.bold = False
-                        bold_paragraph = target_row[2].paragraphs[0]
-                        # Calculate rows where time is before 3 AM
-                        times = [rest[i] for i in range(0, len(rest), 2)]
-                        before_3am_count = sum(1 for time in times if time and int(time.split(':')[0]) < 3)
-                        # Update the text for the cell based on the row count
-                        ontimes = [rest[i] for i in range(1, len(rest), 2)][:before_3am_count] #range(0 to 1 for update the tide and direction)
-                        remaining_times = [rest[i] for i in range(1, len(rest), 2)][before_3am_count:]
-
-                        if ontimes:
-
-                            bold_paragraph.clear()  # Clear existing text
-                            bold_paragraph.runs.clear()  # Clear existing runs
-                            run = bold_paragraph.add_run("\n".join(ontimes))
-                            run.font.size = Pt(10)
-
-                            if no_condition == True:
-                                run.font.bold = False
-                            else:
-                                run.font.bold = True
-
-                            for remaining_time in remaining_times:
-                                if remaining_time:
-                                    bold_paragraph.add_run(f"\n{remaining_time}").font.bold = False  # Make font bold
-                                    bold_paragraph.runs[-1].font.size = Pt(10)  # Set font size for the remaining times
-                                    bold_paragraph.paragraph_format.line_spacing_rule = 0  # Set line spacing to
-                                    bold_paragraph.paragraph_format.space_after = Pt(1)  # Reduce spacing after the paragraph
-                       
-        
-
-            for idx, row_date in enumerate(range(9, 17)):  # Changed range to 9 to 16 for the next 8 days
-                if date == str(row_date):
-                    # Fill the second column with the next 8 days
-                    target_row = table.rows[idx + 1].cells  # Adjust row index for the second column
-                    target_row[3].text = f"{date}"
-                    run_date = target_row[3].paragraphs[0].runs[0]
-                    run_date.font.size = Pt(22)
-                    run_date.font.bold = True  # Make the date font bold
-                    run_day = target_row[3].paragraphs[0].add_run(f"\n{day}")
-                    run_day.font.size = Pt(11)
-                    target_row[3].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER  # Align center
-                    target_row[3].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[3].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    target_row[4].text = "\n".join([rest[i] for i in range(0, len(rest), 2)])
-                    target_row[4].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[4].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[4].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[4].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-                    
-                    target_row[5].text = "\n".join([rest[i] for i in range(1, len(rest), 2)])
-                    target_row[5].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[5].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[5].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[5].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-
-            for idx, row_date in enumerate(range(17, 25)):  # Changed range to 17 to 24 for the next 8 days
-                if date == str(row_date):
-                    # Fill the third column with the next 8 days
-                    target_row = table.rows[idx + 1].cells  # Adjust row index for the third column
-                    target_row[6].text = f"{date}"
-                    run_date = target_row[6].paragraphs[0].runs[0]
-                    run_date.font.size = Pt(22)
-                    run_date.font.bold = True  # Make the date font bold
-                    run_day = target_row[6].paragraphs[0].add_run(f"\n{day}")
-                    run_day.font.size = Pt(11)
-                    target_row[6].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER  # Align center
-                    target_row[6].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[6].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    target_row[7].text = "\n".join([rest[i] for i in range(0, len(rest), 2)])
-                    target_row[7].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[7].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[7].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[7].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-                    
-                    target_row[8].text = "\n".join([rest[i] for i in range(1, len(rest), 2)])
-                    target_row[8].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[8].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[8].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[8].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-
-            for idx, row_date in enumerate(range(25, 32)):  # Changed range to 25 to 31 for the next 8 days
-                if date == str(row_date):
-                    # Fill the fourth column with the next 8 days
-                    target_row = table.rows[idx + 1].cells  # Adjust row index for the fourth column
-                    target_row[9].text = f"{date}"
-                    run_date = target_row[9].paragraphs[0].runs[0]
-                    run_date.font.size = Pt(22)
-                    run_date.font.bold = True  # Make the date font bold
-                    run_day = target_row[9].paragraphs[0].add_run(f"\n{day}")
-                    run_day.font.size = Pt(11)
-                    target_row[9].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER  # Align center
-                    target_row[9].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[9].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-
-                    target_row[10].text = "\n".join([rest[i] for i in range(0, len(rest), 2)])
-                    target_row[10].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[10].paragraphs[0].paragraph_format.line_spacing_rule = 0  # Set line spacing to single
-                    target_row[10].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-                    
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[10].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-                    elif int(month) == 9 and int(date) > start_dst_day:
-                        # print(f"Date: {date}, Month: {month}, Day: {day}", {start_dst_day})
-                        target_row[10].paragraphs[0].runs[0].font.bold = True  # Make font bold for September
-                    elif int(month) == 9 and int(date) == start_dst_day:
-        
-                        target_row[10].paragraphs[0].runs[0].font.bold = True  # Make font bold for September on the start of DST
-        
-                        # Calculate rows where time is after 2 AM
-                        times = [rest[i] for i in range(0, len(rest), 2)]
-                        before_2am_count = sum(1 for time in times if time and int(time.split(':')[0]) < 2)
-
-                        # Update the text for the cell based on the DTS count
-                        bold_paragraph = target_row[10].paragraphs[0]
-
-                        ontimes = [rest[i] for i in range(0, len(rest), 2)][:before_2am_count]
-                        remaining_times = [rest[i] for i in range(0, len(rest), 2)][before_2am_count:]
-
-                        if ontimes:
-                            bold_paragraph.clear()  # Clear existing text
-                            bold_paragraph.runs.clear()  # Clear existing runs
-                            run = bold_paragraph.add_run("\n".join(ontimes))
-                            run.font.size = Pt(10)
-
-                            for remaining_time in remaining_times:
-                                if remaining_time:
-                                    bold_paragraph.add_run(f"\n{remaining_time}").font.bold = True  # Make font bold
-                                    bold_paragraph.runs[-1].font.size = Pt(10)  # Set font size for the remaining times
-                                    bold_paragraph.paragraph_format.line_spacing_rule = 0  # Set line spacing to
-                                    bold_paragraph.paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-
-                    target_row[11].text = "\n".join([rest[i] for i in range(1, len(rest), 2)])
-                    target_row[11].paragraphs[0].runs[0].font.size = Pt(10)
-                    target_row[11].paragraphs[0].paragraph_format.line_spacing_rule = 0
-                    target_row[11].paragraphs[0].paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-
-                    if int(month) in [1, 2, 3, 10, 11, 12]:
-                        target_row[11].paragraphs[0].runs[0].font.bold = True  # Make font bold for specific months
-                    elif int(month) == 9 and int(date) > start_dst_day:
-                        # print(f"Date: {date}, Month: {month}, Day: {day}", {start_dst_day})
-                        target_row[11].paragraphs[0].runs[0].font.bold = True  # Make font bold for September
-
-                    elif int(month) == 9 and int(date) == start_dst_day:
-
-                        target_row[11].paragraphs[0].runs[0].font.bold = True
-                        bold_paragraph = target_row[11].paragraphs[0]
-                        # Calculate rows where time is after 2 AM
-                        times = [rest[i] for i in range(0, len(rest), 2)]
-                        before_2am_count = sum(1 for time in times if time and int(time.split(':')[0]) < 2)
-                        
-                        ontimes = [rest[i] for i in range(1, len(rest), 2)][:before_2am_count] #range(0 to 1 for update the tide and direction)
-                        remaining_times = [rest[i] for i in range(1, len(rest), 2)][before_2am_count:]
-
-                        # print(f"ontimes: {ontimes}, remaining_times: {remaining_times}")  # Debugging output
-
-                        if ontimes:
-                            bold_paragraph.clear()  # Clear existing text
-                            bold_paragraph.runs.clear()  # Clear existing runs
-                            run = bold_paragraph.add_run("\n".join(ontimes))
-                            run.font.size = Pt(10)
-
-                            for remaining_time in remaining_times:
-                                if remaining_time:
-                                    bold_paragraph.add_run(f"\n{remaining_time}").font.bold = True  # Make font bold
-                                    bold_paragraph.runs[-1].font.size = Pt(10)  # Set font size for the remaining times
-                                    bold_paragraph.paragraph_format.line_spacing_rule = 0  # Set line spacing to
-                                    bold_paragraph.paragraph_format.space_after = Pt(0)  # Reduce spacing after the paragraph
-
-            # # Set row height for table rows starting from row number 2 (index 1)
-            for tbl_row in table.rows[1:]:
-                tbl_row.height = Pt(55)
-                tbl_row.height_rule = 1  # 1 = At least, 2 = Exactly (optional, can use 1 for "at least")
+        table = add_tide_table(document, ['', 'Time', profile.unit] * 4)
+
+        # Add data rows, each day goes straight to its slot in the table
+        for date, row in enumerate(page.slots, start=1):
+            if row is None:
+                continue
+
+            # Extract the day and the tide events from the row
+            day = WEEKDAY_CODES[tide_table.weekday[row]]
+            times = tide_table.time_text(row)
+            values = tide_table.value_text(row)
+            minutes = tide_table.event_minutes(row)
+
+            # The table holds 4 blocks of 8 days (1-8, 9-16, 17-24 and 25-31), 3 columns each
+            block, offset = divmod(date - 1, 8)
+            target_row = table.rows[offset + 1].cells
+            date_cell, time_cell, value_cell = target_row[3 * block:3 * block + 3]
+
+            date_paragraph = date_cell.paragraphs[0]
+            set_paragraph_style(date_paragraph, 'Tide Date')
+            add_styled_run(date_paragraph, f"{date}", 'Date Number')
+            add_styled_run(date_paragraph, f"\n{day}", 'Weekday')
+
+            # Daylight time is shown in bold, as tagged by classify_daylight_time
+            row_kind = daylight_flags.rows[row]
+            first = row * MAX_EVENTS
+            event_flags = daylight_flags.events[first:first + len(times)]
+            count = 0
+            if row_kind == ROW_DST_ENDS:
+                # Daylight time ends: the early times are still daylight time
+                count = sum(1 for flag in event_flags if flag == DAYLIGHT_TIME)
+            elif row_kind == ROW_DST_STARTS:
+                # Daylight time starts: the early times are still standard time
+                count = sum(1 for flag, minute in zip(event_flags, minutes)
+                            if flag == STANDARD_TIME and minute != MISSING_TIME)
+
+            for cell, texts, style in ((time_cell, times, 'Tide Time'), (value_cell, values, 'Tide Height')):
+                paragraph = cell.paragraphs[0]
+                set_paragraph_style(paragraph, 'Tide Cell')
+                runs, split = tide_cell_runs(texts, row_kind, count, style)
+                for text, run_style in runs:
+                    add_styled_run(paragraph, text, run_style)
+                if cell is value_cell and block == 0:
+                    paragraph.paragraph_format.space_after = Pt(1)
+                if split:
+                    paragraph.paragraph_format.space_after = Pt(1) if row_kind == ROW_DST_ENDS else Pt(0)
 
         # Add spacing after the table
         document.add_paragraph().paragraph_format.space_after = Pt(12)
 
-        if region_name == "Te Aumiti / French Pass" or region_name == "Tory Channel / Kura Te Au Entrance":
-            add_caution(document)
+        if profile.caution:
+            add_caution(document, profile.caution)
 
-        if region_name == "Owenga - Chatham Island" or region_name == "Kaingaroa - Chatham Island" or region_name == "Waitangi - Chatham Island":
-            add_daylight1(document, month)  # Add Chatham Islands daylight line after the table
-        else:
-            add_daylight(document, month)  # Add NZ daylight line after the table
+        add_daylight(document, page_daylight_mode(daylight_flags, page), profile)  # Add daylight line after the table
 
         add_copyright(document)  # Add copyright line after the table
     
@@ -818,26 +1565,961 @@ def save_to_word(file_info, grouped_data, output_path, linz_logo_path):
         os.remove(output_path)
     
     # Save the document
-    document.save(output_path)
+    with timed_stage(stages, 'docx_save'):
+        document.save(output_path)
+
+# Page templates built once per process, keyed by logo content hash and layout profile
+PAGE_TEMPLATES = {}
+
+# WordprocessingML of the tide table cells, as save_to_word writes them
+DATE_CELL_FORMAT = f'<w:pPr><w:pStyle w:val="{STYLE_IDS["Tide Date"]}"/></w:pPr>'
+TIDE_CELL_FORMAT = {None: f'<w:pPr><w:pStyle w:val="{STYLE_IDS["Tide Cell"]}"/></w:pPr>'}
+TIDE_CELL_FORMAT.update({space: f'<w:pPr><w:pStyle w:val="{STYLE_IDS["Tide Cell"]}"/><w:spacing w:after="{space * 20}"/></w:pPr>'
+                         for space in (0, 1)})  # space after in points (written in twentieths of a point)
+RUN_FORMAT = {name: f'<w:rPr><w:rStyle w:val="{style_id}"/></w:rPr>' for name, style_id in STYLE_IDS.items()}
+EMPTY_CELL = '<w:p/>'
+
+
+def build_page_template(linz_logo_path, profile):
+    """
+    Build the template of one month page, once per process and logo.
+
+    The page is made with the same functions as save_to_word, with placeholder
+    station and month text, an empty tide table and the three daylight lines.
+    It is kept as a saved document so the styles, margins and logo image come
+    with it.
+
+    Args:
+        linz_logo_path (str): Configured logo path.
+        profile (LayoutProfile): Page layout of the station.
+
+    Returns:
+        tuple: The template document contents, a dict with the body index of each
+        part of the page that is filled per station or per month, and the tide
+        table scaffold (see tide_table_scaffold).
+    """
+    key = (load_logo(linz_logo_path).sha256, profile)
+    if key in PAGE_TEMPLATES:
+        return PAGE_TEMPLATES[key]
+
+    document = new_report_document()
+    from docx.shared import Pt
+
+    body = document.element.body
+    parts = {}
+    add_top_table(document, linz_logo_path)
+    add_title(document, profile.title)
+    parts['header'] = len(body) - 1
+    add_header(document, "Region")
+    parts['coordinates'] = len(body) - 1
+    add_coordinates(document, "Lat. Long.")
+    parts['month'] = len(body) - 1
+    add_month_heading(document, 1, 2000)
+    add_condition(document, profile.condition)
+    document.add_paragraph().paragraph_format.space_after = Pt(1)
+    parts['table'] = len(body) - 1
+    add_tide_table(document, ['', 'Time', profile.unit] * 4)
+    document.add_paragraph().paragraph_format.space_after = Pt(12)
+    if profile.caution:
+        add_caution(document, profile.caution)
+    for daylight in ('daylight', 'standard', 'adjusted'):
+        parts[daylight] = len(body) - 1
+        add_daylight(document, daylight, profile)
+    add_copyright(document)
+
+    template = io.BytesIO()
+    document.save(template)
+    scaffold = tide_table_scaffold(body[parts['table']])
+    PAGE_TEMPLATES[key] = (template.getvalue(), parts, scaffold)
+    return PAGE_TEMPLATES[key]
+
+
+def set_paragraph_text(paragraph, text):
+    """Replace the text of a single-run paragraph element."""
+    from docx.oxml.ns import qn
+
+    text_element = paragraph.find(qn('w:r')).find(qn('w:t'))
+    text_element.text = text
+    if len(text.strip()) < len(text):
+        text_element.set(qn('xml:space'), 'preserve')
+    else:
+        text_element.attrib.pop(qn('xml:space'), None)
+
+
+def run_xml(text, run_format):
+    """Return the XML of a run as python-docx writes it, with line breaks for newlines."""
+    from xml.sax.saxutils import escape
+
+    xml = ['<w:r>', run_format]
+    for index, line in enumerate(text.split('\n')):
+        if index:
+            xml.append('<w:br/>')
+        if len(line.strip()) < len(line):
+            xml.append(f'<w:t xml:space="preserve">{escape(line)}</w:t>')
+        elif line:
+            xml.append(f'<w:t>{escape(line)}</w:t>')
+    xml.append('</w:r>')
+    return ''.join(xml)
+
+
+def tide_cell_runs(texts, row_kind, count, style):
+    """
+    Return the runs of a time or height cell.
+
+    Args:
+        texts (list): The lines of the cell.
+        row_kind (int): ROW_* daylight kind of the day.
+        count (int): On a changeover day, the number of lines before the changeover.
+        style (str): Character style of the lines in standard time ('Tide Time' or 'Tide Height').
+
+    Returns:
+        tuple: A list of (text, style) runs, and whether the cell was split at a changeover.
+    """
+    joined = "\n".join(texts)
+    if row_kind == ROW_DAYLIGHT:
+        return [(joined, 'Daylight Time')], False
+    if row_kind == ROW_STANDARD:
+        return [(joined, style)], False
+
+    # Daylight time ends: the early lines are still daylight time (bold), the rest are not.
+    # Daylight time starts: the early lines are still standard time, the rest are bold.
+    first_style, rest_style = ('Daylight Time', style) if row_kind == ROW_DST_ENDS else (style, 'Daylight Time')
+    head = texts[:count]
+    if not head:
+        return [(joined, rest_style)], False
+    runs = [("\n".join(head), first_style)]
+    runs.extend((f"\n{text}", rest_style) for text in texts[count:] if text)
+    return runs, len(runs) > 1
+
+
+def tide_table_scaffold(table):
+    """
+    Split the XML of an empty tide table around its day cell paragraphs.
+
+    Args:
+        table (element): The w:tbl element made by add_tide_table.
+
+    Returns:
+        tuple: The XML up to the first day row (table properties, grid and header
+        row), the XML of a day row split into 13 pieces around its 12 cell
+        paragraphs, and the closing XML.
+    """
+    from lxml import etree
+
+    xml = etree.tostring(table, encoding='unicode')
+    first = xml.index('<w:tr>', xml.index('<w:tr>') + 1)
+    second = xml.index('<w:tr>', first + 1)
+    last = xml.rindex('</w:tr>') + len('</w:tr>')
+    return xml[:first], xml[first:second].split(EMPTY_CELL), xml[last:]
+
+
+def tide_table_cells(tide_table, page, daylight_flags):
+    """
+    Yield the content of the filled day cells of a month, as save_to_word lays them out.
+
+    Args:
+        tide_table (TideTable): The station data.
+        page (MonthPage): The month, with the table row of each day.
+        daylight_flags (DaylightFlags): Daylight time tags of the station.
+
+    Yields:
+        tuple: The day row (0-7) and column (0-11) of the cell, its paragraph style,
+        (text, character style) runs and space after in points (None for the style's).
+    """
+    for date, row in enumerate(page.slots, start=1):
+        if row is None:
+            continue
+
+        times = tide_table.time_text(row)
+        values = tide_table.value_text(row)
+        block, offset = divmod(date - 1, 8)
+        day = WEEKDAY_CODES[tide_table.weekday[row]]
+        yield offset, 3 * block, 'Tide Date', [(f"{date}", 'Date Number'), (f"\n{day}", 'Weekday')], None
+
+        # Count the events before a changeover, as in save_to_word
+        row_kind = daylight_flags.rows[row]
+        first = row * MAX_EVENTS
+        event_flags = daylight_flags.events[first:first + len(times)]
+        count = 0
+        if row_kind == ROW_DST_ENDS:
+            count = sum(1 for flag in event_flags if flag == DAYLIGHT_TIME)
+        elif row_kind == ROW_DST_STARTS:
+            count = sum(1 for flag, minute in zip(event_flags, tide_table.event_minutes(row))
+                        if flag == STANDARD_TIME and minute != MISSING_TIME)
+
+        value_space = 1 if block == 0 else None
+        for column, texts, style, space in ((1, times, 'Tide Time', None), (2, values, 'Tide Height', value_space)):
+            runs, split = tide_cell_runs(texts, row_kind, count, style)
+            if split:
+                space = 1 if row_kind == ROW_DST_ENDS else 0
+            yield offset, 3 * block + column, 'Tide Cell', runs, space
+
+
+def tide_table_xml(scaffold, tide_table, page, daylight_flags):
+    """
+    Write the tide table of one month straight to WordprocessingML.
+
+    Produces the same table as save_to_word, without going through python-docx
+    for every cell.
+
+    Args:
+        scaffold (tuple): The empty table, see tide_table_scaffold.
+        tide_table (TideTable): The station data.
+        page (MonthPage): The month, with the table row of each day.
+        daylight_flags (DaylightFlags): Daylight time tags of the station.
+
+    Returns:
+        element: The w:tbl element.
+    """
+    from docx.oxml import parse_xml
+
+    head, row_parts, tail = scaffold
+    cells = [[EMPTY_CELL] * 12 for _ in range(8)]
+    for offset, column, style, runs, space in tide_table_cells(tide_table, page, daylight_flags):
+        cell_format = DATE_CELL_FORMAT if style == 'Tide Date' else TIDE_CELL_FORMAT[space]
+        run_xmls = ''.join(run_xml(text, RUN_FORMAT[run_style]) for text, run_style in runs)
+        cells[offset][column] = f'<w:p>{cell_format}{run_xmls}</w:p>'
+
+    xml = [head]
+    for row_cells in cells:
+        xml.append(row_parts[0])
+        for cell, part in zip(row_cells, row_parts[1:]):
+            xml.append(cell)
+            xml.append(part)
+    xml.append(tail)
+    return parse_xml(''.join(xml))
+
+
+def save_to_word_template(tide_table, month_pages, output_path, linz_logo_path, daylight_flags=None, dst_policy=None,
+                          profile=None, stages=None):
+    """
+    Save grouped data to a Word document by copying a pre-built page template.
 
-def convert_to_pdf(docx_path, pdf_path):
+    Produces the same document as save_to_word: the page template is built once
+    per process and layout, each month copies its elements and only the month
+    heading, daylight line and the day cells are filled in. Each finished month
+    is written out to the document part and dropped, so memory use does not grow
+    with the number of months.
+
+    Args:
+        tide_table (TideTable): The station data.
+        month_pages (iterable): MonthPage entries, one page each.
+        output_path (str): Path of the Word document to write.
+        linz_logo_path (str): Configured logo path.
+        daylight_flags (DaylightFlags): Daylight time tags, or None to classify them here.
+        dst_policy (DstPolicy): How to resolve ambiguous daylight saving times.
+        profile (LayoutProfile): Page layout of the station, or None to look it up in the built-in profiles.
+        stages (list): StageTiming list to time writing the document in ('docx_save'), or None.
+    """
+    import_deferred('docx')
+    from docx import Document
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls, qn
+    from lxml import etree
+
+    region_name = station_region_name(tide_table.file_info)
+    if profile is None:
+        profile = station_profile(DEFAULT_PROFILES, tide_table.file_info)
+    if daylight_flags is None:
+        daylight_flags = station_daylight_flags(tide_table, profile, dst_policy)
+
+    template, parts, scaffold = build_page_template(linz_logo_path, profile)
+    document = Document(io.BytesIO(template))
+    body = document.element.body
+    section = body.find(qn('w:sectPr'))
+    master = [child for child in body if child is not section]
+    for child in master:
+        body.remove(child)
+    set_paragraph_text(master[parts['header']], region_name)
+    set_paragraph_text(master[parts['coordinates']], station_coordinates(tide_table.file_info))
+    daylight_lines = {mode: master[parts[mode]] for mode in ('daylight', 'standard', 'adjusted')}
+
+    def page_elements(page_number, page):
+        """Return the body elements of one month page."""
+        mode = page_daylight_mode(daylight_flags, page)
+        elements = [child if index == parts['table'] else copy.deepcopy(child)
+                    for index, child in enumerate(master)
+                    if child not in daylight_lines.values() or child is daylight_lines[mode]]
+
+        # Each copy of the logo gets its own drawing id, all share the one image part
+        doc_pr = elements[0].find('.//' + qn('wp:docPr'))
+        doc_pr.set('id', str(page_number + 1))
+        doc_pr.set('name', f"Picture {page_number + 1}")
+
+        set_paragraph_text(elements[parts['month']], f"{calendar.month_name[page.month]} {page.year}")
+        elements[parts['table']] = tide_table_xml(scaffold, tide_table, page, daylight_flags)
+        if page_number:
+            elements.insert(0, parse_xml(f'<w:p {nsdecls("w")}><w:r><w:br w:type="page"/></w:r></w:p>'))
+        return elements
+
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    with timed_stage(stages, 'docx_save'):
+        # The package with an empty body; its document part is written page by page instead
+        package = io.BytesIO()
+        document.save(package)
+        document_part = document.part.partname.membername
+        head, tail = etree.tostring(document.element, encoding='UTF-8', standalone=True).rsplit(b'<w:sectPr', 1)
+        tail = b'<w:sectPr' + tail
+        try:
+            with zipfile.ZipFile(package) as source, zipfile.ZipFile(output_path, 'w') as target:
+                for info in source.infolist():
+                    if info.filename != document_part:
+                        target.writestr(info, source.read(info))
+                        continue
+                    with target.open(info, 'w') as part:
+                        part.write(head)
+                        for page_number, page in enumerate(month_pages):
+                            # Serialize the page in place, so it gets the namespaces of the whole document
+                            elements = page_elements(page_number, page)
+                            for element in elements:
+                                section.addprevious(element)
+                            xml = etree.tostring(document.element, encoding='UTF-8', standalone=True)
+                            part.write(xml[len(head):len(xml) - len(tail)])
+                            for element in elements:
+                                body.remove(element)
+                        part.write(tail)
+        except OSError as e:
+            raise ValueError(f"An error occurred while writing the Word document: {e}")
+
+
+# Native PDF output, drawn without Word: the Word page (Letter, 15 mm margins) and its metrics
+PDF_PAGE_SIZE = (612.0, 792.0)  # Letter, in points
+PDF_MARGIN = 15 * 72 / 25.4  # 15 mm
+PDF_ASCENT = 0.905  # Arial ascent, as a fraction of the font size
+PDF_LINE = 1.15  # single line spacing of Arial, as a multiple of the font size
+PDF_LINE_MULTIPLE = 1.15  # line spacing of the document default paragraph format
+PDF_SPACE_AFTER = 10  # space after of the document default paragraph format
+PDF_CELL_PADDING = 5.4  # left and right table cell margins
+PDF_TIDE_COLUMN = 43.9  # tide table column width (878 twips)
+PDF_LOGO_WIDTH = 180
+
+# Arial (or a metric-compatible font) with macron support, in search order: regular and bold
+PDF_FONT_FILES = [
+    (os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts', 'arial.ttf'),
+     os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts', 'arialbd.ttf')),
+    ('/usr/share/fonts/truetype/msttcorefonts/Arial.ttf', '/usr/share/fonts/truetype/msttcorefonts/Arial_Bold.ttf'),
+    ('/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+     '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf'),
+]
+
+# Registered PDF font names, bold -> font name, see pdf_fonts
+PDF_FONTS = {}
+
+
+def pdf_fonts(font_files=None):
+    """
+    Register the PDF fonts, once per process.
+
+    Args:
+        font_files (list): Regular and bold TrueType font files, or None to search PDF_FONT_FILES.
+
+    Returns:
+        dict: Font name by bold setting. Falls back to the built-in Helvetica (the
+        Arial metrics, but no macrons) when no TrueType font is found.
+    """
+    if PDF_FONTS:
+        return PDF_FONTS
+    import_deferred('pdf')
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    for regular, bold in [font_files] if font_files else PDF_FONT_FILES:
+        if os.path.exists(regular) and os.path.exists(bold):
+            pdfmetrics.registerFont(TTFont('ReportSans', regular))
+            pdfmetrics.registerFont(TTFont('ReportSans-Bold', bold))
+            PDF_FONTS.update({False: 'ReportSans', True: 'ReportSans-Bold'})
+            return PDF_FONTS
+    if font_files:
+        raise ValueError(f"An error occurred while loading the PDF fonts: font files not found: {', '.join(font_files)}")
+    PDF_FONTS.update({False: 'Helvetica', True: 'Helvetica-Bold'})
+    return PDF_FONTS
+
+
+def pdf_run_format(style, run_style=None):
+    """Return the font, size, colour and underline of a run, from the named report styles."""
+    font = dict(REPORT_STYLES[style][1]) if style in REPORT_STYLES else {}
+    if run_style:
+        font.update(REPORT_STYLES[run_style][1])
+    return (pdf_fonts()[bool(font.get('bold'))], font.get('size', 10), font.get('color', (0, 0, 0)),
+            bool(font.get('underline')))
+
+
+def draw_pdf_paragraph(pdf, left, right, top, style, runs, space_after=None, draw=True):
+    """
+    Draw a paragraph of a named report style, laid out as Word does.
+
+    Args:
+        pdf (Canvas): The PDF canvas.
+        left (float): Left edge of the paragraph.
+        right (float): Right edge of the paragraph.
+        top (float): Top of the paragraph (space before included).
+        style (str): Paragraph style (see REPORT_STYLES), None for the Normal style.
+        runs (list): (text, character style or None, underlined) runs, newlines start a new line.
+        space_after (float): Space after the paragraph in points, None for the style's.
+        draw (bool): False to only measure the paragraph.
+
+    Returns:
+        float: The bottom of the paragraph, space after included.
     """
-    Convert a Word document to a PDF file.
+    settings = REPORT_STYLES[style][2] if style in REPORT_STYLES else {}
+    multiple = 1 if settings.get('line_spacing_rule') == 'SINGLE' else PDF_LINE_MULTIPLE
+    y = top - settings.get('space_before', 0)
+
+    lines = [[]]
+    for text, run_style, underline in runs:
+        for index, piece in enumerate(text.split('\n')):
+            if index:
+                lines.append([])
+            if piece:
+                lines[-1].append((piece, pdf_run_format(style, run_style), underline))
+
+    for line in lines:
+        size = max((run_format[1] for _, run_format, _ in line), default=pdf_run_format(style)[1])
+        if draw:
+            widths = [pdf.stringWidth(text, font, run_size) for text, (font, run_size, _, _), _ in line]
+            x = left
+            if settings.get('alignment') == 'CENTER':
+                x = (left + right - sum(widths)) / 2
+            baseline = y - size * PDF_ASCENT
+            for (text, (font, run_size, color, style_underline), underline), width in zip(line, widths):
+                pdf.setFillColorRGB(*(channel / 255 for channel in color))
+                pdf.setFont(font, run_size)
+                pdf.drawString(x, baseline, text)
+                if underline or style_underline:
+                    pdf.setStrokeColorRGB(*(channel / 255 for channel in color))
+                    pdf.setLineWidth(run_size / 20)
+                    pdf.line(x, baseline - run_size / 10, x + width, baseline - run_size / 10)
+                x += width
+        y -= size * PDF_LINE * multiple
+
+    if space_after is None:
+        space_after = settings.get('space_after', PDF_SPACE_AFTER)
+    return y - space_after
+
+
+def draw_pdf_top_table(pdf, top, logo):
+    """Draw the LINZ logo and contact details at the top of a page, return the bottom of the table."""
+    left, right = PDF_MARGIN, PDF_PAGE_SIZE[0] - PDF_MARGIN
+    middle = (left + right) / 2
+    logo_width, logo_height = logo.getSize()
+    logo_height = PDF_LOGO_WIDTH * logo_height / logo_width
+    contact = [
+        ([("Sourced from ", None, False), ("http://www.linz.govt.nz", 'Web Link', False)], 5),
+        ([("E-mail address ", None, False), ("hydro@linz.govt.nz", 'Web Link', False)], 0),
+    ]
+
+    # Both cells are centred vertically in the row
+    logo_cell = logo_height + PDF_SPACE_AFTER
+    contact_cell = top
+    for runs, space_after in contact:
+        contact_cell = draw_pdf_paragraph(pdf, middle, right, contact_cell, None, runs, space_after, draw=False)
+    contact_cell = top - contact_cell
+    row_height = max(logo_cell, contact_cell)
+
+    pdf.drawImage(logo, left + PDF_CELL_PADDING, top - (row_height - logo_cell) / 2 - logo_height,
+                  PDF_LOGO_WIDTH, logo_height, mask='auto')
+    y = top - (row_height - contact_cell) / 2
+    for runs, space_after in contact:
+        y = draw_pdf_paragraph(pdf, middle + PDF_CELL_PADDING, right - PDF_CELL_PADDING, y, None, runs, space_after)
+    return top - row_height
+
+
+def draw_pdf_tide_table(pdf, top, profile, tide_table, page, daylight_flags):
+    """Draw the tide table of one month, return the bottom of the table."""
+    left = (PDF_PAGE_SIZE[0] - 12 * PDF_TIDE_COLUMN) / 2
+    columns = [(left + column * PDF_TIDE_COLUMN + PDF_CELL_PADDING, left + (column + 1) * PDF_TIDE_COLUMN - PDF_CELL_PADDING)
+               for column in range(12)]
+
+    y = top
+    for (cell_left, cell_right), header in zip(columns, ['', 'Time', profile.unit] * 4):
+        y = min(y, draw_pdf_paragraph(pdf, cell_left, cell_right, top, 'Tide Header', [(header, None, False)]))
+
+    # Day rows are at least 55 pt high and grow with their tallest cell
+    rows = [[] for _ in range(8)]
+    for offset, column, style, runs, space in tide_table_cells(tide_table, page, daylight_flags):
+        rows[offset].append((column, style, runs, space))
+    for cells in rows:
+        row_top, bottom = y, y - 55
+        for column, style, runs, space in cells:
+            cell_left, cell_right = columns[column]
+            runs = [(text, run_style, False) for text, run_style in runs]
+            bottom = min(bottom, draw_pdf_paragraph(pdf, cell_left, cell_right, row_top, style, runs, space))
+        y = bottom
+    return y
+
+
+def save_to_pdf(tide_table, month_pages, pdf_path, linz_logo_path, daylight_flags=None, dst_policy=None, profile=None,
+                font_files=None):
     """
+    Draw the report pages straight to a PDF file, without Word.
+
+    The pages follow the Word layout: the same layout profile, named styles
+    (fonts, sizes and spacing) and tide table cells as the Word document.
+
+    Args:
+        tide_table (TideTable): The station data.
+        month_pages (iterable): MonthPage entries, one page each.
+        pdf_path (str): Path of the PDF file to write.
+        linz_logo_path (str): Configured logo path.
+        daylight_flags (DaylightFlags): Daylight time tags, or None to classify them here.
+        dst_policy (DstPolicy): How to resolve ambiguous daylight saving times.
+        profile (LayoutProfile): Page layout of the station, or None to look it up in the built-in profiles.
+        font_files (list): Regular and bold TrueType font files, or None to search for Arial.
+    """
+    region_name = station_region_name(tide_table.file_info)
+    if profile is None:
+        profile = station_profile(DEFAULT_PROFILES, tide_table.file_info)
+    if daylight_flags is None:
+        daylight_flags = station_daylight_flags(tide_table, profile, dst_policy)
+    pdf_fonts(font_files)
+    import_deferred('pdf')
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    logo = ImageReader(io.BytesIO(load_logo(linz_logo_path).data))  # embedded once, shared by every page
+
     try:
-        convert(docx_path, pdf_path)
-    except FileNotFoundError:
-        print(f"Error: The file '{docx_path}' does not exist.")
-    except Exception as e:
-        print(f"An error occurred while converting to PDF: {e}")
+        pdf = canvas.Canvas(pdf_path, pagesize=PDF_PAGE_SIZE)
+        pdf.setTitle(f"{region_name} Tide Predictions")
+        left, right = PDF_MARGIN, PDF_PAGE_SIZE[0] - PDF_MARGIN
+        for page in month_pages:
+            y = draw_pdf_top_table(pdf, PDF_PAGE_SIZE[1] - PDF_MARGIN, logo)
+            y = draw_pdf_paragraph(pdf, left, right, y, 'Report Title', [(profile.title, None, False)])
+            y = draw_pdf_paragraph(pdf, left, right, y, 'Station Name', [(region_name, None, False)])
+            y = draw_pdf_paragraph(pdf, left, right, y, 'Coordinates', [(station_coordinates(tide_table.file_info), None, False)])
+            month_heading = f"{calendar.month_name[page.month]} {page.year}"
+            y = draw_pdf_paragraph(pdf, left, right, y, 'Month Heading', [(month_heading, None, False)])
+            condition = [(text, None, underline) for text, underline in condition_runs(profile.condition)]
+            y = draw_pdf_paragraph(pdf, left, right, y, 'Condition', condition)
+            y = draw_pdf_paragraph(pdf, left, right, y, None, [], 1)
+            y = draw_pdf_tide_table(pdf, y, profile, tide_table, page, daylight_flags)
+            y = draw_pdf_paragraph(pdf, left, right, y, None, [], 12)
+            if profile.caution:
+                y = draw_pdf_paragraph(pdf, left, right, y, 'Caution', [(profile.caution, None, False)])
+            daylight = daylight_text(page_daylight_mode(daylight_flags, page), profile.daylight_place)
+            y = draw_pdf_paragraph(pdf, left, right, y, 'Daylight Note', [(daylight, None, False)],
+                                   profile.daylight_space_after)
+            draw_pdf_paragraph(pdf, left, right, y, 'Copyright', [("Crown Copyright Reserved", None, False)])
+            pdf.showPage()
+        pdf.save()
+    except OSError as e:
+        raise ValueError(f"An error occurred while writing the PDF file: {e}")
+
+
+# Time spent in one stage of a station's build: wall and CPU seconds, and the process's
+# peak resident memory (MB) after the stage
+StageTiming = namedtuple('StageTiming', ['stage', 'wall', 'cpu', 'peak_rss'])
+
+# Stages, in pipeline order ('import' is the deferred imports a station was the first to need,
+# 'docx_save' is part of 'docx', 'station' is the whole build in its process)
+STAGES = ('import', 'read', 'daylight', 'docx', 'docx_save', 'pdf', 'convert', 'station')
+
+# Modules imported on first use instead of at startup, by what needs them: the Word
+# document stack, the native PDF renderer, docx2pdf, the Tk dialogs, config.yaml and
+# NumPy for tide predictions (tide_prediction.py)
+DEFERRED_IMPORTS = {
+    'docx': ('docx', 'lxml.etree'),
+    'pdf': ('reportlab.pdfgen.canvas', 'reportlab.pdfbase.ttfonts', 'reportlab.lib.utils'),
+    'word': ('docx2pdf',),
+    'dialog': ('tkinter', 'tkinter.messagebox'),
+    'config': ('yaml',),
+    'prediction': ('numpy',),
+}
+
+# Time spent importing in this process, as StageTiming by name: 'startup' for the
+# module's own imports, then each DEFERRED_IMPORTS entry once it has been loaded
+IMPORT_TIMES = {'startup': StageTiming('import', time.perf_counter() - IMPORT_STARTED[0],
+                                       time.process_time() - IMPORT_STARTED[1], None)}
+
+
+def import_deferred(name):
+    """Import the modules of a DEFERRED_IMPORTS entry on first use, timing the import (IMPORT_TIMES)."""
+    if name in IMPORT_TIMES:
+        return
+    wall, cpu = time.perf_counter(), time.thread_time()
+    for module in DEFERRED_IMPORTS[name]:
+        importlib.import_module(module)
+    IMPORT_TIMES[name] = StageTiming('import', time.perf_counter() - wall, time.thread_time() - cpu, peak_rss())
+
+
+def peak_rss():
+    """Return the peak resident memory of this process in MB, None where it is unknown."""
+    try:
+        import resource
+    except ImportError:
+        # Windows: PeakWorkingSetSize from GetProcessMemoryInfo
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [('cb', ctypes.c_uint32), ('PageFaultCount', ctypes.c_uint32)] + [
+                (name, ctypes.c_size_t) for name in ('PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage',
+                                                     'QuotaPagedPoolUsage', 'QuotaPeakNonPagedPoolUsage',
+                                                     'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+        try:
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            kernel32 = ctypes.windll.kernel32
+            kernel32.K32GetProcessMemoryInfo.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+            if kernel32.K32GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+                return counters.PeakWorkingSetSize / (1024 * 1024)
+        except (AttributeError, OSError):
+            pass
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB elsewhere
+
+
+@contextmanager
+def timed_stage(stages, stage):
+    """
+    Time the enclosed block as one stage.
+
+    Measures wall time and the CPU time of the calling thread (so reader and
+    converter threads are not counted twice), then appends a StageTiming.
+
+    Args:
+        stages (list): StageTiming list to append to, or None to not time the block.
+        stage (str): Stage name (see STAGES).
+    """
+    if stages is None:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        stages.append(StageTiming(stage, time.perf_counter() - wall, time.thread_time() - cpu, peak_rss()))
+
+
+def read_station_timed(source, cache_folder=None, encoding=STATION_ENCODING):
+    """read_station, timed as the 'read' stage. Returns the TideTable and its StageTiming."""
+    stages = []
+    with timed_stage(stages, 'read'):
+        table = read_station(source, cache_folder, encoding)
+    return table, stages[0]
+
+
+# Conversions queued on a converter at most (backpressure on the render, 'convert_queue' in config.yaml)
+CONVERT_QUEUE = 8
+
+
+class PdfConverter(abc.ABC):
+    """
+    Base of the PDF converters: a bounded queue of Word documents converted on worker threads.
+
+    submit() blocks while `queue_limit` documents are waiting or converting, so
+    rendering never runs far ahead of conversion. Subclasses implement convert()
+    and may override shutdown().
+
+    Attributes:
+        executor (ThreadPoolExecutor): The conversion threads.
+    """
+
+    def __init__(self, threads=1, queue_limit=CONVERT_QUEUE):
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+        self.slots = threading.BoundedSemaphore(max(threads, queue_limit))
+
+    def submit(self, docx_path, pdf_path):
+        """
+        Queue a Word document for conversion, waiting while the queue is full.
+
+        Returns:
+            Future: Resolves to the StageTiming of the conversion ('convert').
+        """
+        self.slots.acquire()
+        future = self.executor.submit(self.timed_convert, docx_path, pdf_path)
+        future.add_done_callback(lambda done: self.slots.release())
+        return future
+
+    def timed_convert(self, docx_path, pdf_path):
+        """Convert a Word document, timed as the 'convert' stage."""
+        stages = []
+        with timed_stage(stages, 'convert'):
+            self.convert(docx_path, pdf_path)
+        return stages[0]
+
+    @abc.abstractmethod
+    def convert(self, docx_path, pdf_path):
+        """Convert a Word document to a PDF file."""
+
+    def shutdown(self):
+        """Release the conversion backend, on a conversion thread."""
+
+    def close(self):
+        """Finish the queued documents and release the conversion backend."""
+        self.executor.submit(self.shutdown).result()
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Word's SaveAs file format for PDF (wdFormatPDF)
+WORD_FORMAT_PDF = 17
+
+
+class WordConverter(PdfConverter):
+    """
+    Converts Word documents to PDF in one Microsoft Word session (pdf_backend 'word').
+
+    Documents are queued with submit() as they are written and converted one at a
+    time on a single thread that keeps Word open, instead of attaching to Word
+    again for every file. On Windows the thread drives its own Word instance over
+    COM (so a Word window the user has open is left alone). Elsewhere each file goes
+    through docx2pdf with Word kept running between files. A failed document does
+    not stop the others: the session is dropped and the next document starts a new one.
+
+    Attributes:
+        word (object): The Word application (Windows), None until the first document.
+    """
+
+    def __init__(self, queue_limit=CONVERT_QUEUE):
+        super().__init__(1, queue_limit)
+        self.word = None
+        if sys.platform != 'win32':
+            import_deferred('word')  # here rather than on the converter thread, so no station is charged for it
+
+    def convert(self, docx_path, pdf_path):
+        """
+        Convert a Word document to a PDF file.
+
+        Raises:
+            FileNotFoundError: If the Word document does not exist.
+            ValueError: If Word fails to convert the document.
+        """
+        if not os.path.exists(docx_path):
+            raise FileNotFoundError(f"The file '{docx_path}' does not exist.")
+        try:
+            if sys.platform != 'win32':
+                from docx2pdf import convert
+                convert(docx_path, pdf_path, keep_active=True)
+                return
+            if self.word is None:
+                import pythoncom
+                import win32com.client
+                pythoncom.CoInitialize()
+                self.word = win32com.client.DispatchEx('Word.Application')
+                self.word.Visible = False
+                self.word.DisplayAlerts = 0
+            document = self.word.Documents.Open(os.path.abspath(docx_path), ReadOnly=True, AddToRecentFiles=False)
+            try:
+                document.SaveAs(os.path.abspath(pdf_path), FileFormat=WORD_FORMAT_PDF)
+            finally:
+                document.Close(0)
+        except (Exception, SystemExit) as e:
+            # docx2pdf exits on a failed file on macOS, Word may have died on Windows
+            self.quit()
+            raise ValueError(f"An error occurred while converting to PDF: {e}")
+
+    def quit(self):
+        """Close the Word session, if open."""
+        if self.word is not None:
+            try:
+                self.word.Quit()
+            except Exception:
+                pass  # Word has already gone
+            self.word = None
+
+    def shutdown(self):
+        self.quit()
+
+
+# Headless LibreOffice conversion (pdf_backend 'libreoffice')
+LIBREOFFICE_TIMEOUT = 120  # seconds allowed per document before the worker is restarted
+LIBREOFFICE_START_TIMEOUT = 60  # seconds allowed for a worker to start
+LIBREOFFICE_EXECUTABLES = ('soffice', 'libreoffice',
+                           os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'),
+                                        'LibreOffice', 'program', 'soffice.exe'))
+
+
+def find_soffice(soffice=None):
+    """
+    Find the LibreOffice executable.
+
+    Args:
+        soffice (str): Configured executable (libreoffice_path in config.yaml), or None to search LIBREOFFICE_EXECUTABLES.
+
+    Returns:
+        str: The path of the executable.
+
+    Raises:
+        ValueError: If LibreOffice is not found.
+    """
+    for name in [soffice] if soffice else LIBREOFFICE_EXECUTABLES:
+        path = shutil.which(name) or (name if os.path.isfile(name) else None)
+        if path:
+            return path
+    raise ValueError(f"An error occurred while starting LibreOffice: executable not found: {soffice or 'soffice'}")
+
+
+def default_libreoffice_folder():
+    """Return the local folder holding the LibreOffice worker profiles when config.yaml does not set one."""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'SeaLevelReport', 'libreoffice')
+
+
+def free_local_port():
+    """Return a TCP port on this host that is free right now."""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+class LibreOfficeWorker:
+    """
+    One long-lived ``soffice --headless`` process with its own user profile.
+
+    The process is started once and then converts document after document. A
+    conversion is handed over with a second ``soffice --convert-to`` call on the
+    same profile: LibreOffice's single-instance IPC (the pipe the running process
+    opens for its profile) passes the command line to the running process, and
+    the call returns when the PDF is written. The short-lived client still starts
+    per document, but the office start-up (profile, fonts, filters) is paid once
+    per worker. This hand-off is how LibreOffice treats a second start on a
+    profile in use, not a documented conversion interface, so nothing relies on
+    it silently: a conversion only counts when the PDF is on disk, a missing PDF
+    is retried once on a restarted office, and the ``--accept`` socket is only
+    used to tell when the office has finished starting.
+
+    Attributes:
+        soffice (str): The LibreOffice executable.
+        profile_url (str): file:// URL of the worker's user profile folder.
+        process (Popen): The running office, None when stopped.
+    """
+
+    def __init__(self, soffice, profile_path):
+        self.soffice = soffice
+        self.profile_url = pathlib.Path(os.path.abspath(profile_path)).as_uri()
+        self.process = None
+
+    def start(self, timeout=LIBREOFFICE_START_TIMEOUT):
+        """Start the office and wait until it accepts connections."""
+        port = free_local_port()
+        self.process = subprocess.Popen(
+            [self.soffice, f'-env:UserInstallation={self.profile_url}', '--headless', '--invisible', '--nologo',
+             '--nodefault', '--norestore', '--nolockcheck', f'--accept=socket,host=127.0.0.1,port={port};urp;'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.process.poll() is not None:
+                code = self.process.returncode
+                self.process = None
+                raise ValueError(f"An error occurred while starting LibreOffice: exit code {code}")
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=1):
+                    return
+            except OSError:
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise ValueError(f"An error occurred while starting LibreOffice: not ready after {timeout} s")
+                time.sleep(0.2)
+
+    def stop(self):
+        """Stop the office, if running."""
+        if self.process is not None:
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait()
+            self.process = None
+
+    def restart(self):
+        """Replace a hung or dead office with a fresh one."""
+        self.stop()
+        self.start()
+
+    def convert(self, docx_path, pdf_path, timeout=LIBREOFFICE_TIMEOUT):
+        """
+        Convert a Word document to a PDF file.
+
+        A document that fails while the office is healthy is retried once on a
+        restarted office. A document that takes longer than the timeout is not
+        retried, but the office is restarted for the next one.
+
+        Args:
+            docx_path (str): The Word document.
+            pdf_path (str): The PDF file to write.
+            timeout (float): Seconds allowed for the conversion.
+
+        Raises:
+            ValueError: If the conversion fails or times out.
+        """
+        out_dir = os.path.dirname(os.path.abspath(pdf_path))
+        written = os.path.join(out_dir, os.path.splitext(os.path.basename(docx_path))[0] + '.pdf')
+        for attempt in range(2):
+            if self.process is None or self.process.poll() is not None:
+                self.restart()
+            # A PDF left over from an earlier run must not pass for this one
+            for path in {written, pdf_path}:
+                if os.path.exists(path):
+                    os.remove(path)
+            try:
+                subprocess.run(
+                    [self.soffice, f'-env:UserInstallation={self.profile_url}', '--headless', '--convert-to', 'pdf',
+                     '--outdir', out_dir, os.path.abspath(docx_path)],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.restart()
+                raise ValueError(f"An error occurred while converting to PDF: timed out after {timeout} s")
+            if os.path.exists(written):
+                if written != os.path.abspath(pdf_path):
+                    os.replace(written, pdf_path)
+                return
+            self.stop()
+        raise ValueError(f"An error occurred while converting to PDF: LibreOffice did not write {written}")
+
+
+class LibreOfficePool(PdfConverter):
+    """
+    A fixed set of LibreOfficeWorker processes fed from a queue of Word documents.
+
+    Workers start on their first document (so start-up overlaps with rendering),
+    each with its own profile folder, and are stopped by close().
+
+    Attributes:
+        workers (list): The LibreOfficeWorker entries.
+        timeout (float): Seconds allowed per document.
+    """
+
+    def __init__(self, workers=1, soffice=None, profile_folder=None, timeout=LIBREOFFICE_TIMEOUT,
+                 queue_limit=CONVERT_QUEUE):
+        soffice = find_soffice(soffice)
+        profile_folder = profile_folder or default_libreoffice_folder()
+        self.workers = [LibreOfficeWorker(soffice, os.path.join(profile_folder, f'worker{index}'))
+                        for index in range(max(1, workers))]
+        self.timeout = timeout
+        self.idle = queue.Queue()
+        for worker in self.workers:
+            self.idle.put(worker)
+        super().__init__(len(self.workers), queue_limit)
+
+    def convert(self, docx_path, pdf_path):
+        """Convert a Word document on the next free worker."""
+        worker = self.idle.get()
+        try:
+            worker.convert(docx_path, pdf_path, self.timeout)
+        finally:
+            self.idle.put(worker)
+
+    def close(self):
+        """Finish the queued documents and stop every worker."""
+        self.executor.shutdown(wait=True)
+        for worker in self.workers:
+            worker.stop()
+
 
 def load_config():
     """
     Load configuration from the 'config.yaml' file.
 
     Returns:
-        tuple: A tuple containing folder_path and output_folder.
+        tuple: A tuple containing folder_path, output_folder, linz_logo_path and the full
+        configuration dictionary (for optional settings).
     """
+    import_deferred('config')
+    import yaml
+
     with open('config.yaml', 'r') as config_file:
         config = yaml.safe_load(config_file)
 
@@ -846,57 +2528,856 @@ def load_config():
     linz_logo_path = config['linz_logo_path']
     os.makedirs(output_folder, exist_ok=True)
 
-    return folder_path, output_folder, linz_logo_path
+    return folder_path, output_folder, linz_logo_path, config
 
-def main():
-    """Main function to execute the script."""
-    # Define the folder path containing CSV files
-    # Load configuration from config.yaml
-    folder_path, output_folder, linz_logo_path = load_config()
-    # # Check if the folder exists
-    # if not os.path.exists(folder_path):
-    #     print(f"Error: The folder '{folder_path}' does not exist.")
-    #     return
-    # # Check if the output folder exists, if not create it
-    # if not os.path.exists(output_folder):
-    #     os.makedirs(output_folder)
-    # # Check if the output folder is empty
-    # if os.listdir(output_folder):
-    #     print(f"Error: The output folder '{output_folder}' is not empty.")
-    #     return
-
-    # Process each CSV file in the folder
-    for file in os.listdir(folder_path):
-        if file.endswith('.csv'):
-            file_path = os.path.join(folder_path, file)
-            output_path = os.path.join(output_folder, os.path.splitext(file)[0] + '.docx')
-            pdf_path = os.path.join(output_folder, os.path.splitext(file)[0] + '.pdf')
+# Settings shared by every station of a run (sent to the worker processes in --jobs mode)
+StationOptions = namedtuple('StationOptions', ['output_folder', 'linz_logo_path', 'cache_folder', 'dst_policy',
+                                               'render_engine', 'profiles', 'output', 'pdf_backend', 'pdf_fonts',
+                                               'encoding'])
+
+# Document engines: 'template' copies a pre-built page per month, 'classic' builds
+# every page through python-docx calls (the reference layout)
+RENDER_ENGINES = ('template', 'classic')
+
+# Files written per station: Word and PDF, Word only or PDF only
+OUTPUT_FORMATS = ('both', 'docx', 'pdf')
+
+# How PDFs are made: 'word' converts the Word document with docx2pdf (Microsoft Word),
+# 'native' draws the pages straight to PDF (no Word, the Word document is optional),
+# 'libreoffice' converts the Word document on a pool of headless LibreOffice workers
+PDF_BACKENDS = ('word', 'native', 'libreoffice')
+
+# Outcome of processing one station: error is None on success
+StationResult = namedtuple('StationResult', ['source', 'output_path', 'pdf_path', 'error', 'elapsed', 'stages'])
+
+
+def process_station(source, options, tide_table=None):
+    """
+    Parse, render and convert one station file.
+
+    Errors are caught and returned in the result, so one bad station never stops
+    the rest of the batch. This function runs in worker processes in --jobs mode.
+
+    Args:
+        source (StationSource): The station file.
+        options (StationOptions): Output folder, logo, cache folder ('' or None to disable the cache)
+            daylight saving ambiguity policy, document engine, station layout profiles, output
+            formats, PDF backend and station file encoding.
+        tide_table (Future): The station data, read ahead by run_batch's reader stage, or None to
+            read it here.
+
+    Returns:
+        StationResult: The output paths (None when not written), error message (None on success),
+        elapsed time and stage timings.
+    """
+    started, cpu_started = time.perf_counter(), time.thread_time()
+    stages = []
+    imported = set(IMPORT_TIMES)
+    file = describe_source(source)
+    output_path = os.path.join(options.output_folder, source.name + '.docx')
+    pdf_path = os.path.join(options.output_folder, source.name + '.pdf')
+    # The Word document is needed to make the PDF unless PDFs are drawn natively
+    write_docx = options.output != 'pdf' or options.pdf_backend != 'native'
+    write_pdf = options.output != 'docx'
+
+    error = None
+    try:
+        # The deferred imports this build needs come first and restart the clock, so they
+        # are reported once, as the 'import' stage, and not also in 'docx', 'pdf' and 'station'
+        if write_docx:
+            import_deferred('docx')
+        if write_pdf and options.pdf_backend == 'native':
+            import_deferred('pdf')
+        started, cpu_started = time.perf_counter(), time.thread_time()
+
+        # Read the CSV file into typed columns, from the cache when unchanged
+        if tide_table is not None:
+            tide_table, timing = tide_table.result()
+        else:
+            tide_table, timing = read_station_timed(source, options.cache_folder, options.encoding)
+        stages.append(timing)
+
+        # Page layout and daylight time tags, shared by the Word and PDF output
+        with timed_stage(stages, 'daylight'):
+            profile = station_profile(options.profiles, tide_table.file_info)
+            daylight_flags = station_daylight_flags(tide_table, profile, options.dst_policy)
+
+        # Save grouped data (one page per year and month) to a Word document
+        if write_docx:
+            with timed_stage(stages, 'docx'):
+                if options.render_engine == 'classic':
+                    save_to_word(tide_table, iter_month_pages(tide_table), output_path, options.linz_logo_path,
+                                 daylight_flags, profile=profile, stages=stages)
+                else:
+                    save_to_word_template(tide_table, iter_month_pages(tide_table), output_path,
+                                          options.linz_logo_path, daylight_flags, profile=profile, stages=stages)
+
+        if write_pdf and options.pdf_backend == 'native':
+            # Draw the PDF directly
+            with timed_stage(stages, 'pdf'):
+                save_to_pdf(tide_table, iter_month_pages(tide_table), pdf_path, options.linz_logo_path, daylight_flags,
+                            profile=profile, font_files=options.pdf_fonts)
+        # Otherwise run_batch converts the Word document, on the Word session or LibreOffice pool
+    except FileNotFoundError:
+        error = f"Error: The file '{file}' does not exist."
+    except ValueError as ve:
+        error = f"ValueError while processing '{file}': {ve}"
+    except Exception as e:
+        error = f"An unexpected error occurred while processing '{file}': {e}"
+
+    # Deferred imports made while building this station (the first station of each process)
+    imports = [timing for name, timing in list(IMPORT_TIMES.items()) if name not in imported]
+    if imports:
+        stages.append(StageTiming('import', sum(timing.wall for timing in imports), sum(timing.cpu for timing in imports),
+                                  peak_rss()))
+    elapsed = time.perf_counter() - started
+    stages.append(StageTiming('station', elapsed, time.thread_time() - cpu_started, peak_rss()))
+    return StationResult(source, output_path if write_docx else None,
+                         pdf_path if write_pdf else None, error, elapsed, stages)
+
+
+def report_station_result(result):
+    """Print the outcome of one station."""
+    if result.error:
+        print(result.error)
+    else:
+        print(f"Processed: {describe_source(result.source)}")
+        if result.output_path:
+            print(f"Word document saved to {result.output_path}")
+        if result.pdf_path:
+            print(f"PDF document saved to {result.pdf_path}")
+
+
+def finish_conversion(result, future, options):
+    """
+    Wait for the PDF conversion of one station and complete its result.
+
+    Args:
+        result (StationResult): The station result from process_station.
+        future (Future): The conversion queued on the WordConverter or LibreOfficePool.
+        options (StationOptions): Settings shared by every station.
 
+    Returns:
+        StationResult: The result with the PDF (or the conversion error), the total elapsed time
+        and the conversion timing.
+    """
+    started = time.perf_counter()
+    try:
+        result = result._replace(stages=result.stages + [future.result()])
+        if options.output == 'pdf':
+            os.remove(result.output_path)
+            result = result._replace(output_path=None)
+    except Exception as e:
+        result = result._replace(pdf_path=None,
+                                 error=f"ValueError while processing '{describe_source(result.source)}': {e}")
+    return result._replace(elapsed=result.elapsed + time.perf_counter() - started)
+
+
+# Stations read ahead of the one being built, when building in this process ('read_ahead' in config.yaml)
+READ_AHEAD = 2
+
+
+def run_batch(sources, options, jobs=1, dst_years=DST_YEAR_RANGE, converter=None, executor=None, read_ahead=READ_AHEAD):
+    """
+    Process a list of stations, serially or across a pool of worker processes.
+
+    In this process the work runs as a pipeline of three stages: a reader thread
+    reads up to `read_ahead` stations ahead, this thread builds the documents,
+    and the converter turns them into PDFs (its queue is bounded too). So station
+    N is converted while N+1 is built and N+2 is read. Each station is reported
+    as soon as it is done: conversions that finished are picked up after every
+    build, and the rest once the last station is built.
+
+    Args:
+        sources (list): StationSource entries to process.
+        options (StationOptions): Settings shared by every station.
+        jobs (int): Number of worker processes, 1 to process in this process.
+        dst_years (tuple): First and last year of the daylight saving table built in each worker.
+        converter (WordConverter or LibreOfficePool): Converts the Word documents to PDF as they
+            are written, None when process_station makes the PDFs (or none are needed).
+        executor (ProcessPoolExecutor): Worker processes kept between batches (watch mode), None to
+            start a pool for this batch.
+        read_ahead (int): Stations read ahead of the build, 0 to read each station when it is built.
+
+    Returns:
+        list: StationResult entries in the same order as sources.
+    """
+    results = []
+    conversions = {}  # conversions not reported yet, and the station result of each
+    queued = 0
+
+    def finish(future):
+        # Report a station whose PDF conversion is done
+        result = finish_conversion(conversions.pop(future), future, options)
+        report_station_result(result)
+        results.append(result)
+        print(f"PDF conversion: {queued - len(conversions)} of {queued} done")
+
+    def collect(result):
+        # Queue the Word document for conversion, or report the finished station
+        nonlocal queued
+        if converter is not None and result.error is None and result.pdf_path:
+            conversions[converter.submit(result.output_path, result.pdf_path)] = result
+            queued += 1
+        else:
+            report_station_result(result)
+            results.append(result)
+        for future in [future for future in conversions if future.done()]:
+            finish(future)
+
+    if jobs <= 1 or len(sources) <= 1:
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            reads = [reader.submit(read_station_timed, source, options.cache_folder, options.encoding)
+                     for source in sources[:read_ahead]]
+            for index, source in enumerate(sources):
+                if index + read_ahead < len(sources):
+                    reads.append(reader.submit(read_station_timed, sources[index + read_ahead], options.cache_folder,
+                                               options.encoding))
+                collect(process_station(source, options, reads[index]))
+                reads[index] = None  # the table is no longer needed
+    else:
+        pool = executor or ProcessPoolExecutor(max_workers=jobs, initializer=build_dst_table, initargs=tuple(dst_years))
+        try:
+            futures = {
+                pool.submit(process_station, source, options): source
+                for source in sources
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker process itself failed (e.g. it was killed)
+                    source = futures[future]
+                    result = StationResult(source, None, None,
+                                           f"An unexpected error occurred while processing '{describe_source(source)}': {e}", 0.0,
+                                           [])
+                collect(result)
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+    for future in as_completed(list(conversions)):
+        finish(future)
+
+    order = {source: index for index, source in enumerate(sources)}
+    results.sort(key=lambda result: order[result.source])
+    return results
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a list of numbers (fraction 0.5 for the median)."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def print_summary(results, elapsed):
+    """Print the end-of-run summary: counts, failures, and wall time, CPU time and peak memory per stage."""
+    failed = [result for result in results if result.error]
+    print(f"\nSummary: {len(results)} station(s) processed in {elapsed:.1f} s, "
+          f"{len(results) - len(failed)} succeeded, {len(failed)} failed.")
+    for result in failed:
+        print(f"  FAILED {describe_source(result.source)}: {result.error}")
+    print("  Imports: " + ", ".join(f"{name} {timing.wall:.3f}s" for name, timing in list(IMPORT_TIMES.items())))
+
+    timings = {}
+    for result in results:
+        for timing in result.stages:
+            timings.setdefault(timing.stage, []).append(timing)
+    if timings:
+        print(f"  {'Stage':<10} {'Count':>5} {'p50 wall':>9} {'p95 wall':>9} {'p50 CPU':>9} {'p95 CPU':>9} {'Peak RSS':>9}")
+        for stage in sorted(timings, key=lambda name: STAGES.index(name) if name in STAGES else len(STAGES)):
+            walls = [timing.wall for timing in timings[stage]]
+            cpus = [timing.cpu for timing in timings[stage]]
+            peaks = [timing.peak_rss for timing in timings[stage] if timing.peak_rss is not None]
+            peak = f"{max(peaks):.0f} MB" if peaks else '-'
+            print(f"  {stage:<10} {len(walls):>5} {percentile(walls, 0.5):>8.3f}s {percentile(walls, 0.95):>8.3f}s "
+                  f"{percentile(cpus, 0.5):>8.3f}s {percentile(cpus, 0.95):>8.3f}s {peak:>9}")
+
+
+# IMPORT_TIMES entries this process has written to the metrics file
+METRICS_IMPORTS = set()
+
+
+def write_metrics(metrics_path, results):
+    """
+    Append the stage timings of a batch to a JSON lines file, one record per stage and station.
+
+    Each record has the time of the batch, the station output name and source, the
+    stage, its wall and CPU seconds, the peak resident memory (MB) of the process
+    that ran it and whether the station succeeded. The imports of this process
+    (IMPORT_TIMES) are written once, as 'import' records with a module name and no station.
+    """
+    when = datetime.now().isoformat(timespec='seconds')
+    with open(metrics_path, 'a') as metrics_file:
+        for name, timing in list(IMPORT_TIMES.items()):
+            if name not in METRICS_IMPORTS:
+                METRICS_IMPORTS.add(name)
+                record = {'time': when, 'station': None, 'source': None, 'stage': 'import', 'module': name,
+                          'wall_s': round(timing.wall, 4), 'cpu_s': round(timing.cpu, 4),
+                          'peak_rss_mb': None if timing.peak_rss is None else round(timing.peak_rss, 1), 'ok': True}
+                metrics_file.write(json.dumps(record) + '\n')
+        for result in results:
+            for timing in result.stages:
+                record = {'time': when, 'station': result.source.name, 'source': describe_source(result.source),
+                          'stage': timing.stage, 'wall_s': round(timing.wall, 4), 'cpu_s': round(timing.cpu, 4),
+                          'peak_rss_mb': None if timing.peak_rss is None else round(timing.peak_rss, 1),
+                          'ok': result.error is None}
+                metrics_file.write(json.dumps(record) + '\n')
+
+
+# Incremental rebuilds: the inputs each station's output was built from, kept in the output folder
+MANIFEST_NAME = 'build_manifest.json'
+
+# Bump whenever a code change alters the Word or PDF output, so every station is rebuilt
+GENERATOR_VERSION = 1
+
+
+def file_sha256(path):
+    """Return the SHA-256 of a file's bytes."""
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def settings_sha256(options):
+    """
+    Return the SHA-256 of the run settings that shape the output.
+
+    Covers everything in StationOptions except the folders and the logo path (the
+    logo is hashed by content): document engine, layout profiles, daylight saving
+    policy and decisions, output formats, PDF backend and station file encoding.
+    """
+    settings = options._replace(output_folder=None, linz_logo_path=None, cache_folder=None)
+    return hashlib.sha256(repr(settings).encode('utf-8')).hexdigest()
+
+
+def build_record(source, options, logo_hash, settings_hash):
+    """
+    Return the manifest record of the inputs a station's output is built from.
+
+    Args:
+        source (StationSource): The station file.
+        options (StationOptions): Settings shared by every station.
+        logo_hash (str): SHA-256 of the logo file.
+        settings_hash (str): See settings_sha256.
+
+    Returns:
+        dict: The source, the CSV, logo and settings hashes and the generator version.
+    """
+    if options.cache_folder:
+        csv_hash = source_cache_key(source, options.cache_folder, options.encoding)
+    elif source.member is None:
+        csv_hash = file_sha256(source.path)
+    else:
+        with zipfile.ZipFile(source.path) as archive:
+            csv_hash = hashlib.sha256(archive.read(source.member)).hexdigest()
+    return {'source': describe_source(source), 'csv': csv_hash, 'logo': logo_hash, 'settings': settings_hash,
+            'generator': GENERATOR_VERSION}
+
+
+def load_manifest(output_folder):
+    """Load the build manifest of an output folder, empty when there is none (or it is unreadable)."""
+    try:
+        with open(os.path.join(output_folder, MANIFEST_NAME), 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_folder, manifest):
+    """Save the build manifest of an output folder."""
+    write_file_atomic(os.path.join(output_folder, MANIFEST_NAME),
+                      json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+
+
+def plan_incremental_build(sources, options, manifest):
+    """
+    Split the stations into those to build and those whose output is up to date.
+
+    A station is up to date when its manifest entry records the same inputs
+    (CSV, logo, settings and generator version) and every output it lists is
+    still in the output folder. The logo is the file load_logo resolves; when it
+    cannot be read every station counts as changed.
+
+    Args:
+        sources (list): StationSource entries of the run.
+        options (StationOptions): Settings shared by every station.
+        manifest (dict): The build manifest, records by output name.
+
+    Returns:
+        tuple: The sources to build, the up to date sources, and the new record of
+        every source (None when its inputs could not be read).
+    """
+    logo_hash = logo_sha256(options.linz_logo_path)  # None: every station is rebuilt, fails and reports it
+    settings_hash = settings_sha256(options)
+    stale, skipped, records = [], [], {}
+    for source in sources:
+        try:
+            record = build_record(source, options, logo_hash, settings_hash) if logo_hash else None
+        except (OSError, zipfile.BadZipFile, KeyError):
+            record = None  # the build reports the error
+        records[source] = record
+        entry = manifest.get(source.name)
+        if (record is not None and entry is not None and entry.get('outputs')
+                and {key: entry.get(key) for key in record} == record
+                and all(os.path.exists(os.path.join(options.output_folder, name)) for name in entry['outputs'])):
+            skipped.append(source)
+        else:
+            stale.append(source)
+    return stale, skipped, records
+
+
+def manifest_inputs_changed(manifest, options):
+    """Return True when a station in the build manifest was built from another logo or other settings than these."""
+    logo_hash, settings_hash = logo_sha256(options.linz_logo_path), settings_sha256(options)
+    return any(entry.get('logo') != logo_hash or entry.get('settings') != settings_hash for entry in manifest.values())
+
+
+def update_manifest(manifest, results, records):
+    """Record the inputs and outputs of each station built successfully, forget the failed ones."""
+    for result in results:
+        record = records.get(result.source)
+        if result.error or record is None:
+            manifest.pop(result.source.name, None)
+        else:
+            outputs = [os.path.basename(path) for path in (result.output_path, result.pdf_path) if path]
+            manifest[result.source.name] = dict(record, outputs=outputs)
+    return manifest
+
+
+def build_stations(sources, options, jobs=1, dst_years=DST_YEAR_RANGE, converter=None, force=False, executor=None,
+                   read_ahead=READ_AHEAD, metrics_path=None):
+    """
+    Build the stations whose inputs changed since their last build, and update the build manifest.
+
+    Args:
+        sources (list): StationSource entries to consider.
+        options (StationOptions): Settings shared by every station.
+        jobs (int): Number of worker processes (see run_batch).
+        dst_years (tuple): First and last year of the daylight saving table.
+        converter (WordConverter or LibreOfficePool): PDF converter (see run_batch).
+        force (bool): Build every station, changed or not.
+        executor (ProcessPoolExecutor): Worker processes kept between builds (see run_batch).
+        read_ahead (int): Stations read ahead of the build (see run_batch).
+        metrics_path (str): JSON lines file to append the stage timings to (see write_metrics), or None.
+
+    Returns:
+        list: StationResult entries of the stations built.
+    """
+    manifest = load_manifest(options.output_folder)
+    stale, skipped, records = plan_incremental_build(sources, options, manifest)
+    if not force:
+        for source in skipped:
+            print(f"Up to date, skipped: {describe_source(source)}")
+        if skipped:
+            print(f"Incremental build: {len(skipped)} unchanged station(s) skipped, {len(stale)} to build "
+                  f"(use --force to rebuild all)")
+        sources = stale
+    results = run_batch(sources, options, jobs, dst_years, converter, executor, read_ahead)
+    save_manifest(options.output_folder, update_manifest(manifest, results, records))
+    if metrics_path:
+        write_metrics(metrics_path, results)
+    return results
+
+
+def open_converter(options, config, jobs):
+    """
+    Start the PDF converter of a run.
+
+    Args:
+        options (StationOptions): Settings shared by every station (output formats and PDF backend).
+        config (dict): The configuration (LibreOffice settings).
+        jobs (int): Number of worker processes, the default number of LibreOffice workers.
+
+    Returns:
+        WordConverter or LibreOfficePool: The converter, to close after the run. None when
+        process_station makes the PDFs or no PDFs are needed.
+    """
+    if options.output == 'docx' or options.pdf_backend == 'native':
+        return None
+    queue_limit = int(config.get('convert_queue', CONVERT_QUEUE))
+    if options.pdf_backend == 'libreoffice':
+        # Long-lived headless LibreOffice workers, one profile folder each
+        workers = int(config.get('libreoffice_workers', jobs)) or os.cpu_count() or 1
+        return LibreOfficePool(workers, config.get('libreoffice_path'), config.get('libreoffice_profiles'),
+                               float(config.get('libreoffice_timeout', LIBREOFFICE_TIMEOUT)), queue_limit)
+    # One Word session for the whole run
+    return WordConverter(queue_limit)
+
+
+# Watch mode: seconds between folder scans without inotify, and seconds a file must stay
+# unchanged (size and modification time) before it is read, so partial writes are skipped
+WATCH_INTERVAL = 2.0
+WATCH_SETTLE = 2.0
+
+# inotify events that mean a file in the folder was written, moved or removed
+INOTIFY_EVENTS = 0x2 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200  # IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_*, IN_CREATE, IN_DELETE
+
+
+def inotify_watch(folder):
+    """
+    Watch a folder with inotify.
+
+    Returns:
+        int: A non-blocking inotify file descriptor that becomes readable when the folder
+        changes, None where inotify is not available (then the folder is polled).
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        watcher = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if watcher < 0:
+            return None
+        if libc.inotify_add_watch(watcher, os.fsencode(folder), ctypes.c_uint32(INOTIFY_EVENTS)) < 0:
+            os.close(watcher)
+            return None
+        return watcher
+    except (OSError, AttributeError):
+        return None
+
+
+def wait_for_change(watcher, timeout):
+    """Sleep until the watched folder changes (inotify) or the timeout passes."""
+    if watcher is None:
+        time.sleep(timeout)
+        return
+    if select.select([watcher], [], [], timeout)[0]:
+        try:
+            while os.read(watcher, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def folder_snapshot(folder_path):
+    """Return the size and modification time of every station file (.csv or .zip) under watch, by path."""
+    if os.path.isfile(folder_path):
+        paths = [folder_path]
+    else:
+        paths = [os.path.join(folder_path, file) for file in os.listdir(folder_path)]
+    snapshot = {}
+    for path in paths:
+        if station_file_type(path):
             try:
-                # Read the CSV file
-                file_info, header, data = read_csv(file_path)
+                stat = os.stat(path)
+            except OSError:
+                continue  # removed while scanning
+            snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
 
-                # Group data by month
-                grouped_data = group_data_by_month(data)
 
-                # Save grouped data to a Word document
-                save_to_word(file_info, grouped_data, output_path, linz_logo_path)
+def watch_folder(folder_path, options, jobs=1, dst_years=DST_YEAR_RANGE, converter=None, interval=WATCH_INTERVAL,
+                 settle=WATCH_SETTLE, read_ahead=READ_AHEAD, metrics_path=None):
+    """
+    Long-running mode: build station reports as CSV files (or zip archives) arrive or change.
 
-                # Convert the Word document to PDF
-                convert_to_pdf(output_path, pdf_path)
+    The folder is watched with inotify on Linux and polled elsewhere. A file is
+    queued once its size and modification time have been stable for `settle`
+    seconds, then built with build_stations (so unchanged stations are skipped).
+    The logo file is watched the same way: when it (or, through the build manifest,
+    the settings) no longer matches what the stations were built from, every
+    station is planned, not just the changed files. The process, its worker
+    processes and the PDF converter stay up between jobs, so the logo, page
+    templates and daylight saving table stay warm. Runs until interrupted (Ctrl+C).
 
-                print(f"Processed: {file}")
-                print(f"Word document saved to {output_path}")
-                print(f"PDF document saved to {pdf_path}")
-            except FileNotFoundError:
-                print(f"Error: The file '{file_path}' does not exist.")
-            except ValueError as ve:
-                print(f"ValueError while processing '{file}': {ve}")
-            except Exception as e:
-                print(f"An unexpected error occurred while processing '{file}': {e}")
+    Args:
+        folder_path (str): Folder, CSV file or zip archive to watch.
+        options (StationOptions): Settings shared by every station.
+        jobs (int): Number of worker processes.
+        dst_years (tuple): First and last year of the daylight saving table.
+        converter (WordConverter or LibreOfficePool): PDF converter (see run_batch).
+        interval (float): Seconds between scans of the logo, and of the folder when polling.
+        settle (float): Seconds a file must stay unchanged before it is built.
+        read_ahead (int): Stations read ahead of the build (see run_batch).
+        metrics_path (str): JSON lines file for the stage timings of every job, or None.
+    """
+    watch_path = folder_path if os.path.isdir(folder_path) else os.path.dirname(os.path.abspath(folder_path))
+    watcher = inotify_watch(watch_path)
+    method = 'inotify' if watcher is not None else f"polling every {interval:g} s"
+    print(f"Watching {folder_path} ({method}), press Ctrl+C to stop.")
+
+    built = {}  # path -> (size, mtime) when last built
+    pending = {}  # path -> ((size, mtime), monotonic time the change was seen)
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=build_dst_table, initargs=tuple(dst_years))
+    try:
+        while True:
+            now = time.monotonic()
+            snapshot = folder_snapshot(folder_path)
+            # The logo is usually outside the folder, so it is polled with the folder scans
+            logo_path = resolve_logo_path(options.linz_logo_path)
+            try:
+                stat = os.stat(logo_path)
+                snapshot[logo_path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                pass  # missing logo: every station fails and reports it
+            for path in list(built):
+                if path not in snapshot:
+                    del built[path]
+            for path in list(pending):
+                if path not in snapshot:
+                    del pending[path]
+            for path, stat in snapshot.items():
+                if built.get(path) != stat and (path not in pending or pending[path][0] != stat):
+                    pending[path] = (stat, now)
+
+            ready = [path for path, (stat, seen) in pending.items() if now - seen >= settle]
+            if ready:
+                landed = min(pending[path][1] for path in ready)
+                started = time.perf_counter()
+                sources = find_station_sources(folder_path)
+                if not manifest_inputs_changed(load_manifest(options.output_folder), options):
+                    sources = [source for source in sources if source.path in ready]
+                results = build_stations(sources, options, jobs, dst_years, converter, executor=executor,
+                                         read_ahead=read_ahead, metrics_path=metrics_path)
+                for path in ready:
+                    built[path] = pending.pop(path)[0]
+                failed = sum(1 for result in results if result.error)
+                print(f"{datetime.now():%Y-%m-%d %H:%M:%S} Job: {len(ready)} file(s), {len(results)} station(s) built "
+                      f"({failed} failed) in {time.perf_counter() - started:.1f} s, "
+                      f"{time.monotonic() - landed:.1f} s after the data landed.")
+                continue
+
+            if pending:
+                timeout = max(0.1, min(seen + settle for stat, seen in pending.values()) - now)
+            else:
+                timeout = interval  # inotify wakes up early for the folder, the logo is polled
+            wait_for_change(watcher, timeout)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        if watcher is not None:
+            os.close(watcher)
+        if executor is not None:
+            executor.shutdown()
+
+
+# A time in the repeated hour when daylight time ends, found by the pre-flight scan
+AmbiguousTime = namedtuple('AmbiguousTime', ['source', 'station', 'region_name', 'date', 'time', 'suggested', 'answer'])
+
+
+def scan_dst_ambiguities(sources, options):
+    """
+    Pre-flight pass: find every ambiguous daylight saving time in all stations before rendering.
+
+    Uses the same classification (classify_daylight_time) and decision keys as
+    the render, without building any documents.
+
+    Args:
+        sources (list): StationSource entries to scan.
+        options (StationOptions): Run settings (cache folder, existing decisions and station profiles).
+
+    Returns:
+        list: AmbiguousTime entries, one per decision key, with the automatic suggestion and any existing answer.
+    """
+    ambiguities = []
+    seen = set()
+    for source in sources:
+        try:
+            table = read_station(source, options.cache_folder, options.encoding)
+            region_name = station_region_name(table.file_info)
+            flags = classify_daylight_time(table, station_profile(options.profiles, table.file_info).zone)
+        except Exception as e:
+            print(f"Pre-flight: skipping '{describe_source(source)}': {e}")
+            continue
+
+        for row, kind in enumerate(flags.rows):
+            if kind == ROW_DST_ENDS and AMBIGUOUS_TIME in flags.events[row * MAX_EVENTS:(row + 1) * MAX_EVENTS]:
+                key = dst_decision_key(table, row)
+                if key in seen:
+                    continue  # the same station file in more than one place needs one answer
+                seen.add(key)
+                ambiguities.append(AmbiguousTime(source, key[0], region_name, key[1], key[2],
+                                                 infer_daylight_time(table, row), options.dst_policy.decisions.get(key)))
+    return ambiguities
+
+
+def dst_answer_text(daylight):
+    """Return 'daylight', 'standard' or '' for True, False or None."""
+    if daylight is None:
+        return ''
+    return 'daylight' if daylight else 'standard'
+
+
+def write_dst_review(file_path, ambiguities):
+    """
+    Write the pre-flight ambiguities as a review file in the decisions-file format.
+
+    The answer column is filled in for times already decided and left empty
+    otherwise; the suggested column shows the automatic answer. The edited file
+    is then passed back with --dst-decisions.
+
+    Args:
+        file_path (str): Path of the review file.
+        ambiguities (list): AmbiguousTime entries from scan_dst_ambiguities.
+    """
+    with open(file_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['station', 'date', 'time', 'answer', 'suggested', 'region', 'file'])
+        for item in ambiguities:
+            writer.writerow([item.station, item.date, item.time, dst_answer_text(item.answer),
+                             dst_answer_text(item.suggested), item.region_name, describe_source(item.source)])
+
+
+def ask_dst_decisions_dialog(ambiguities):
+    """
+    Ask about every ambiguous time at once, in a single dialog.
+
+    Each time is listed with its automatic suggestion; selected lines are
+    daylight time. Times that already have an answer are not listed.
+
+    Args:
+        ambiguities (list): AmbiguousTime entries from scan_dst_ambiguities.
+
+    Returns:
+        dict: Decisions keyed by (station, date, time), True for daylight time.
+        Empty if the dialog cannot be shown (the policy rules then apply).
+    """
+    pending = [item for item in ambiguities if item.answer is None]
+    if not pending:
+        return {}
+
+    try:
+        import_deferred('dialog')
+        from tkinter import Button, Frame, Label, Listbox, Scrollbar, Tk
+        root = Tk()
+    except Exception as e:
+        print(f"Unable to show the daylight saving dialog, using the automatic answers: {e}")
+        return {}
+
+    root.title("Confirmation Required - Daylight Time")
+    Label(root, justify='left', text=(
+        "These times fall in the repeated hour when daylight time ends.\n"
+        "Select the times that are Daylight time (NZDT); the others are Standard time (NZST).\n"
+        "The automatic suggestion is preselected.")).pack(padx=10, pady=5, anchor='w')
+    frame = Frame(root)
+    frame.pack(fill='both', expand=True, padx=10)
+    scrollbar = Scrollbar(frame)
+    scrollbar.pack(side='right', fill='y')
+    listbox = Listbox(frame, selectmode='multiple', width=90, height=min(len(pending), 25),
+                      yscrollcommand=scrollbar.set, exportselection=False)
+    listbox.pack(side='left', fill='both', expand=True)
+    scrollbar.config(command=listbox.yview)
+    for index, item in enumerate(pending):
+        suggestion = dst_answer_text(item.suggested) or 'daylight'
+        listbox.insert('end', f"{item.region_name} ({item.station})  {item.date}  {item.time}   suggested: {suggestion}")
+        if item.suggested is not False:
+            listbox.selection_set(index)
+    Button(root, text="OK", width=12, command=root.quit).pack(pady=8)
+    root.protocol("WM_DELETE_WINDOW", root.quit)  # closing the window keeps the current selection
+    root.mainloop()
+
+    selected = set(listbox.curselection())
+    root.destroy()
+    return {(item.station, item.date, item.time): index in selected for index, item in enumerate(pending)}
+
+
+def parse_arguments(argv=None):
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Create Word and PDF tide reports from the SLIM CSV output.")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="number of stations to process in parallel (0 = one per CPU core, default 1 or 'jobs' in config.yaml)")
+    parser.add_argument('--dst-policy', choices=DST_POLICIES, default=None,
+                        help="how to resolve times in the repeated hour when daylight time ends (default 'auto' or 'dst_policy' in config.yaml)")
+    parser.add_argument('--dst-decisions', default=None, metavar='FILE',
+                        help="CSV file of pre-answered daylight saving decisions (station,date,time,answer)")
+    parser.add_argument('--engine', choices=RENDER_ENGINES, default=None,
+                        help="document engine (default 'template' or 'render_engine' in config.yaml)")
+    parser.add_argument('--output', choices=OUTPUT_FORMATS, default=None,
+                        help="files to write per station (default 'both' or 'output' in config.yaml)")
+    parser.add_argument('--pdf-backend', choices=PDF_BACKENDS, default=None,
+                        help="how PDFs are made: 'word' (docx2pdf), 'native' (no Word) or 'libreoffice' (headless LibreOffice workers) "
+                             "(default 'word' or 'pdf_backend' in config.yaml)")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running and build station reports as CSV files arrive in folder_path")
+    parser.add_argument('--metrics', default=None, metavar='FILE',
+                        help="append wall time, CPU time and peak memory of every stage and station to FILE (JSON lines)")
+    parser.add_argument('--force', action='store_true',
+                        help="rebuild every station, even those whose inputs have not changed since the last run")
+    parser.add_argument('--dst-review', default=None, metavar='FILE',
+                        help="pre-flight only: write every ambiguous daylight saving time to FILE for review and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main function to execute the script."""
+    args = parse_arguments(argv)
+    # Define the folder path containing CSV files
+    # Load configuration from config.yaml
+    folder_path, output_folder, linz_logo_path, config = load_config()
+    # Parsed-station cache (set cache_folder to '' in config.yaml to disable it)
+    cache_folder = config.get('cache_folder', default_cache_folder())
+    jobs = args.jobs if args.jobs is not None else int(config.get('jobs', 1))
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    # Daylight saving transitions are computed once and shared by all stations
+    dst_years = tuple(config.get('dst_years', DST_YEAR_RANGE))
+    build_dst_table(*dst_years)
+
+    # Daylight saving ambiguity policy and pre-answered decisions
+    dst_mode = args.dst_policy or config.get('dst_policy', DEFAULT_DST_POLICY.mode)
+    if dst_mode not in DST_POLICIES:
+        raise ValueError(f"Invalid dst_policy '{dst_mode}', use one of: {', '.join(DST_POLICIES)}")
+    decisions_path = args.dst_decisions or config.get('dst_decisions')
+    decisions = load_dst_decisions(decisions_path) if decisions_path else {}
+    render_engine = args.engine or config.get('render_engine', RENDER_ENGINES[0])
+    if render_engine not in RENDER_ENGINES:
+        raise ValueError(f"Invalid render_engine '{render_engine}', use one of: {', '.join(RENDER_ENGINES)}")
+    # Station layout profiles are compiled once, rendering looks each station up by id
+    profiles = compile_layout_profiles(config)
+
+    # Output files and PDF backend
+    output = args.output or config.get('output', OUTPUT_FORMATS[0])
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Invalid output '{output}', use one of: {', '.join(OUTPUT_FORMATS)}")
+    pdf_backend = args.pdf_backend or config.get('pdf_backend', PDF_BACKENDS[0])
+    if pdf_backend not in PDF_BACKENDS:
+        raise ValueError(f"Invalid pdf_backend '{pdf_backend}', use one of: {', '.join(PDF_BACKENDS)}")
+    # Text encoding of the station files
+    encoding = config.get('encoding', STATION_ENCODING)
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        raise ValueError(f"Invalid encoding '{encoding}' in config.yaml")
+    options = StationOptions(output_folder, linz_logo_path, cache_folder, DstPolicy(dst_mode, decisions), render_engine,
+                             profiles, output, pdf_backend, config.get('pdf_fonts'), encoding)
+
+    # Process each CSV file in the folder (loose files and members of zip archives)
+    started = time.perf_counter()
+    sources = find_station_sources(folder_path)
+
+    # Pre-flight: collect every daylight saving question before rendering, so the
+    # render itself runs unattended
+    if args.dst_review or dst_mode == 'prompt':
+        ambiguities = scan_dst_ambiguities(sources, options)
+        if args.dst_review:
+            write_dst_review(args.dst_review, ambiguities)
+            pending = sum(1 for item in ambiguities if item.answer is None)
+            print(f"Pre-flight: {len(ambiguities)} ambiguous time(s), {pending} unanswered, written to {args.dst_review}")
+            return
+        decisions = dict(decisions, **ask_dst_decisions_dialog(ambiguities))
+        options = options._replace(dst_policy=DstPolicy('auto', decisions))
+
+    # Incremental build: stations whose inputs are unchanged since their outputs were built are skipped
+    read_ahead = int(config.get('read_ahead', READ_AHEAD))
+    metrics_path = args.metrics or config.get('metrics_file')
+    with open_converter(options, config, jobs) or nullcontext() as converter:
+        if args.watch:
+            watch_folder(folder_path, options, jobs, dst_years, converter,
+                         float(config.get('watch_interval', WATCH_INTERVAL)), float(config.get('watch_settle', WATCH_SETTLE)),
+                         read_ahead, metrics_path)
+        else:
+            results = build_stations(sources, options, jobs, dst_years, converter, args.force, read_ahead=read_ahead,
+                                     metrics_path=metrics_path)
+            print_summary(results, time.perf_counter() - started)
 
 if __name__ == "__main__":
+    # Needed for worker processes in the frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
     try:
         main()
     except Exception as e:
-        print(f"An error occurred in the main function: {e}")
\ No newline at end of file
+        print(f"An error occurred in the main function: {e}")
@@ -0,0 +1,216 @@
+"""Synthetic SLIM station files for benchmarks."""
+import argparse
+import csv
+import math
+import os
+import random
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from sea_level_report4 import DST_ZONES, STATION_ENCODING, WEEKDAY_CODES, dst_transitions
+
+# One synthetic station: id, name, coordinates, 'tide' or 'stream', and daylight saving zone
+SyntheticStation = namedtuple('SyntheticStation', ['station_id', 'name', 'latitude', 'longitude', 'kind', 'zone'])
+
+# Stations the generator cycles through. Stream and Chatham stations use the names the
+# report maps to the stream and chatham layouts.
+STATION_CATALOGUE = [
+    SyntheticStation('001', "Auckland", "36°51'S", "174°46'E", 'tide', 'NZ'),
+    SyntheticStation('002', "Tauranga", "37°39'S", "176°11'E", 'tide', 'NZ'),
+    SyntheticStation('003', "Napier", "39°29'S", "176°55'E", 'tide', 'NZ'),
+    SyntheticStation('004', "Wellington", "41°17'S", "174°47'E", 'tide', 'NZ'),
+    SyntheticStation('005', "Te Aumiti / French Pass", "40°55'S", "173°50'E", 'stream', 'NZ'),
+    SyntheticStation('006', "Nelson", "41°16'S", "173°16'E", 'tide', 'NZ'),
+    SyntheticStation('007', "Westport", "41°44'S", "171°36'E", 'tide', 'NZ'),
+    SyntheticStation('008', "Lyttelton", "43°37'S", "172°43'E", 'tide', 'NZ'),
+    SyntheticStation('009', "Waitangi - Chatham Island", "43°57'S", "176°34'W", 'tide', 'Chatham'),
+    SyntheticStation('010', "Timaru", "44°24'S", "171°16'E", 'tide', 'NZ'),
+    SyntheticStation('011', "Tory Channel / Kura Te Au Entrance", "41°12'S", "174°19'E", 'stream', 'NZ'),
+    SyntheticStation('012', "Dunedin", "45°53'S", "170°31'E", 'tide', 'NZ'),
+    SyntheticStation('013', "Owenga - Chatham Island", "44°02'S", "176°22'W", 'tide', 'Chatham'),
+    SyntheticStation('014', "Bluff", "46°36'S", "168°21'E", 'tide', 'NZ'),
+]
+
+# Mean interval between high and low water (half the M2 period), and the spring-neap cycle, in minutes
+HALF_TIDE_MINUTES = 372.6
+SPRING_NEAP_MINUTES = 14.765 * 24 * 60
+
+# Stream directions, flood then ebb
+STREAM_DIRECTIONS = ('NE', 'SW')
+
+# Second line of every SLIM file
+CONSTITUENT_LINE = ['Based on constituent set with reference date:', '01-Jul-2012']
+
+
+def tide_events(station, year, rng):
+    """
+    Compute the high and low waters (or stream turns) of a station over one calendar year.
+
+    Events are spaced about half an M2 period apart, with a little diurnal
+    inequality and a spring-neap cycle in the heights. Times are computed in
+    local standard time and then moved to daylight time where it applies.
+
+    Args:
+        station (SyntheticStation): The station.
+        year (int): The year.
+        rng (Random): Random source, seeded per station.
+
+    Returns:
+        list: (local datetime, value text) tuples in time order.
+    """
+    start, end = dst_transitions(year, station.zone)
+    # dst_transitions gives the clock times of the changes: the start in standard time,
+    # the end in daylight time; both compared against standard time here
+    daylight_until = end - timedelta(hours=1) if end else None
+    daylight_from = start
+
+    mean_level = rng.uniform(1.2, 2.0)
+    range_scale = rng.uniform(0.4, 0.9)
+    minute = rng.uniform(0, HALF_TIDE_MINUTES)
+    first_day = datetime(year, 1, 1)
+    minutes_in_year = (datetime(year + 1, 1, 1) - first_day).total_seconds() / 60
+
+    events = []
+    high = rng.random() < 0.5
+    while minute < minutes_in_year:
+        standard = first_day + timedelta(minutes=round(minute))
+        daylight = (daylight_until is not None and standard < daylight_until) or \
+                   (daylight_from is not None and standard >= daylight_from)
+        local = standard + timedelta(hours=1) if daylight else standard
+        if local.year == year:
+            if station.kind == 'stream':
+                value = STREAM_DIRECTIONS[0 if high else 1]
+            else:
+                spring = 1 + 0.3 * math.cos(2 * math.pi * minute / SPRING_NEAP_MINUTES)
+                value = f"{mean_level + (1 if high else -1) * range_scale * spring:.1f}"
+            events.append((local, value))
+        high = not high
+        minute += HALF_TIDE_MINUTES + rng.uniform(-25, 25)
+    return events
+
+
+def place_dst_edges(station, year, days):
+    """
+    Move the first event of each daylight saving changeover day next to the change.
+
+    On the day daylight time ends the first event lands in the repeated hour (an
+    ambiguous time), on the day it starts just before the clocks go forward.
+
+    Args:
+        station (SyntheticStation): The station.
+        year (int): The year.
+        days (dict): Events of each local date, as lists of [minute of day, value text].
+    """
+    start, end = dst_transitions(year, station.zone)
+    change_minute = DST_ZONES[station.zone]
+    for changeover, minute in ((end, change_minute + 8), (start, change_minute - 8)):
+        if changeover is None:
+            continue
+        events = days.get(changeover.date())
+        if events and (len(events) == 1 or minute < events[1][0] - 60):
+            events[0][0] = minute
+
+
+def station_rows(station, year, rng):
+    """
+    Build the data rows of a station file for one calendar year.
+
+    Rows have 3, 4 or 5 events (10, 12 or 14 columns). Rows with 3 events are
+    written either as 10 columns or as 12 with an empty last slot, as SLIM does.
+
+    Args:
+        station (SyntheticStation): The station.
+        year (int): The year.
+        rng (Random): Random source, seeded per station.
+
+    Returns:
+        list: Rows as lists of strings.
+    """
+    days = {}
+    for local, value in tide_events(station, year, rng):
+        days.setdefault(local.date(), []).append([local.hour * 60 + local.minute, value])
+    place_dst_edges(station, year, days)
+
+    rows = []
+    for date in sorted(days):
+        events = days[date]
+        if station.kind == 'stream' and len(events) == 4 and rng.random() < 0.1:
+            # A short extra turn: a 5-event (14 column) row
+            minute = (events[1][0] + events[2][0]) // 2
+            events.insert(2, [minute, events[1][1]])
+        row = [str(date.day), WEEKDAY_CODES[date.weekday()], str(date.month), str(date.year)]
+        for minute, value in events:
+            row += [f"{minute // 60:02d}:{minute % 60:02d}", value]
+        if len(events) == 3 and rng.random() < 0.5:
+            row += ['', '']
+        rows.append(row)
+    return rows
+
+
+def write_station_file(path, station, year, seed=0, encoding=None):
+    """
+    Write one synthetic SLIM station file (one station-year).
+
+    Args:
+        path (str): The CSV file to write.
+        station (SyntheticStation): The station.
+        year (int): The year.
+        seed (int): Random seed, the same seed gives the same file.
+        encoding (str): Text encoding, None for the encoding the report reads files with.
+    """
+    rng = random.Random(f"{seed}:{station.station_id}:{station.name}:{year}")
+    unit = 'Tidal streams in direction.' if station.kind == 'stream' else 'Tidal heights in metres.'
+    with open(path, 'w', newline='', encoding=encoding or STATION_ENCODING) as file:
+        # The SLIM header line is padded with spaces
+        file.write(f"{station.station_id},{station.name},{station.latitude},{station.longitude}".ljust(72) + '\r\n')
+        writer = csv.writer(file, lineterminator='\r\n')
+        writer.writerow(CONSTITUENT_LINE)
+        writer.writerow(['Local Std or Daylight Time', unit])
+        writer.writerows(station_rows(station, year, rng))
+
+
+def generate_station_files(folder, count, year=2024, seed=0, encoding=None):
+    """
+    Write `count` synthetic station-years into a folder.
+
+    Stations cycle through STATION_CATALOGUE (tide, stream and Chatham stations)
+    and years run on from `year` once the catalogue is used up, so every file is
+    a different station-year.
+
+    Args:
+        folder (str): Output folder.
+        count (int): Number of station-years.
+        year (int): First year.
+        seed (int): Random seed.
+        encoding (str): Text encoding, None for the encoding the report reads files with.
+
+    Returns:
+        list: Paths of the files written.
+    """
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for index in range(count):
+        station = STATION_CATALOGUE[index % len(STATION_CATALOGUE)]
+        station_year = year + index // len(STATION_CATALOGUE)
+        name = station.name.split(' /')[0].split(' -')[0].replace(' ', '_')
+        path = os.path.join(folder, f"{name}_{station_year}_{index:04d}.csv")
+        write_station_file(path, station, station_year, seed, encoding)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    """Write synthetic station files from the command line."""
+    parser = argparse.ArgumentParser(description="Write synthetic SLIM station files (one station-year each).")
+    parser.add_argument('folder', help="output folder")
+    parser.add_argument('--count', type=int, default=14, help="number of station-years (default 14)")
+    parser.add_argument('--year', type=int, default=2024, help="first year (default 2024)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default 0)")
+    parser.add_argument('--encoding', default=None, help=f"text encoding (default: {STATION_ENCODING}, as SLIM)")
+    args = parser.parse_args(argv)
+    paths = generate_station_files(args.folder, args.count, args.year, args.seed, args.encoding)
+    print(f"Wrote {len(paths)} station file(s) to {args.folder}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import csv
+import os
+import struct
+import sys
+import zlib
+
+import pytest
+
+# The report is a single module at the top of the repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The first line of a SLIM station file: station id, name, latitude and longitude
+STATION_INFO = ['028', 'Dunedin', "45°53'S", "170°30'E"]
+
+# Data rows of a SLIM station file: date, weekday, month, year, then time and height per event
+STATION_ROWS = [
+    ['1', 'Mo', '1', '2024', '02:43', '0.4', '08:25', '1.8', '15:07', '0.5', '20:46', '1.7'],
+    ['2', 'Tu', '1', '2024', '03:25', '0.5', '09:09', '1.8', '15:51', '0.5', '21:33', '1.7'],
+    ['3', 'We', '1', '2024', '04:09', '0.5', '09:55', '1.7', '16:38', '0.5', '22:22', '1.7'],
+]
+
+
+def station_file_lines(rows=None, file_info=None):
+    """The lines of a SLIM station file, as lists of fields."""
+    return [file_info or STATION_INFO,
+            ['Based on constituent set with reference date:', '01-Jan-2013'],
+            ['Local Std or Daylight Time', 'Tidal heights in metres.']] + (STATION_ROWS if rows is None else rows)
+
+
+@pytest.fixture
+def write_station_file(tmp_path):
+    """Return a function that writes a SLIM station file (cp1252 by default, as SLIM writes them)."""
+    def write(name='028', rows=None, folder=None, file_info=None, encoding='cp1252'):
+        path = os.path.join(folder or str(tmp_path), name + '.csv')
+        with open(path, 'w', newline='', encoding=encoding) as file:
+            csv.writer(file, lineterminator='\r\n').writerows(station_file_lines(rows, file_info))
+        return path
+    return write
+
+
+def png(width, height, rgb):
+    """A one-colour PNG image."""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    pixels = b''.join(b'\0' + bytes(rgb) * width for _ in range(height))
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(pixels)) + chunk(b'IEND', b''))
+
+
+@pytest.fixture
+def write_logo(tmp_path):
+    """Return a function that writes a one-colour PNG logo (blue, 4 by 4 pixels by default) and returns its path."""
+    def write(size=4, rgb=(0, 0, 255), path=None):
+        path = path or str(tmp_path / 'logo.png')
+        with open(path, 'wb') as logo_file:
+            logo_file.write(png(size, size, rgb))
+        return path
+    return write
@@ -0,0 +1,157 @@
+"""Tests of the daylight saving table and the daylight time classification of station files."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import sea_level_report4 as report
+
+# Transitions from the tz database (Pacific/Auckland): daylight time starts at the
+# standard clock time given and ends at the daylight clock time given
+KNOWN_TRANSITIONS = [
+    (1974, datetime(1974, 11, 3, 2, 0), None),
+    (1975, datetime(1975, 10, 26, 2, 0), datetime(1975, 2, 23, 3, 0)),
+    (1989, datetime(1989, 10, 8, 2, 0), datetime(1989, 3, 5, 3, 0)),
+    (1990, datetime(1990, 10, 7, 2, 0), datetime(1990, 3, 18, 3, 0)),
+    (2006, datetime(2006, 10, 1, 2, 0), datetime(2006, 3, 19, 3, 0)),
+    (2007, datetime(2007, 9, 30, 2, 0), datetime(2007, 3, 18, 3, 0)),
+    (2008, datetime(2008, 9, 28, 2, 0), datetime(2008, 4, 6, 3, 0)),
+    (2024, datetime(2024, 9, 29, 2, 0), datetime(2024, 4, 7, 3, 0)),
+    (2025, datetime(2025, 9, 28, 2, 0), datetime(2025, 4, 6, 3, 0)),
+]
+
+
+@pytest.fixture(autouse=True)
+def dst_table():
+    report.build_dst_table()
+    yield
+    report.build_dst_table()
+
+
+@pytest.mark.parametrize('year, start, end', KNOWN_TRANSITIONS)
+def test_dst_transitions_nz(year, start, end):
+    assert report.dst_transitions(year, 'NZ') == report.DstTransitions(start, end)
+
+
+@pytest.mark.parametrize('year, start, end', KNOWN_TRANSITIONS)
+def test_dst_transitions_chatham(year, start, end):
+    # The Chatham Islands change on the same days, 45 minutes later on the clock
+    transitions = report.dst_transitions(year, 'Chatham')
+    assert transitions.start == (start and start + timedelta(minutes=45))
+    assert transitions.end == (end and end + timedelta(minutes=45))
+
+
+def tz_transitions(zone_name, year):
+    """Local clock times of the offset changes of a tz database zone in one year, by 'start' and 'end'."""
+    zoneinfo = pytest.importorskip('zoneinfo')
+    try:
+        zone = zoneinfo.ZoneInfo(zone_name)
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip(f"no tz database entry for {zone_name}")
+    transitions = {}
+    moment = datetime(year - 1, 12, 31, tzinfo=timezone.utc)
+    offset = moment.astimezone(zone).utcoffset()
+    while moment < datetime(year + 1, 1, 1, tzinfo=timezone.utc):
+        moment += timedelta(minutes=15)
+        new_offset = moment.astimezone(zone).utcoffset()
+        if new_offset != offset:
+            clock = moment.astimezone(timezone(offset)).replace(tzinfo=None)  # the clock time before the change
+            if clock.year == year:
+                transitions['start' if new_offset > offset else 'end'] = clock
+            offset = new_offset
+    return transitions
+
+
+@pytest.mark.parametrize('zone, zone_name', [('NZ', 'Pacific/Auckland'), ('Chatham', 'Pacific/Chatham')])
+@pytest.mark.parametrize('year', range(1974, 2038))
+def test_dst_transitions_match_tz_database(zone, zone_name, year):
+    expected = tz_transitions(zone_name, year)
+    assert report.dst_transitions(year, zone) == report.DstTransitions(expected.get('start'), expected.get('end'))
+
+
+def test_build_dst_table_range():
+    report.build_dst_table(2000, 2010)
+    assert sorted({year for _, year in report.DST_TABLE}) == list(range(2000, 2011))
+    assert {zone for zone, _ in report.DST_TABLE} == set(report.DST_ZONES)
+    with pytest.raises(ValueError, match="outside the daylight saving table"):
+        report.dst_transitions(2011)
+
+
+@pytest.mark.parametrize('first, last', [(2010, 2000), (0, 2000), (2000, 9999)])
+def test_build_dst_table_invalid_range(first, last):
+    with pytest.raises(ValueError):
+        report.build_dst_table(first, last)
+
+
+def test_dst_transitions_unknown_zone():
+    with pytest.raises(ValueError, match="Unknown daylight saving zone"):
+        report.dst_transitions(2024, 'Hawaii')
+
+
+def station_table(rows):
+    """A TideTable of (date, [times]) rows, with made-up heights."""
+    data = []
+    for date, times in rows:
+        row = [str(date.day), report.WEEKDAY_CODES[date.weekday()], str(date.month), str(date.year)]
+        for time_text in times:
+            row += [time_text, '1.0']
+        data.append(row)
+    return report.parse_tide_table(['001', 'Test', "41°17'S", "174°47'E"], data)
+
+
+def event_flags(flags, row, count):
+    return list(flags.events[row * report.MAX_EVENTS:row * report.MAX_EVENTS + count])
+
+
+def test_classify_whole_days():
+    table = station_table([
+        (datetime(2024, 1, 15), ['01:00', '07:00', '13:00', '19:00']),  # summer: daylight time
+        (datetime(2024, 6, 15), ['01:00', '07:00', '13:00', '19:00']),  # winter: standard time
+        (datetime(2024, 12, 15), ['01:00', '07:00', '13:00']),  # daylight time again
+    ])
+    flags = report.classify_daylight_time(table)
+    assert list(flags.rows) == [report.ROW_DAYLIGHT, report.ROW_STANDARD, report.ROW_DAYLIGHT]
+    assert event_flags(flags, 0, 4) == [report.DAYLIGHT_TIME] * 4
+    assert event_flags(flags, 1, 4) == [report.STANDARD_TIME] * 4
+    assert event_flags(flags, 2, 3) == [report.DAYLIGHT_TIME] * 3
+
+
+def test_classify_day_daylight_time_ends():
+    # 7 April 2024: clocks go back from 03:00 to 02:00, the first event is before the repeated hour
+    table = station_table([(datetime(2024, 4, 7), ['01:30', '07:40', '13:50', '20:00'])])
+    flags = report.classify_daylight_time(table)
+    assert list(flags.rows) == [report.ROW_DST_ENDS]
+    assert event_flags(flags, 0, 4) == [report.DAYLIGHT_TIME] + [report.STANDARD_TIME] * 3
+
+
+@pytest.mark.parametrize('first_time', ['01:59', '02:08', '02:59'])
+def test_classify_repeated_hour_is_ambiguous(first_time):
+    # A first event in the repeated hour could be either the daylight or the standard 02:xx
+    table = station_table([(datetime(2024, 4, 7), [first_time, '08:20', '14:30', '20:40'])])
+    flags = report.classify_daylight_time(table)
+    assert list(flags.rows) == [report.ROW_DST_ENDS]
+    assert event_flags(flags, 0, 4) == [report.AMBIGUOUS_TIME] + [report.STANDARD_TIME] * 3
+
+
+def test_classify_after_repeated_hour_is_standard():
+    table = station_table([(datetime(2024, 4, 7), ['03:00', '09:10', '15:20', '21:30'])])
+    flags = report.classify_daylight_time(table)
+    assert event_flags(flags, 0, 4) == [report.STANDARD_TIME] * 4
+
+
+def test_classify_day_daylight_time_starts():
+    # 29 September 2024: clocks go forward from 02:00 to 03:00
+    table = station_table([(datetime(2024, 9, 29), ['01:50', '08:00', '14:10', '20:20'])])
+    flags = report.classify_daylight_time(table)
+    assert list(flags.rows) == [report.ROW_DST_STARTS]
+    assert event_flags(flags, 0, 4) == [report.STANDARD_TIME] + [report.DAYLIGHT_TIME] * 3
+
+
+def test_classify_chatham_changeover_days():
+    table = station_table([
+        (datetime(2024, 4, 7), ['02:50', '09:00', '15:10', '21:20']),  # in the repeated hour 02:45-03:45
+        (datetime(2024, 9, 29), ['02:40', '08:50', '15:00', '21:10']),  # before the 02:45 change
+    ])
+    flags = report.classify_daylight_time(table, 'Chatham')
+    assert list(flags.rows) == [report.ROW_DST_ENDS, report.ROW_DST_STARTS]
+    assert event_flags(flags, 0, 4) == [report.AMBIGUOUS_TIME] + [report.STANDARD_TIME] * 3
+    assert event_flags(flags, 1, 4) == [report.STANDARD_TIME] + [report.DAYLIGHT_TIME] * 3
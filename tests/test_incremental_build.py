@@ -0,0 +1,62 @@
+"""Tests of the build manifest records of incremental rebuilds."""
+import os
+
+import sea_level_report4 as report
+
+
+def make_options(output_folder, logo_path):
+    return report.StationOptions(output_folder, logo_path, None, report.DEFAULT_DST_POLICY, 'template',
+                                 report.DEFAULT_PROFILES, 'docx', 'native', None, report.STATION_ENCODING)
+
+
+def make_source(folder):
+    path = os.path.join(folder, '072.csv')
+    with open(path, 'w') as csv_file:
+        csv_file.write('072,Test\n')
+    return report.StationSource('072', path, None)
+
+
+def built_manifest(source, options, records):
+    output = os.path.join(options.output_folder, '072.docx')
+    open(output, 'wb').close()
+    return {source.name: dict(records[source], outputs=[os.path.basename(output)])}
+
+
+def test_unchanged_station_is_skipped(tmp_path):
+    logo = tmp_path / 'logo.png'
+    logo.write_bytes(b'logo')
+    source, options = make_source(str(tmp_path)), make_options(str(tmp_path), str(logo))
+    _, _, records = report.plan_incremental_build([source], options, {})
+    manifest = built_manifest(source, options, records)
+    assert report.plan_incremental_build([source], options, manifest)[:2] == ([], [source])
+
+    logo.write_bytes(b'new logo')
+    assert report.plan_incremental_build([source], options, manifest)[:2] == ([source], [])
+
+
+def test_logo_fallback_path_is_hashed(tmp_path, monkeypatch):
+    # A path with macrons stands for the N: drive logo, which is the file that must be hashed
+    fallback = tmp_path / 'fallback.png'
+    fallback.write_bytes(b'logo')
+    monkeypatch.setattr(report, 'resolve_logo_path', lambda path: str(fallback))
+    source, options = make_source(str(tmp_path)), make_options(str(tmp_path), 'C:\\Māori\\logo.png')
+    _, _, records = report.plan_incremental_build([source], options, {})
+    assert records[source]['logo'] == report.file_sha256(str(fallback))
+
+
+def test_missing_logo_counts_as_changed(tmp_path):
+    logo = tmp_path / 'logo.png'
+    logo.write_bytes(b'logo')
+    source, options = make_source(str(tmp_path)), make_options(str(tmp_path), str(logo))
+    _, _, records = report.plan_incremental_build([source], options, {})
+    manifest = built_manifest(source, options, records)
+
+    logo.unlink()
+    stale, skipped, records = report.plan_incremental_build([source], options, manifest)
+    assert (stale, skipped, records) == ([source], [], {source: None})
+
+
+def test_resolve_logo_path():
+    assert report.resolve_logo_path('C:\\Reports\\logo.png') == 'C:\\Reports\\logo.png'
+    assert report.resolve_logo_path('').startswith('N:\\')
+    assert report.resolve_logo_path('C:\\Māori\\logo.png').startswith('N:\\')
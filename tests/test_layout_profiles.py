@@ -0,0 +1,30 @@
+"""Tests of the station layout profiles from config.yaml."""
+import pytest
+
+import sea_level_report4 as report
+
+
+def test_quoted_station_id():
+    profiles = report.compile_layout_profiles({'station_profiles': {'072': 'stream'}})
+    assert profiles.stations['072'].name == 'stream'
+    assert profiles.stations["Te Aumiti / French Pass"].name == 'stream'
+    assert profiles.default.name == 'tide'
+
+
+def test_unquoted_station_id_is_rejected():
+    yaml = pytest.importorskip('yaml')
+    config = yaml.safe_load("station_profiles:\n  072: 'stream'\n")
+    assert config['station_profiles'] == {58: 'stream'}  # read as octal
+    with pytest.raises(ValueError, match="must be quoted"):
+        report.compile_layout_profiles(config)
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError, match="Unknown layout profile 'metric'"):
+        report.compile_layout_profiles({'station_profiles': {'072': 'metric'}})
+
+
+def test_new_profile_starts_from_tide():
+    profiles = report.compile_layout_profiles({'layout_profiles': {'imperial': {'unit': 'ft'}},
+                                               'station_profiles': {'072': 'imperial'}})
+    assert profiles.stations['072'] == report.LAYOUT_PROFILES['tide']._replace(name='imperial', unit='ft')
@@ -0,0 +1,110 @@
+"""Tests of the LibreOffice conversion pool, against a stub soffice on PATH."""
+import os
+import sys
+
+import pytest
+
+import sea_level_report4 as report
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="the stub soffice is a script with a #! line")
+
+# Stands in for LibreOffice: '--accept' runs a resident office that accepts connections until killed,
+# '--convert-to' writes the PDF, fails ('fail'), fails the first time ('fail-once') or hangs ('hang'),
+# as STUB_SOFFICE_MODE says
+STUB_SOFFICE = '''#!{python}
+import os, socket, sys, time
+args = sys.argv[1:]
+with open(os.environ['STUB_SOFFICE_LOG'], 'a') as log:
+    log.write(('convert' if '--convert-to' in args else 'start') + '\\n')
+accept = [arg for arg in args if arg.startswith('--accept=')]
+if accept:
+    port = int(accept[0].split('port=')[1].split(';')[0])
+    server = socket.create_server(('127.0.0.1', port))
+    while True:
+        server.accept()[0].close()
+mode = os.environ['STUB_SOFFICE_MODE']
+if mode == 'hang':
+    time.sleep(60)
+if mode == 'fail':
+    sys.exit(1)
+if mode == 'fail-once' and not os.path.exists(os.environ['STUB_SOFFICE_LOG'] + '.failed'):
+    open(os.environ['STUB_SOFFICE_LOG'] + '.failed', 'w').close()
+    sys.exit(1)
+document = args[-1]
+out_dir = args[args.index('--outdir') + 1]
+with open(os.path.join(out_dir, os.path.splitext(os.path.basename(document))[0] + '.pdf'), 'wb') as pdf:
+    pdf.write(b'%PDF-1.4 stub')
+'''
+
+
+@pytest.fixture
+def stub_soffice(tmp_path, monkeypatch):
+    """Put a stub soffice first on PATH; returns a function that sets its mode and reads its call log."""
+    bin_folder = tmp_path / 'bin'
+    bin_folder.mkdir()
+    soffice = bin_folder / 'soffice'
+    soffice.write_text(STUB_SOFFICE.format(python=sys.executable))
+    soffice.chmod(0o755)
+    log_path = tmp_path / 'soffice.log'
+    log_path.write_text('')
+    monkeypatch.setenv('PATH', str(bin_folder) + os.pathsep + os.environ.get('PATH', ''))
+    monkeypatch.setenv('STUB_SOFFICE_LOG', str(log_path))
+    monkeypatch.setenv('STUB_SOFFICE_MODE', 'ok')
+
+    def calls(mode=None):
+        if mode:
+            monkeypatch.setenv('STUB_SOFFICE_MODE', mode)
+        return log_path.read_text().split()
+    return calls
+
+
+def convert(tmp_path, pool, name):
+    docx_path = tmp_path / f'{name}.docx'
+    docx_path.write_bytes(b'docx')
+    pdf_path = tmp_path / 'out' / f'{name}.pdf'
+    pdf_path.parent.mkdir(exist_ok=True)
+    pool.submit(str(docx_path), str(pdf_path)).result()
+    return pdf_path
+
+
+def test_documents_share_the_resident_office(tmp_path, stub_soffice):
+    with report.LibreOfficePool(1, profile_folder=str(tmp_path / 'profiles')) as pool:
+        first = convert(tmp_path, pool, '028')
+        second = convert(tmp_path, pool, '072')
+    assert first.read_bytes() == second.read_bytes() == b'%PDF-1.4 stub'
+    assert stub_soffice() == ['start', 'convert', 'convert']
+    assert not (tmp_path / '028.pdf').exists()  # moved to the requested PDF path
+
+
+def test_failed_conversion_is_retried_once_on_a_restarted_office(tmp_path, stub_soffice):
+    stub_soffice('fail-once')
+    with report.LibreOfficePool(1, profile_folder=str(tmp_path / 'profiles')) as pool:
+        pdf_path = convert(tmp_path, pool, '028')
+    assert pdf_path.exists()
+    assert stub_soffice() == ['start', 'convert', 'start', 'convert']
+
+
+def test_failing_conversion_gives_up_after_the_retry(tmp_path, stub_soffice):
+    stub_soffice('fail')
+    with report.LibreOfficePool(1, profile_folder=str(tmp_path / 'profiles')) as pool:
+        with pytest.raises(ValueError, match="did not write"):
+            convert(tmp_path, pool, '028')
+    assert stub_soffice() == ['start', 'convert', 'start', 'convert']
+
+
+def test_timeout_restarts_the_office_without_a_retry(tmp_path, stub_soffice):
+    stub_soffice('hang')
+    with report.LibreOfficePool(1, profile_folder=str(tmp_path / 'profiles'), timeout=1) as pool:
+        with pytest.raises(ValueError, match="timed out after 1 s"):
+            convert(tmp_path, pool, '028')
+        assert stub_soffice() == ['start', 'convert', 'start']
+        stub_soffice('ok')
+        assert convert(tmp_path, pool, '072').exists()  # on the restarted office
+    assert stub_soffice() == ['start', 'convert', 'start', 'convert']
+
+
+def test_missing_soffice(monkeypatch):
+    monkeypatch.setenv('PATH', '')
+    monkeypatch.setattr(report, 'LIBREOFFICE_EXECUTABLES', ('soffice',))
+    with pytest.raises(ValueError, match="executable not found"):
+        report.LibreOfficePool(1)
@@ -0,0 +1,68 @@
+"""Tests of grouping the rows of a station file into month pages."""
+from datetime import date, timedelta
+
+import pytest
+
+import sea_level_report4 as report
+
+
+def station_table(dates):
+    rows = [[str(day.day), report.WEEKDAY_CODES[day.weekday()], str(day.month), str(day.year), '02:43', '0.4']
+            for day in dates]
+    return report.parse_tide_table(['028', 'Dunedin', "45°53'S", "170°30'E"], rows)
+
+
+def days(first, last):
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def test_several_years():
+    # A SLIM year from July to June, as for the southern tide tables
+    table = station_table(days(date(2022, 7, 1), date(2023, 6, 30)))
+    pages = list(report.iter_month_pages(table))
+    assert [(page.year, page.month) for page in pages] == (
+        [(2022, month) for month in range(7, 13)] + [(2023, month) for month in range(1, 7)])
+    assert all(len(page.slots) == 31 for page in pages)
+    assert pages[6].slots[0] == 184  # 1 January 2023 is the 185th row
+    assert [row for page in pages for row in page.slots if row is not None] == list(range(len(table)))
+
+
+def test_short_months_leave_empty_slots():
+    table = station_table(days(date(2024, 2, 1), date(2024, 4, 30)))
+    february, march, april = report.iter_month_pages(table)
+    assert february.slots == list(range(29)) + [None, None]  # 2024 is a leap year
+    assert march.slots == list(range(29, 60))
+    assert april.slots == list(range(60, 90)) + [None]
+
+
+def test_partial_month():
+    table = station_table(days(date(2024, 9, 20), date(2024, 9, 22)))
+    (page,) = report.iter_month_pages(table)
+    assert page.slots[19:22] == [0, 1, 2]
+    assert page.slots.count(None) == 28
+
+
+def test_days_out_of_order_within_a_month():
+    table = station_table([date(2024, 1, 3), date(2024, 1, 1), date(2024, 1, 2)])
+    (page,) = report.iter_month_pages(table)
+    assert page.slots[:3] == [1, 2, 0]
+
+
+def test_duplicate_day():
+    table = station_table([date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 2)])
+    with pytest.raises(ValueError, match="Duplicate row for 2 January 2024"):
+        list(report.iter_month_pages(table))
+
+
+def test_month_rows_not_contiguous():
+    table = station_table([date(2024, 1, 30), date(2024, 2, 1), date(2024, 1, 31)])
+    pages = report.iter_month_pages(table)
+    # Pages are yielded lazily: the first two months are fine when the problem is found
+    assert [(page.year, page.month) for page in (next(pages), next(pages))] == [(2024, 1), (2024, 2)]
+    with pytest.raises(ValueError, match="Rows for January 2024 are not contiguous"):
+        next(pages)
+
+
+def test_same_month_of_another_year_is_a_new_page():
+    table = station_table([date(2023, 1, 1), date(2024, 1, 1)])
+    assert [(page.year, page.month) for page in report.iter_month_pages(table)] == [(2023, 1), (2024, 1)]
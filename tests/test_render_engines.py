@@ -0,0 +1,53 @@
+"""Tests that the template engine writes the same Word document as the classic engine."""
+import zipfile
+from datetime import date, timedelta
+
+import pytest
+
+import sea_level_report4 as report
+
+pytest.importorskip('docx')
+
+# Tide and stream heights of the test station, by day of the month
+HEIGHTS = ['0.4', '1.8', '0.5', '1.7']
+DIRECTIONS = ['SW', 'NE', 'SW', 'NE']
+
+
+def station_table(name, values):
+    """A station from 30 March to 8 April 2024, across the end of daylight time on 7 April."""
+    rows = []
+    for offset in range(10):
+        day = date(2024, 3, 30) + timedelta(days=offset)
+        # 7 April starts in the repeated hour; 8 April has only three events
+        times = ['02:08', '08:25', '15:07', '20:46'] if day.day == 7 else ['01:43', '07:25', '14:07', '19:46']
+        events = 3 if day.day == 8 else 4
+        row = [str(day.day), report.WEEKDAY_CODES[day.weekday()], str(day.month), str(day.year)]
+        for time_text, value in list(zip(times, values))[:events]:
+            row += [time_text, value]
+        rows.append(row)
+    return report.parse_tide_table(['072', name, "41°17'S", "174°47'E"], rows)
+
+
+def word_parts(path):
+    with zipfile.ZipFile(path) as document:
+        return {name: document.read(name) for name in document.namelist() if name.startswith('word/')}
+
+
+@pytest.mark.parametrize('name, values', [
+    ('Wellington', HEIGHTS),
+    ('Te Aumiti / French Pass', DIRECTIONS),  # stream layout
+    ('Waitangi - Chatham Island', HEIGHTS),  # Chatham layout and zone
+])
+@pytest.mark.parametrize('policy', ['auto', 'daylight', 'standard'])
+def test_template_engine_matches_classic_engine(tmp_path, write_logo, name, values, policy):
+    table = station_table(name, values)
+    profile = report.station_profile(report.DEFAULT_PROFILES, table.file_info)
+    logo = write_logo()
+    paths = []
+    for engine in (report.save_to_word, report.save_to_word_template):
+        paths.append(str(tmp_path / f'{engine.__name__}.docx'))
+        engine(table, report.iter_month_pages(table), paths[-1], logo, dst_policy=report.DstPolicy(policy, {}),
+               profile=profile)
+    classic, template = (word_parts(path) for path in paths)
+    assert template['word/document.xml'] == classic['word/document.xml']
+    assert template == classic
@@ -0,0 +1,38 @@
+"""Tests of the stage timings of a station build."""
+import time
+
+import pytest
+
+import sea_level_report4 as report
+
+# Seconds the first import of a deferred module is made to take
+SLOW_IMPORT = 1.0
+
+
+@pytest.mark.parametrize('output, pdf_backend, deferred', [('docx', 'native', 'docx'), ('pdf', 'native', 'pdf')])
+def test_cold_imports_are_counted_once(tmp_path, monkeypatch, write_station_file, write_logo,
+                                       output, pdf_backend, deferred):
+    pytest.importorskip('docx')
+    pytest.importorskip('reportlab')
+    import_module = report.importlib.import_module
+
+    def slow_import(name):
+        time.sleep(SLOW_IMPORT)
+        return import_module(name)
+
+    # A process that has not imported the document stacks yet
+    monkeypatch.setattr(report, 'IMPORT_TIMES', {'startup': report.IMPORT_TIMES['startup']})
+    monkeypatch.setattr(report.importlib, 'import_module', slow_import)
+    report.build_dst_table()
+    options = report.StationOptions(str(tmp_path), write_logo(), None, report.DEFAULT_DST_POLICY, 'template',
+                                    report.DEFAULT_PROFILES, output, pdf_backend, None, report.STATION_ENCODING)
+    source = report.StationSource('028', write_station_file(), None)
+
+    result = report.process_station(source, options)
+    assert result.error is None
+    stages = {timing.stage: timing for timing in result.stages}
+    assert deferred in report.IMPORT_TIMES
+    assert stages['import'].wall >= SLOW_IMPORT * len(report.DEFERRED_IMPORTS[deferred])
+    assert stages[deferred].wall < SLOW_IMPORT
+    assert stages['station'].wall < SLOW_IMPORT
+    assert result.elapsed < SLOW_IMPORT
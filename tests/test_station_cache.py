@@ -0,0 +1,99 @@
+"""Tests of the parsed-station cache."""
+import os
+
+import pytest
+
+import sea_level_report4 as report
+
+
+def columns(table):
+    return {name: list(getattr(table, name)) for name, _, _ in report.CACHE_COLUMNS}
+
+
+def same_table(first, second):
+    # NaN heights (directions and empty slots) never compare equal, so compare the text
+    return (first.file_info == second.file_info and first.labels == second.labels
+            and first.decimals == second.decimals and len(first) == len(second)
+            and all(first.value_text(row) == second.value_text(row) for row in range(len(first)))
+            and {name: values for name, values in columns(first).items() if name != 'values'}
+            == {name: values for name, values in columns(second).items() if name != 'values'})
+
+
+@pytest.fixture
+def table():
+    return report.parse_tide_table(['072', 'Te Aumiti / French Pass', "40°55'S", "173°50'E"], [
+        ['1', 'Mo', '1', '2024', '02:43', '1.25', '08:25', 'SW', '', '', '20:46', '-0.50'],
+        ['2', 'Tu', '1', '2024', '03:25', 'NE', '09:09', '2.00', '15:51', '0.10'],
+        ['3', 'We', '1', '2024', '04:09', '0.55', '09:55', '1.70', '16:38', '0.50', '22:22', '1.75', '23:59', '0.20'],
+    ])
+
+
+def test_round_trip(tmp_path, table):
+    path = str(tmp_path / 'entry.tide')
+    report.write_cached_table(path, table)
+    cached = report.read_cached_table(path)
+    assert same_table(cached, table)
+    assert cached.value_text(0) == ['1.25', 'SW', '', '-0.50']
+
+
+def test_entry_can_be_replaced_while_a_table_is_in_use(tmp_path, table):
+    # The table owns its columns, so the entry is not held open (Windows cannot replace an open mapping)
+    path = str(tmp_path / 'entry.tide')
+    report.write_cached_table(path, table)
+    cached = report.read_cached_table(path)
+    report.write_cached_table(path, table)
+    os.remove(path)
+    assert cached.time_text(2)[-1] == '23:59'
+
+
+def test_parser_version_mismatch(tmp_path, table, monkeypatch):
+    path = str(tmp_path / 'entry.tide')
+    report.write_cached_table(path, table)
+    monkeypatch.setattr(report, 'PARSER_VERSION', report.PARSER_VERSION + 1)
+    assert report.read_cached_table(path) is None
+
+
+@pytest.mark.parametrize('keep', [0, 5, 20, -1])
+def test_truncated_entry(tmp_path, table, keep):
+    path = tmp_path / 'entry.tide'
+    report.write_cached_table(str(path), table)
+    path.write_bytes(path.read_bytes()[:keep])
+    assert report.read_cached_table(str(path)) is None
+
+
+def test_damaged_or_missing_entry(tmp_path, table):
+    path = tmp_path / 'entry.tide'
+    report.write_cached_table(str(path), table)
+    path.write_bytes(b'X' + path.read_bytes()[1:])
+    assert report.read_cached_table(str(path)) is None
+    assert report.read_cached_table(str(tmp_path / 'missing.tide')) is None
+
+
+def test_cached_read(tmp_path, write_station_file):
+    source = report.StationSource('028', write_station_file(), None)
+    cache_folder = str(tmp_path / 'cache')
+    parsed = report.load_tide_table_cached(source, cache_folder)
+    assert len(os.listdir(os.path.join(cache_folder, 'tables'))) == 1
+    assert same_table(report.load_tide_table_cached(source, cache_folder), parsed)
+
+
+def test_changed_source_is_parsed_again(tmp_path, write_station_file):
+    path = write_station_file()
+    source = report.StationSource('028', path, None)
+    cache_folder = str(tmp_path / 'cache')
+    key = report.source_cache_key(source, cache_folder)
+    report.load_tide_table_cached(source, cache_folder)
+
+    # Touched but unchanged: the content is hashed again and gives the same entry
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert report.source_cache_key(source, cache_folder) == key
+
+    # Rewritten with the same size: the new modification time makes the key change
+    write_station_file(rows=[['1', 'Mo', '1', '2024', '02:43', '0.9', '08:25', '1.8', '15:07', '0.5', '20:46', '1.7'],
+                             ['2', 'Tu', '1', '2024', '03:25', '0.5', '09:09', '1.8', '15:51', '0.5', '21:33', '1.7'],
+                             ['3', 'We', '1', '2024', '04:09', '0.5', '09:55', '1.7', '16:38', '0.5', '22:22', '1.7']])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+    assert os.stat(path).st_size == stat.st_size
+    assert report.source_cache_key(source, cache_folder) != key
+    assert report.load_tide_table_cached(source, cache_folder).value_text(0)[0] == '0.9'
@@ -0,0 +1,68 @@
+"""Tests of finding the station files of a run: loose CSV files and members of zip archives."""
+import os
+import zipfile
+
+import sea_level_report4 as report
+
+
+def make_archive(path, members):
+    with zipfile.ZipFile(path, 'w') as archive:
+        for member, data in members.items():
+            archive.writestr(member, data)
+    return str(path)
+
+
+def test_loose_files_any_case(tmp_path):
+    for name in ('b.csv', 'A.CSV', 'c.Csv', 'notes.txt', 'logo.png'):
+        (tmp_path / name).write_text('')
+    sources = report.find_station_sources(str(tmp_path))
+    assert sources == [report.StationSource('A', str(tmp_path / 'A.CSV'), None),
+                       report.StationSource('b', str(tmp_path / 'b.csv'), None),
+                       report.StationSource('c', str(tmp_path / 'c.Csv'), None)]
+
+
+def test_zip_members(tmp_path):
+    archive = make_archive(tmp_path / 'STATIONS.ZIP', {
+        '2024/Dunedin.csv': '', 'Bluff.CSV': '', 'readme.txt': '', '2024/': '',
+        '__MACOSX/2024/._Dunedin.csv': '',  # resource forks added by the macOS archiver
+    })
+    sources = report.find_station_sources(str(tmp_path))
+    assert sources == [report.StationSource('Dunedin', archive, '2024/Dunedin.csv'),
+                       report.StationSource('Bluff', archive, 'Bluff.CSV')]
+    assert [report.describe_source(source) for source in sources] == ['STATIONS.ZIP:2024/Dunedin.csv',
+                                                                       'STATIONS.ZIP:Bluff.CSV']
+
+
+def test_single_file_or_archive(tmp_path):
+    path = tmp_path / '028.csv'
+    path.write_text('')
+    archive = make_archive(tmp_path / 'a.zip', {'072.csv': ''})
+    assert report.find_station_sources(str(path)) == [report.StationSource('028', str(path), None)]
+    assert report.find_station_sources(archive) == [report.StationSource('072', archive, '072.csv')]
+
+
+def test_duplicate_names_get_a_suffix(tmp_path):
+    (tmp_path / 'Dunedin.csv').write_text('')
+    first = make_archive(tmp_path / 'a.zip', {'Dunedin.csv': '', 'x/dunedin.csv': ''})
+    second = make_archive(tmp_path / 'b.zip', {'DUNEDIN.CSV': ''})
+    sources = report.find_station_sources(str(tmp_path))
+    assert [(source.name, source.path) for source in sources] == [
+        ('Dunedin', str(tmp_path / 'Dunedin.csv')),
+        ('Dunedin_2', first),
+        ('dunedin_3', first),
+        ('DUNEDIN_4', second),
+    ]
+
+
+def test_bad_archive_is_reported_and_skipped(tmp_path, capsys):
+    (tmp_path / 'broken.zip').write_bytes(b'not a zip')
+    (tmp_path / '028.csv').write_text('')
+    assert [source.name for source in report.find_station_sources(str(tmp_path))] == ['028']
+    assert "Unable to read zip archive" in capsys.readouterr().out
+
+
+def test_watch_snapshot_any_case(tmp_path):
+    for name in ('a.csv', 'B.CSV', 'c.Zip', 'notes.txt'):
+        (tmp_path / name).write_text('')
+    snapshot = report.folder_snapshot(str(tmp_path))
+    assert sorted(os.path.basename(path) for path in snapshot) == ['B.CSV', 'a.csv', 'c.Zip']
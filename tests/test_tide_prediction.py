@@ -0,0 +1,119 @@
+"""Tests of the harmonic tide prediction."""
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+
+import sea_level_report4 as report
+
+np = pytest.importorskip('numpy')
+tide_prediction = pytest.importorskip('tide_prediction')
+
+# Half the period of M2 (28.9841042 degrees per hour): 6 h 12.6 min between high and low water
+M2_HALF_PERIOD = 180 / 28.9841042
+
+
+def m2_set(phase_lag, zone='NZ'):
+    """A station with M2 alone, 1 m amplitude around a mean level of 1.5 m."""
+    return tide_prediction.ConstituentSet('999', 'Test', "41°17'S", "174°47'E", zone, 1.5, '01-Jul-2012',
+                                          {'M2': (1.0, float(phase_lag))})
+
+
+@pytest.fixture(autouse=True)
+def dst_table():
+    report.build_dst_table()
+
+
+def test_m2_extrema():
+    epoch = datetime(2024, 3, 1)
+    terms = tide_prediction.harmonics(m2_set(45), epoch, epoch)
+    extrema = tide_prediction.find_extrema(terms, 0, 24 * 5)
+    f, _ = tide_prediction.nodal_factors('M2', tide_prediction.astronomical_arguments(epoch)[1])
+
+    assert len(extrema.hours) in (19, 20)
+    assert np.allclose(np.diff(extrema.hours), M2_HALF_PERIOD, atol=1e-4)
+    assert list(extrema.high[1:]) == [not high for high in extrema.high[:-1]]
+    assert np.allclose(extrema.heights, np.where(extrema.high, f, -f), atol=1e-9)
+    assert 0.95 < f < 1.05
+
+
+def test_m2_rows_alternate_high_and_low_water():
+    rows = tide_prediction.predict_rows(m2_set(45), 2024)
+    assert len(rows) == 366
+    heights = [value for row in rows for value in row[5::2] if value]
+    assert set(heights) == {'0.5', '2.5'}
+    assert all(first != second for first, second in zip(heights, heights[1:]))
+    assert all(len(row) in (12, 14) for row in rows)
+
+
+def local_events(rows, month, day):
+    (row,) = [row for row in rows if (row[0], row[2]) == (str(day), str(month))]
+    return [time_text for time_text in row[4::2] if time_text]
+
+
+@pytest.mark.parametrize('phase_lag, month, day, standard, local, flags', [
+    # Daylight time ends: 01:33 standard is still daylight time, 02:33, in the repeated hour
+    (100, 4, 7, ['01:33', '07:46', '13:58', '20:11'], ['02:33', '07:46', '13:58', '20:11'],
+     [report.AMBIGUOUS_TIME, report.STANDARD_TIME, report.STANDARD_TIME, report.STANDARD_TIME]),
+    # Daylight time starts at 02:00 standard time: 02:08 standard is 03:08 daylight time
+    (170, 9, 29, ['02:08', '08:20', '14:33', '20:46'], ['03:08', '09:20', '15:33', '21:46'],
+     [report.DAYLIGHT_TIME] * 4),
+    # Before the change, in standard time
+    (160, 9, 29, ['01:47', '08:00', '14:12', '20:25'], ['01:47', '09:00', '15:12', '21:25'],
+     [report.STANDARD_TIME] + [report.DAYLIGHT_TIME] * 3),
+])
+def test_changeover_days(monkeypatch, phase_lag, month, day, standard, local, flags):
+    constituent_set = m2_set(phase_lag)
+    rows = tide_prediction.predict_rows(constituent_set, 2024)
+    assert local_events(rows, month, day) == local
+
+    table = tide_prediction.predict_tide_table(constituent_set, 2024)
+    daylight = report.classify_daylight_time(table)
+    (row,) = [row for row in range(len(table)) if (table.month[row], table.day[row]) == (month, day)]
+    assert list(daylight.events[row * report.MAX_EVENTS:row * report.MAX_EVENTS + len(local)]) == flags
+
+    monkeypatch.setattr(tide_prediction, 'dst_transitions', lambda year, zone: report.DstTransitions(None, None))
+    assert local_events(tide_prediction.predict_rows(constituent_set, 2024), month, day) == standard
+
+
+@pytest.mark.parametrize('zone', ['NZ', 'Chatham'])
+def test_daylight_shift_matches_the_classification(monkeypatch, zone):
+    # Every event of the year, taken back to standard time as classify_daylight_time tags it,
+    # is an event of the same prediction without daylight saving
+    constituent_set = m2_set(100, zone)
+    table = tide_prediction.predict_tide_table(constituent_set, 2024)
+    daylight = report.classify_daylight_time(table, zone)
+    monkeypatch.setattr(tide_prediction, 'dst_transitions', lambda year, zone: report.DstTransitions(None, None))
+    standard_table = tide_prediction.predict_tide_table(constituent_set, 2024)
+
+    def year_minutes(table, row, minute):
+        return (datetime(2024, table.month[row], table.day[row]) - datetime(2024, 1, 1)).days * 1440 + minute
+
+    expected = {year_minutes(standard_table, row, minute) for row in range(len(standard_table))
+                for minute in standard_table.event_minutes(row) if minute != report.MISSING_TIME}
+    found = set()
+    for row in range(len(table)):
+        for slot, minute in enumerate(table.event_minutes(row)):
+            if minute == report.MISSING_TIME:
+                continue
+            local = year_minutes(table, row, minute)
+            flag = daylight.events[row * report.MAX_EVENTS + slot]
+            if flag == report.AMBIGUOUS_TIME:
+                assert (local - 60 in expected) != (local in expected)
+                found.add(local - 60 if local - 60 in expected else local)
+            else:
+                found.add(local - 60 if flag == report.DAYLIGHT_TIME else local)
+    # Leave out the first and last hour of the year, which daylight time moves events into or out of
+    year_end = 366 * 1440
+    assert ({minute for minute in found if 60 <= minute < year_end - 60}
+            == {minute for minute in expected if 60 <= minute < year_end - 60})
+    assert len(found) > 1400
+
+
+def test_numpy_is_imported_on_first_use():
+    code = "import sys, tide_prediction; print('numpy' in sys.modules, 'yaml' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(report.__file__)))
+    assert result.stdout.split() == ['False', 'False']
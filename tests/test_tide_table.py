@@ -0,0 +1,128 @@
+"""Tests of reading station files into a TideTable."""
+import zipfile
+
+import pytest
+
+import sea_level_report4 as report
+
+
+def test_station_file_is_cp1252_by_default(write_station_file):
+    # The degree sign of the coordinates is one byte in cp1252, invalid as UTF-8
+    table = report.load_tide_table(write_station_file())
+    assert table.file_info[2:] == ["45°53'S", "170°30'E"]
+    assert len(table) == 3
+
+
+def test_zip_member_is_decoded_like_a_loose_file(tmp_path, write_station_file):
+    path = write_station_file()
+    archive_path = str(tmp_path / 'stations.zip')
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.write(path, 'Dunedin/028.csv')
+    table = report.load_tide_table(report.StationSource('028', archive_path, 'Dunedin/028.csv'))
+    assert table.file_info[2] == "45°53'S"
+
+
+def test_configured_encoding(write_station_file):
+    path = write_station_file(encoding='utf-8')
+    assert report.load_tide_table(path, 'utf-8').file_info[2] == "45°53'S"
+    with pytest.raises(ValueError, match="codec can't decode"):
+        report.load_tide_table(path, 'ascii')
+
+
+def test_cache_key_covers_the_encoding(tmp_path, write_station_file):
+    source = report.StationSource('028', write_station_file(), None)
+    cache_folder = str(tmp_path / 'cache')
+    assert (report.source_cache_key(source, cache_folder, 'cp1252')
+            != report.source_cache_key(source, cache_folder, 'latin-1'))
+
+
+def parse(*rows):
+    return report.parse_tide_table(['028', 'Dunedin', "45°53'S", "170°30'E"], [list(row) for row in rows])
+
+
+@pytest.mark.parametrize('row, events', [
+    (['1', 'Mo', '1', '2024', '02:43', '0.4', '08:25', '1.8', '15:07', '0.5'], 3),
+    (['1', 'Mo', '1', '2024', '02:43', '0.4', '08:25', '1.8', '15:07', '0.5', '20:46', '1.7'], 4),
+    (['1', 'Mo', '1', '2024', '02:43', '0.4', '08:25', '1.8', '15:07', '0.5', '20:46', '1.7', '23:59', '0.6'], 5),
+])
+def test_row_widths(row, events):
+    table = parse(row)
+    assert table.width[0] == events
+    assert table.time_text(0) == row[4::2]
+    assert table.value_text(0) == row[5::2]
+    assert table.event_minutes(0)[0] == 2 * 60 + 43
+    assert list(table.times[events:report.MAX_EVENTS]) == [report.MISSING_TIME] * (report.MAX_EVENTS - events)
+    assert list(table.missing[:report.MAX_EVENTS]) == [0] * events + [1] * (report.MAX_EVENTS - events)
+
+
+def test_date_columns():
+    table = parse(['29', 'Th', '2', '2024', '02:43', '0.4', '08:25', '1.8', '15:07', '0.5'])
+    assert (table.day[0], table.month[0], table.year[0]) == (29, 2, 2024)
+    assert report.WEEKDAY_CODES[table.weekday[0]] == 'Th'
+
+
+def test_missing_events():
+    # A day with three tides has an empty fourth slot on a 12 column row
+    table = parse(['1', 'Mo', '1', '2024', '02:43', '0.4', '', '', '15:07', '0.5', '20:46', '1.7'])
+    assert table.event_minutes(0) == [163, report.MISSING_TIME, 907, 1246]
+    assert list(table.missing[:4]) == [0, 1, 0, 0]
+    assert table.time_text(0) == ['02:43', '', '15:07', '20:46']
+    assert table.value_text(0) == ['0.4', '', '0.5', '1.7']
+
+
+def test_labels_and_decimals():
+    # Stream stations give directions instead of heights; heights keep the decimals of the file
+    table = parse(['1', 'Mo', '1', '2024', '02:43', '1.25', '08:25', 'SW', '15:07', '-0.50', '20:46', 'NE'],
+                  ['2', 'Tu', '1', '2024', '03:25', 'SW', '09:09', '2.00', '15:51', '1.5', '21:33', '0.10'])
+    assert table.decimals == 2
+    assert table.labels == ['SW', 'NE', '1.5']  # '1.5' does not print back with 2 decimals
+    assert table.value_text(0) == ['1.25', 'SW', '-0.50', 'NE']
+    assert table.value_text(1) == ['SW', '2.00', '1.5', '0.10']
+    assert list(table.codes[:4]) == [-1, 0, -1, 1]
+
+
+def test_blank_rows_are_skipped():
+    table = parse([], ['1', 'Mo', '1', '2024', '02:43', '0.4', '08:25', '1.8', '15:07', '0.5'], [])
+    assert len(table) == 1
+
+
+@pytest.mark.parametrize('row, message', [
+    (['1', 'Mo', '1'], "at least 4 columns"),
+    (['1', 'Mo', '1', '2024'] + ['02:43', '0.4'] * 6, "more than 5 tide events"),
+    (['x', 'Mo', '1', '2024', '02:43', '0.4'], "invalid date columns"),
+    (['1', 'Xx', '1', '2024', '02:43', '0.4'], "invalid date columns"),
+    (['1', 'Mo', '13', '2024', '02:43', '0.4'], "Invalid month value: 13"),
+    (['30', 'Fr', '2', '2024', '02:43', '0.4'], "invalid day value: 30"),
+    (['1', 'Mo', '1', '2024', '24:00', '0.4'], "Invalid time value: 24:00"),
+    (['1', 'Mo', '1', '2024', '2.43', '0.4'], "Invalid time value: 2.43"),
+])
+def test_malformed_rows_are_rejected(row, message):
+    with pytest.raises(ValueError, match=message):
+        parse(row)
+
+
+def test_no_data_rows():
+    with pytest.raises(ValueError, match="no data rows"):
+        parse()
+
+
+def test_load_skips_the_header_lines(write_station_file):
+    table = report.load_tide_table(write_station_file())
+    assert table.file_info == ['028', 'Dunedin', "45°53'S", "170°30'E"]
+    assert [table.day[row] for row in range(len(table))] == [1, 2, 3]
+    assert table.time_text(0) == ['02:43', '08:25', '15:07', '20:46']
+
+
+def test_load_rejects_a_malformed_row(write_station_file):
+    path = write_station_file(rows=[['1', 'Mo', '1', '2024', '02:43', '0.4'], ['2', 'Tu', '13', '2024', '03:25', '0.5']])
+    with pytest.raises(ValueError, match="An error occurred while reading the CSV file: Invalid month value: 13"):
+        report.load_tide_table(path)
+
+
+def test_load_empty_and_missing_files(tmp_path):
+    empty = tmp_path / 'empty.csv'
+    empty.write_bytes(b'')
+    with pytest.raises(ValueError, match="empty or missing file information"):
+        report.load_tide_table(str(empty))
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        report.load_tide_table(str(tmp_path / 'missing.csv'))
@@ -0,0 +1,54 @@
+"""Tests of watch mode."""
+import zipfile
+
+import pytest
+
+import sea_level_report4 as report
+
+
+def document_images(path):
+    with zipfile.ZipFile(path) as document:
+        return [document.read(name) for name in document.namelist() if name.startswith('word/media/')]
+
+
+def test_swapped_logo_rebuilds_built_stations(tmp_path, monkeypatch, write_station_file, write_logo):
+    pytest.importorskip('docx')
+    folder, output = tmp_path / 'csv', tmp_path / 'out'
+    folder.mkdir()
+    output.mkdir()
+    write_station_file(folder=str(folder))
+    logo = write_logo()
+    with open(logo, 'rb') as logo_file:
+        old_logo = logo_file.read()
+    options = report.StationOptions(str(output), logo, None, report.DEFAULT_DST_POLICY, 'template',
+                                    report.DEFAULT_PROFILES, 'docx', 'native', None, report.STATION_ENCODING)
+    report.build_dst_table()
+
+    images = []
+
+    def next_cycle(watcher, timeout):
+        # Called each time the watcher has nothing left to build
+        images.append(document_images(str(output / '028.docx')))
+        if len(images) == 1:
+            write_logo(8, (255, 0, 0))
+        else:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(report, 'wait_for_change', next_cycle)
+    report.watch_folder(str(folder), options, interval=0, settle=0)
+
+    with open(logo, 'rb') as logo_file:
+        new_logo = logo_file.read()
+    assert images == [[old_logo], [new_logo]] and old_logo != new_logo
+    assert report.load_manifest(str(output))['028']['logo'] == report.logo_sha256(logo)
+
+
+def test_manifest_inputs_changed(tmp_path, write_logo):
+    logo = write_logo()
+    options = report.StationOptions(str(tmp_path), logo, None, report.DEFAULT_DST_POLICY, 'template',
+                                    report.DEFAULT_PROFILES, 'docx', 'native', None, report.STATION_ENCODING)
+    manifest = {'028': {'logo': report.logo_sha256(logo), 'settings': report.settings_sha256(options)}}
+    assert not report.manifest_inputs_changed(manifest, options)
+    assert report.manifest_inputs_changed(manifest, options._replace(render_engine='classic'))
+    write_logo(8, (255, 0, 0))
+    assert report.manifest_inputs_changed(manifest, options)
@@ -0,0 +1,350 @@
+"""Harmonic tide prediction: the high and low waters of a station from its constituent set."""
+import argparse
+import csv
+import math
+import os
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from sea_level_report4 import (MAX_EVENTS, STATION_ENCODING, WEEKDAY_CODES, dst_transitions, import_deferred,
+                               parse_tide_table)
+
+# One tidal constituent: Doodson numbers (multiples of tau, s, h, p, N' and p1), phase offset
+# in degrees, and its nodal correction as (NODAL_CORRECTIONS group, power) pairs
+Constituent = namedtuple('Constituent', ['doodson', 'offset', 'nodal'])
+
+# Constituents a constituent set may use, by name
+CONSTITUENTS = {
+    'SA': Constituent((0, 0, 1, 0, 0, 0), 0, ()),
+    'SSA': Constituent((0, 0, 2, 0, 0, 0), 0, ()),
+    'MM': Constituent((0, 1, 0, -1, 0, 0), 0, (('MM', 1),)),
+    'MF': Constituent((0, 2, 0, 0, 0, 0), 0, (('MF', 1),)),
+    'Q1': Constituent((1, -2, 0, 1, 0, 0), -90, (('O1', 1),)),
+    'O1': Constituent((1, -1, 0, 0, 0, 0), -90, (('O1', 1),)),
+    'P1': Constituent((1, 1, -2, 0, 0, 0), -90, ()),
+    'S1': Constituent((1, 1, -1, 0, 0, 0), 0, ()),
+    'K1': Constituent((1, 1, 0, 0, 0, 0), 90, (('K1', 1),)),
+    'J1': Constituent((1, 2, 0, -1, 0, 0), 90, (('J1', 1),)),
+    'OO1': Constituent((1, 3, 0, 0, 0, 0), 90, (('OO1', 1),)),
+    '2N2': Constituent((2, -2, 0, 2, 0, 0), 0, (('M2', 1),)),
+    'MU2': Constituent((2, -2, 2, 0, 0, 0), 0, (('M2', 1),)),
+    'N2': Constituent((2, -1, 0, 1, 0, 0), 0, (('M2', 1),)),
+    'NU2': Constituent((2, -1, 2, -1, 0, 0), 0, (('M2', 1),)),
+    'M2': Constituent((2, 0, 0, 0, 0, 0), 0, (('M2', 1),)),
+    'L2': Constituent((2, 1, 0, -1, 0, 0), 180, (('M2', 1),)),
+    'T2': Constituent((2, 2, -3, 0, 0, 1), 0, ()),
+    'S2': Constituent((2, 2, -2, 0, 0, 0), 0, ()),
+    'K2': Constituent((2, 2, 0, 0, 0, 0), 0, (('K2', 1),)),
+    'MN4': Constituent((4, -1, 0, 1, 0, 0), 0, (('M2', 2),)),
+    'M4': Constituent((4, 0, 0, 0, 0, 0), 0, (('M2', 2),)),
+    'MS4': Constituent((4, 2, -2, 0, 0, 0), 0, (('M2', 1),)),
+    'M6': Constituent((6, 0, 0, 0, 0, 0), 0, (('M2', 3),)),
+}
+
+# Nodal corrections (Schureman): f = c0 + c1 cos N + c2 cos 2N + c3 cos 3N and
+# u = s1 sin N + s2 sin 2N + s3 sin 3N (degrees), N the longitude of the moon's node
+NODAL_CORRECTIONS = {
+    'MM': ((1.0, -0.130, 0.0, 0.0), (0.0, 0.0, 0.0)),
+    'MF': ((1.043, 0.414, 0.0, 0.0), (-23.7, 2.7, -0.4)),
+    'O1': ((1.0089, 0.1871, -0.0147, 0.0014), (10.80, -1.34, 0.19)),
+    'K1': ((1.0060, 0.1150, -0.0088, 0.0006), (-8.86, 0.68, -0.07)),
+    'J1': ((1.0129, 0.1676, -0.0170, 0.0016), (-12.94, 1.34, -0.19)),
+    'OO1': ((1.1027, 0.6504, 0.0317, -0.0014), (-36.68, 4.02, -0.57)),
+    'M2': ((1.0004, -0.0373, 0.0002, 0.0), (-2.14, 0.0, 0.0)),
+    'K2': ((1.0241, 0.2863, 0.0083, -0.0015), (-17.74, 0.68, -0.04)),
+}
+
+# Rates of the astronomical arguments tau, s, h, p, N' and p1, in degrees per mean solar hour
+ARGUMENT_RATES = (14.4920521, 0.5490165, 0.0410686, 0.0046418, 0.0022064, 0.0000020)
+
+# Offset of local standard time from UTC, in minutes, by daylight saving zone
+ZONE_UTC_OFFSETS = {
+    'NZ': 12 * 60,
+    'Chatham': 12 * 60 + 45,
+}
+
+# Spacing of the grid the turning points are bracketed on (minutes), and the bisection
+# steps that refine each one (10 minutes / 2**16 is under a hundredth of a second)
+EXTREMA_STEP = 10
+EXTREMA_ITERATIONS = 16
+
+# A station's constituent set: the station file header fields, daylight saving zone, mean
+# level above chart datum (Z0, metres), the reference date of the set (as written in the
+# station file) and amplitude (metres) and Greenwich phase lag (degrees, UTC) by constituent
+ConstituentSet = namedtuple('ConstituentSet', ['station_id', 'name', 'latitude', 'longitude', 'zone', 'mean_level',
+                                               'reference_date', 'constituents'])
+
+# Turning points of the tide curve: hours after the prediction epoch, heights and True for high water
+Extrema = namedtuple('Extrema', ['hours', 'heights', 'high'])
+
+
+def load_constituent_set(path):
+    """
+    Read a constituent set from a YAML file.
+
+    The file has the station_id, name, latitude and longitude of the station
+    file header, zone ('NZ' or 'Chatham', default 'NZ'), mean_level (Z0),
+    reference_date (default '01-Jul-2012') and constituents, a mapping of
+    constituent name to [amplitude, phase].
+
+    Args:
+        path (str): The YAML file.
+
+    Returns:
+        ConstituentSet: The station and its constituents.
+
+    Raises:
+        ValueError: If the file cannot be read or a setting is missing or invalid.
+    """
+    import_deferred('config')
+    import yaml
+
+    try:
+        with open(path, 'r', encoding='utf-8') as set_file:
+            settings = yaml.safe_load(set_file)
+        constituents = {}
+        for name, (amplitude, phase) in settings['constituents'].items():
+            if name.upper() not in CONSTITUENTS:
+                raise ValueError(f"unknown constituent '{name}', use: {', '.join(CONSTITUENTS)}")
+            constituents[name.upper()] = (float(amplitude), float(phase))
+        zone = settings.get('zone', 'NZ')
+        if zone not in ZONE_UTC_OFFSETS:
+            raise ValueError(f"unknown zone '{zone}', use: {', '.join(ZONE_UTC_OFFSETS)}")
+        return ConstituentSet(str(settings['station_id']), settings['name'], settings['latitude'],
+                              settings['longitude'], zone, float(settings['mean_level']),
+                              str(settings.get('reference_date', '01-Jul-2012')), constituents)
+    except (OSError, KeyError, TypeError, ValueError, yaml.YAMLError) as e:
+        raise ValueError(f"An error occurred while reading the constituent set '{path}': {e}")
+
+
+def astronomical_arguments(when):
+    """
+    Return the astronomical arguments at a time.
+
+    Args:
+        when (datetime): UTC time.
+
+    Returns:
+        tuple: tau, s, h, p, N' and p1 in degrees (an array), and N in degrees.
+    """
+    import_deferred('prediction')
+    import numpy as np
+
+    centuries = (when - datetime(2000, 1, 1, 12)).total_seconds() / (36525 * 86400)
+    hours = when.hour + when.minute / 60 + when.second / 3600
+    s = 218.3164477 + 481267.88123421 * centuries  # mean longitude of the moon
+    h = 280.46646 + 36000.76983 * centuries  # mean longitude of the sun
+    p = 83.3532465 + 4069.0137287 * centuries  # longitude of the lunar perigee
+    node = 125.04452 - 1934.136261 * centuries  # longitude of the moon's ascending node
+    p1 = 282.94 + 1.7192 * centuries  # longitude of the solar perigee
+    tau = 15 * hours + 180 + h - s  # mean lunar time
+    return np.array([tau, s, h, p, -node, p1]), node
+
+
+def nodal_factors(name, node):
+    """Return the nodal amplitude factor f and phase correction u (degrees) of a constituent."""
+    f, u = 1.0, 0.0
+    node = math.radians(node)
+    for group, power in CONSTITUENTS[name].nodal:
+        (c0, c1, c2, c3), (s1, s2, s3) = NODAL_CORRECTIONS[group]
+        f *= (c0 + c1 * math.cos(node) + c2 * math.cos(2 * node) + c3 * math.cos(3 * node)) ** power
+        u += power * (s1 * math.sin(node) + s2 * math.sin(2 * node) + s3 * math.sin(3 * node))
+    return f, u
+
+
+def harmonics(constituent_set, epoch, nodal_time):
+    """
+    Prepare the terms of the tide curve.
+
+    Args:
+        constituent_set (ConstituentSet): The station constituents.
+        epoch (datetime): UTC time of hour 0 of the curve.
+        nodal_time (datetime): UTC time the nodal corrections are taken at (the middle of the span).
+
+    Returns:
+        tuple: Amplitudes (metres, nodal factor applied), speeds (radians per hour) and
+        phases at the epoch (radians), as arrays with one entry per constituent.
+    """
+    import_deferred('prediction')
+    import numpy as np
+
+    arguments, _ = astronomical_arguments(epoch)
+    _, node = astronomical_arguments(nodal_time)
+    amplitudes, speeds, phases = [], [], []
+    for name, (amplitude, phase_lag) in constituent_set.constituents.items():
+        constituent = CONSTITUENTS[name]
+        doodson = np.array(constituent.doodson)
+        f, u = nodal_factors(name, node)
+        amplitudes.append(f * amplitude)
+        speeds.append(math.radians(doodson @ np.array(ARGUMENT_RATES)))
+        phases.append(math.radians(doodson @ arguments + constituent.offset + u - phase_lag))
+    return np.array(amplitudes), np.array(speeds), np.array(phases)
+
+
+def tide_curve(terms, hours, derivative=0):
+    """
+    Evaluate the tide curve, or one of its derivatives, at many times in one pass.
+
+    Args:
+        terms (tuple): Amplitudes, speeds and phases, see harmonics.
+        hours (ndarray): Hours after the epoch.
+        derivative (int): 0 for the height above mean level, 1 for its rate of change (metres per hour), ...
+
+    Returns:
+        ndarray: One value per time.
+    """
+    import_deferred('prediction')
+    import numpy as np
+
+    amplitudes, speeds, phases = terms
+    angles = np.outer(hours, speeds) + (phases + derivative * math.pi / 2)
+    return np.cos(angles) @ (amplitudes * speeds ** derivative)
+
+
+def find_extrema(terms, start, end, step=EXTREMA_STEP):
+    """
+    Find the high and low waters of the tide curve between two times.
+
+    The rate of change is evaluated on a grid, every sign change brackets a
+    turning point, and all brackets are narrowed together by bisection.
+
+    Args:
+        terms (tuple): Amplitudes, speeds and phases, see harmonics.
+        start (float): First hour after the epoch.
+        end (float): Last hour after the epoch.
+        step (float): Grid spacing in minutes.
+
+    Returns:
+        Extrema: Times, heights above mean level and high/low flags, in time order.
+    """
+    import_deferred('prediction')
+    import numpy as np
+
+    grid = np.arange(start, end, step / 60)
+    rate = tide_curve(terms, grid, 1)
+    turns = np.nonzero((rate[:-1] > 0) != (rate[1:] > 0))[0]
+    low, high = grid[turns], grid[turns + 1]
+    rising = rate[turns] > 0  # rising before the turn: high water
+    for _ in range(EXTREMA_ITERATIONS):
+        middle = (low + high) / 2
+        before = (tide_curve(terms, middle, 1) > 0) == rising
+        low = np.where(before, middle, low)
+        high = np.where(before, high, middle)
+    hours = (low + high) / 2
+    return Extrema(hours, tide_curve(terms, hours), rising)
+
+
+def predict_rows(constituent_set, year, decimals=1):
+    """
+    Predict the high and low waters of a station for one calendar year.
+
+    Times are local standard time, or daylight time while it applies, rounded to
+    the minute; rows have the SLIM layout parse_tide_table reads:
+    date, weekday, month, year and time/height pairs, with rows of fewer than
+    four events padded to 12 columns.
+
+    Args:
+        constituent_set (ConstituentSet): The station constituents.
+        year (int): The year.
+        decimals (int): Decimal places of the heights.
+
+    Returns:
+        list: Rows as lists of strings, one per day.
+
+    Raises:
+        ValueError: If a day has more than MAX_EVENTS high and low waters.
+    """
+    import_deferred('prediction')
+    import numpy as np
+
+    # Predict from the day before to the day after the local standard year, so
+    # turning points moved across midnight by daylight time are not lost
+    offset = ZONE_UTC_OFFSETS[constituent_set.zone]
+    year_start = datetime(year, 1, 1)
+    epoch = year_start - timedelta(days=1, minutes=offset)
+    days = (datetime(year + 1, 1, 1) - year_start).days
+    terms = harmonics(constituent_set, epoch, epoch + timedelta(days=1 + days / 2))
+    extrema = find_extrema(terms, 0, 24 * (days + 2))
+
+    # Minutes after the start of the year, local standard time, then daylight time where it applies
+    standard = extrema.hours * 60 - 24 * 60
+    start, end = dst_transitions(year, constituent_set.zone)
+    daylight = np.zeros(len(standard), dtype=bool)
+    if end is not None:
+        daylight |= standard < (end - timedelta(hours=1) - year_start).total_seconds() / 60
+    if start is not None:
+        daylight |= standard >= (start - year_start).total_seconds() / 60
+    local = np.rint(standard + 60 * daylight).astype(int)
+    heights = np.round(extrema.heights + constituent_set.mean_level, decimals) + 0.0  # no '-0.0'
+    in_year = (local >= 0) & (local < days * 24 * 60)
+
+    events = [[] for _ in range(days)]
+    for minute, height in zip(local[in_year], heights[in_year]):
+        day, minute = divmod(int(minute), 24 * 60)
+        events[day] += [f"{minute // 60:02d}:{minute % 60:02d}", f"{height:.{decimals}f}"]
+
+    rows = []
+    for day, row_events in enumerate(events):
+        when = date(year, 1, 1) + timedelta(days=day)
+        if len(row_events) > 2 * MAX_EVENTS:
+            raise ValueError(f"{when}: more than {MAX_EVENTS} high and low waters in one day.")
+        row = [str(when.day), WEEKDAY_CODES[when.weekday()], str(when.month), str(when.year)] + row_events
+        rows.append(row + [''] * (12 - len(row)))
+    return rows
+
+
+def station_file_info(constituent_set):
+    """Return the first line of the station file (station id, name and coordinates)."""
+    return [constituent_set.station_id, constituent_set.name, constituent_set.latitude, constituent_set.longitude]
+
+
+def predict_tide_table(constituent_set, year):
+    """Predict a year straight into a TideTable, as load_tide_table reads a station file."""
+    return parse_tide_table(station_file_info(constituent_set), predict_rows(constituent_set, year))
+
+
+def write_station_file(path, constituent_set, year, encoding=None):
+    """
+    Write a predicted year as a SLIM station file.
+
+    Args:
+        path (str): The CSV file to write.
+        constituent_set (ConstituentSet): The station constituents.
+        year (int): The year.
+        encoding (str): Text encoding, None for the encoding the report reads files with.
+    """
+    rows = predict_rows(constituent_set, year)
+    with open(path, 'w', newline='', encoding=encoding or STATION_ENCODING) as file:
+        # The SLIM header line is padded with spaces
+        file.write(','.join(station_file_info(constituent_set)).ljust(72) + '\r\n')
+        writer = csv.writer(file, lineterminator='\r\n')
+        writer.writerow(['Based on constituent set with reference date:', constituent_set.reference_date])
+        writer.writerow(['Local Std or Daylight Time', 'Tidal heights in metres.'])
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    """Write predicted station files from the command line."""
+    parser = argparse.ArgumentParser(description="Predict high and low waters from constituent sets, as SLIM station files.")
+    parser.add_argument('sets', nargs='+', help="constituent set files (YAML)")
+    parser.add_argument('--year', type=int, action='append', required=True,
+                        help="year to predict (repeat for several years)")
+    parser.add_argument('--output', default='.', metavar='FOLDER', help="output folder (default: the current folder)")
+    parser.add_argument('--encoding', default=None, help=f"text encoding (default: {STATION_ENCODING}, as SLIM)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output, exist_ok=True)
+    for set_path in args.sets:
+        try:
+            constituent_set = load_constituent_set(set_path)
+            for year in args.year:
+                name = constituent_set.name.split(' /')[0].split(' -')[0].replace(' ', '_')
+                path = os.path.join(args.output, f"{name}_{year}.csv")
+                write_station_file(path, constituent_set, year, args.encoding)
+                print(f"Wrote {path}")
+        except ValueError as e:
+            parser.exit(1, f"{e}\n")
+
+
+if __name__ == "__main__":
+    main()